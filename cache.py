@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from functools import lru_cache
+from typing import Any, Dict, Optional
+from urllib.parse import urlsplit
+
+# TTL in seconds per "host" or "host/path-prefix"; the longest matching rule wins.
+DEFAULT_CACHE_TTLS: Dict[str, float] = {
+    "ac.search.naver.com": 30 * 60,
+    "suggestqueries.google.com": 30 * 60,
+    "openapi.naver.com": 24 * 3600,
+    "www.googleapis.com/customsearch": 24 * 3600,
+    "api.searchad.naver.com/keywordstool": 7 * 24 * 3600,
+}
+
+DEFAULT_CACHE_PATH = ".bka_cache.sqlite"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    url TEXT NOT NULL,
+    body BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    expires REAL NOT NULL,
+    accessed REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed);
+"""
+
+
+def canonical_params(params: Optional[Dict[str, Any]]) -> str:
+    """Stable string form of query params (sorted keys, stringified values)."""
+    items = sorted((str(k), str(v)) for k, v in (params or {}).items() if v is not None)
+    return json.dumps(items, ensure_ascii=False, separators=(",", ":"))
+
+
+def request_key(url: str, params: Optional[Dict[str, Any]] = None) -> str:
+    raw = f"GET {url}?{canonical_params(params)}"
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    """Persistent SQLite cache for response bodies.
+
+    - Keyed by URL and canonicalized params (hashed, so API keys in params are not stored in clear)
+    - Per-endpoint TTLs from `ttls` (see `DEFAULT_CACHE_TTLS`), else `default_ttl`
+    - Bodies are zlib-compressed; once the store exceeds `max_bytes`, expired rows
+      go first, then least recently used ones
+    """
+
+    def __init__(
+        self,
+        path: str = DEFAULT_CACHE_PATH,
+        ttls: Optional[Dict[str, float]] = None,
+        default_ttl: float = 3600.0,
+        max_bytes: int = 256 * 1024 * 1024,
+    ) -> None:
+        self.path = path
+        self.ttls = dict(DEFAULT_CACHE_TTLS if ttls is None else ttls)
+        self.default_ttl = default_ttl
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.executescript(_SCHEMA)
+        self._size = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+
+    def ttl_for(self, url: str) -> float:
+        parts = urlsplit(url)
+        target = f"{(parts.hostname or '').lower()}{parts.path}"
+        best, ttl = -1, self.default_ttl
+        for rule, rule_ttl in self.ttls.items():
+            if target.startswith(rule) and len(rule) > best:
+                best, ttl = len(rule), rule_ttl
+        return ttl
+
+    def get(self, url: str, params: Optional[Dict[str, Any]] = None) -> Optional[str]:
+        key = request_key(url, params)
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute("SELECT body, expires FROM responses WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            if row[1] <= now:
+                self._delete(key)
+                return None
+            self._conn.execute("UPDATE responses SET accessed = ? WHERE key = ?", (now, key))
+            self._conn.commit()
+        return zlib.decompress(row[0]).decode("utf-8")
+
+    def set(self, url: str, params: Optional[Dict[str, Any]], body: str) -> None:
+        ttl = self.ttl_for(url)
+        if ttl <= 0:
+            return
+        key = request_key(url, params)
+        blob = zlib.compress(body.encode("utf-8"), 6)
+        now = time.time()
+        with self._lock:
+            old = self._conn.execute("SELECT size FROM responses WHERE key = ?", (key,)).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, url, body, size, expires, accessed) VALUES (?, ?, ?, ?, ?, ?)",
+                (key, url, blob, len(blob), now + ttl, now),
+            )
+            self._size += len(blob) - (old[0] if old else 0)
+            if self._size > self.max_bytes:
+                self._evict(now)
+            self._conn.commit()
+
+    def _delete(self, key: str) -> None:
+        row = self._conn.execute("SELECT size FROM responses WHERE key = ?", (key,)).fetchone()
+        if row:
+            self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            self._conn.commit()
+            self._size -= row[0]
+
+    def _evict(self, now: float) -> None:
+        # Drop expired entries, then LRU down to 90% of the budget to avoid evicting on every insert
+        self._conn.execute("DELETE FROM responses WHERE expires <= ?", (now,))
+        self._size = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        target = int(self.max_bytes * 0.9)
+        if self._size <= target:
+            return
+        freed = 0
+        victims = []
+        for key, size in self._conn.execute("SELECT key, size FROM responses ORDER BY accessed ASC"):
+            victims.append((key,))
+            freed += size
+            if self._size - freed <= target:
+                break
+        self._conn.executemany("DELETE FROM responses WHERE key = ?", victims)
+        self._size -= freed
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+            self._conn.commit()
+            self._size = 0
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+@lru_cache(maxsize=None)
+def _open_shared(path: str) -> ResponseCache:
+    return ResponseCache(path)
+
+
+def cache_from_env(var: str = "BKA_HTTP_CACHE") -> Optional[ResponseCache]:
+    """The cache named by `$BKA_HTTP_CACHE` (a file path), if set.
+
+    One instance per path is shared, so GUI runs and Streamlit reruns don't each open a connection.
+    """
+    path = os.getenv(var)
+    return _open_shared(path) if path else None
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import json
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+import requests
+
+from .cache import canonical_params
+
+# Query params that carry credentials; stored and matched as a placeholder.
+SECRET_PARAMS = {"key"}
+# Response headers worth keeping for replay (backoff and decoding depend on them).
+RECORDED_HEADERS = ("Content-Type", "Retry-After")
+
+
+class CassetteMiss(LookupError):
+    """Raised in replay mode for a request that was never recorded."""
+
+
+class CassetteResponse:
+    """Replayed response exposing the subset of `requests.Response` HttpClient uses."""
+
+    def __init__(self, status: int, text: str, headers: Dict[str, str]) -> None:
+        self.status_code = status
+        self.text = text
+        self.content = text.encode("utf-8")
+        self.headers = requests.structures.CaseInsensitiveDict(headers)
+        self.encoding: Optional[str] = "utf-8"
+
+    def raise_for_status(self) -> None:
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} (replayed)", response=self)  # type: ignore[arg-type]
+
+
+def _redact(params: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    return {k: ("***" if k in SECRET_PARAMS else v) for k, v in (params or {}).items()}
+
+
+def _key(url: str, params: Optional[Dict[str, Any]]) -> str:
+    return f"{url}?{canonical_params(_redact(params))}"
+
+
+class Cassette:
+    """Record HTTP exchanges to a JSONL file, or replay them without network.
+
+    - mode="record": every response (errors included) is appended as
+      `{"url", "params", "status", "headers", "body"}`; request headers and
+      secret params are never written
+    - mode="replay": responses are served by URL + canonical params, in recorded
+      order (so retry sequences replay faithfully), repeating the last one when
+      exhausted; `latency` seconds are slept per request to simulate the network
+    """
+
+    def __init__(self, path: str, mode: str = "replay", latency: float = 0.0) -> None:
+        if mode not in ("record", "replay"):
+            raise ValueError(f"unknown cassette mode: {mode!r}")
+        self.path = path
+        self.mode = mode
+        self.latency = latency
+        self._lock = threading.Lock()
+        self._entries: Dict[str, List[Dict[str, Any]]] = {}
+        self._served: Dict[str, int] = {}
+        if mode == "record":
+            open(path, "w", encoding="utf-8").close()
+        else:
+            with open(path, "r", encoding="utf-8") as f:
+                for line in f:
+                    line = line.strip()
+                    if line:
+                        entry = json.loads(line)
+                        self._entries.setdefault(_key(entry["url"], entry.get("params")), []).append(entry)
+
+    @property
+    def replaying(self) -> bool:
+        return self.mode == "replay"
+
+    def record(self, url: str, params: Optional[Dict[str, Any]], resp: Any) -> None:
+        entry = {
+            "url": url,
+            "params": _redact(params),
+            "status": resp.status_code,
+            "headers": {h: resp.headers[h] for h in RECORDED_HEADERS if h in resp.headers},
+            "body": resp.text,
+        }
+        line = json.dumps(entry, ensure_ascii=False)
+        with self._lock:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+
+    def play(self, url: str, params: Optional[Dict[str, Any]]) -> CassetteResponse:
+        key = _key(url, params)
+        with self._lock:
+            entries = self._entries.get(key)
+            if not entries:
+                raise CassetteMiss(f"no recorded response for {key}")
+            i = self._served.get(key, 0)
+            self._served[key] = i + 1
+            entry = entries[min(i, len(entries) - 1)]
+        if self.latency > 0:
+            time.sleep(self.latency)
+        return CassetteResponse(int(entry["status"]), entry["body"], entry.get("headers") or {})
@@ -2,66 +2,63 @@ from __future__ import annotations
 
 import argparse
 import csv
-from typing import Dict, Iterable, List, Optional, Tuple
+import gc
+import os
+from contextlib import contextmanager
+from itertools import chain
+from typing import Dict, Iterator, List, Optional, Tuple
 
-from .expansion import expand_with_suffixes, expand_with_profile
+from .expansion import iter_expand_with_profile, iter_expand_with_suffixes
 from .outline import build_outline
-from .providers import GoogleSuggestProvider, NaverSuggestProvider
-from .scoring import KeywordScore, score_keywords, score_keywords_with_metrics, score_keywords_by_platform
-from .text_utils import normalize_query, unique_ordered
+from .crawl import alphabet_soup, crawl
+from .providers import build_providers
+from .scheduler import CollectStats, collect_suggestions
+from .scoring import (
+    KeywordScore,
+    extract_features,
+    score_keywords,
+    score_keywords_with_metrics,
+    score_keywords_by_platform,
+)
+from .text_utils import normalize_many, unique_ordered
 from .enrichers import build_enrichers_from_env, enrich_keywords, EnrichedMetrics
+from .dedup import DEFAULT_SIMILARITY, enrich_collapsed
 from .env import load_env
+from .parallel import DEFAULT_WORKERS
+from .http import BASE_URL_ENV, DEFAULT_RATE_LIMITER, HttpClient, parse_rate_limits
+from .cache import DEFAULT_CACHE_PATH, ResponseCache, cache_from_env
+from .cassette import Cassette
+from .journal import DEFAULT_JOURNAL_PATH, Journal
 
 
 def _read_seeds(seed_args: List[str], seed_file: Optional[str]) -> List[str]:
-    seeds: List[str] = []
-    if seed_args:
-        seeds.extend(seed_args)
+    seeds: List[str] = normalize_many(seed_args or [])
     if seed_file:
         with open(seed_file, "r", encoding="utf-8") as f:
-            for line in f:
-                s = normalize_query(line)
-                if s:
-                    seeds.append(s)
-    return unique_ordered([s for s in seeds if s])
-
-
-def _collect_suggestions(
-    seeds: Iterable[str], provider_names: List[str], depth: int, hl: str
-) -> Tuple[List[str], Dict[str, int]]:
-    provider_names = [p.strip().lower() for p in provider_names]
-    providers = []
-    if "naver" in provider_names:
-        providers.append(NaverSuggestProvider())
-    if "google" in provider_names:
-        providers.append(GoogleSuggestProvider())
-
-    # Depth 1: providers over seeds
-    all_candidates: List[str] = []
-    hit_counts: Dict[str, int] = {}
-
-    def _accumulate(cands: Iterable[str]) -> None:
-        for kw in cands:
-            all_candidates.append(kw)
-            hit_counts[kw] = hit_counts.get(kw, 0) + 1
-
-    # round 1
-    for p in providers:
-        if isinstance(p, GoogleSuggestProvider):
-            _accumulate(p.bulk_suggest(seeds, hl=hl))
-        else:
-            _accumulate(p.bulk_suggest(seeds))
-
-    if depth >= 2:
-        # expand with suffixes and query again
-        suffix_expanded = expand_with_suffixes(seeds)
-        for p in providers:
-            if isinstance(p, GoogleSuggestProvider):
-                _accumulate(p.bulk_suggest(suffix_expanded, hl=hl))
-            else:
-                _accumulate(p.bulk_suggest(suffix_expanded))
+            seeds.extend(normalize_many(f))
+    return unique_ordered(seeds)
+
+
+@contextmanager
+def _gc_paused() -> Iterator[None]:
+    """Pause the cyclic GC while a CLI run builds millions of short-lived, acyclic objects.
+
+    Kept out of the library so GUI/Streamlit threads never lose GC; a caller that
+    already disabled it is left alone.
+    """
+    was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if was_enabled:
+            gc.enable()
+
 
-    return unique_ordered(all_candidates), hit_counts
+def _report_failures(failed: List[Tuple[str, str]]) -> None:
+    if failed:
+        sample = ", ".join(f"{name}:{q}" for name, q in failed[:3])
+        print(f"[!] 실패한 자동완성 요청 {len(failed)}건은 빈 결과로 처리했습니다 (예: {sample}). --checkpoint 실행이었다면 --resume으로 실패분만 다시 요청할 수 있습니다.")
 
 
 def cmd_analyze(args: argparse.Namespace) -> int:
@@ -70,28 +67,120 @@ def cmd_analyze(args: argparse.Namespace) -> int:
         print("[!] 시드 키워드를 1개 이상 입력하세요.")
         return 2
 
-    candidates, hit_counts = _collect_suggestions(
-        seeds=seeds, provider_names=args.providers.split(","), depth=args.depth, hl=args.hl
-    )
+    for host, (rate, burst) in parse_rate_limits(args.rate_limit).items():
+        DEFAULT_RATE_LIMITER.configure(host, rate, burst)
+    if args.base_url:
+        # Read by every provider/enricher constructor (see http.rebase_url)
+        os.environ[BASE_URL_ENV] = args.base_url
+
+    cassette: Optional[Cassette] = None
+    if args.replay:
+        cassette = Cassette(args.replay, mode="replay", latency=args.replay_latency)
+    elif args.record:
+        cassette = Cassette(args.record, mode="record")
+    cache = ResponseCache(args.cache, max_bytes=args.cache_max_mb * 1024 * 1024) if args.cache else cache_from_env()
+    if args.record and cache is not None:
+        # Cache hits never reach the network, so they would be missing from the cassette
+        print("[i] 녹화 중에는 응답 캐시를 사용하지 않습니다.")
+        cache = None
+    http = HttpClient(cache=cache, cassette=cassette, pool_maxsize=max(10, args.workers))
+
+    journal: Optional[Journal] = None
+    if args.checkpoint or args.resume:
+        journal = Journal(args.checkpoint or DEFAULT_JOURNAL_PATH, resume=args.resume)
+        if args.resume:
+            print(f"[i] 체크포인트에서 이어서 실행: 완료된 작업 {len(journal)}건 ({journal.path})")
+
+    if args.crawl:
+        result = crawl(
+            seeds,
+            args.providers.split(","),
+            max_depth=args.depth,
+            budget=args.budget,
+            fanout=args.fanout,
+            hl=args.hl,
+            http=http,
+            workers=args.workers,
+            saturation=args.saturation,
+            prioritized=args.prioritize,
+            journal=journal,
+        )
+        candidates, hit_counts = result.candidates, result.hit_counts
+        st = result.stats
+        print(
+            f"[i] 크롤 완료: 레벨 {st.levels}, 요청 {st.requests}/{args.budget}, "
+            f"레벨별 신규 {st.new_per_level}, 포화로 건너뛴 질의 {len(st.skipped)}개 (종료: {st.stop_reason})"
+        )
+        _report_failures(st.failed)
+    else:
+        collect_stats = CollectStats()
+        candidates, hit_counts = collect_suggestions(
+            seeds=seeds,
+            provider_names=args.providers.split(","),
+            depth=args.depth,
+            hl=args.hl,
+            http=http,
+            workers=args.workers,
+            saturation=args.saturation,
+            stats=collect_stats,
+            journal=journal,
+        )
+        if collect_stats.skipped:
+            print(f"[i] 포화된 접두어로 판단해 건너뛴 질의 {len(collect_stats.skipped)}개 (요청 {collect_stats.requests}회)")
+        _report_failures(collect_stats.failed)
+
+    if args.soup:
+        soup = alphabet_soup(
+            seeds,
+            build_providers(args.providers.split(","), http=http, hl=args.hl, journal=journal),
+            budget=args.soup_budget,
+            workers=args.workers,
+            known=candidates,
+        )
+        candidates = unique_ordered(candidates + soup.candidates)
+        for kw, n in soup.hit_counts.items():
+            hit_counts[kw] = hit_counts.get(kw, 0) + n
+        print(
+            f"[i] 자모/알파벳 프로브: 요청 {soup.stats.requests}/{args.soup_budget}, "
+            f"신규 {sum(soup.stats.new_per_level)}개, 가지치기 {soup.stats.pruned}개"
+        )
+        _report_failures(soup.stats.failed)
 
     if args.profile:
-        candidates = unique_ordered(candidates + expand_with_profile(seeds, args.profile))
+        candidates = unique_ordered(chain(candidates, iter_expand_with_profile(seeds, args.profile)))
     elif args.include_suffix:
-        candidates = unique_ordered(candidates + expand_with_suffixes(seeds))
+        candidates = unique_ordered(chain(candidates, iter_expand_with_suffixes(seeds)))
 
     if args.limit:
         candidates = candidates[: args.limit]
 
+    # Tokenized once; the combined and per-platform views below only re-weight these
+    with _gc_paused():
+        features = extract_features(candidates, hit_counts)
     scores: List[KeywordScore]
     metrics_map: Dict[str, EnrichedMetrics] | None = None
     if args.enrich:
-        enrichers = build_enrichers_from_env()
+        enrichers = build_enrichers_from_env(http=http)
         if not enrichers:
             print("[!] 활성화된 API 자격이 없습니다. ENV 설정을 확인하세요. (NAVER_* / GOOGLE_*)")
-        metrics_map = enrich_keywords(candidates, enrichers, limit=args.enrich_limit)
-        scores = score_keywords_with_metrics(candidates, hit_counts=hit_counts, metrics=metrics_map)
+        if args.collapse:
+            metrics_map, clusters = enrich_collapsed(
+                candidates,
+                enrichers,
+                limit=args.enrich_limit,
+                hit_counts=hit_counts,
+                threshold=args.collapse_threshold,
+                journal=journal,
+                workers=args.workers,
+            )
+            print(f"[i] 유사 키워드 묶음: {clusters.collapsed}개는 대표 키워드의 지표를 공유(API 호출 절약)")
+        else:
+            metrics_map = enrich_keywords(
+                candidates, enrichers, limit=args.enrich_limit, journal=journal, workers=args.workers
+            )
+        scores = score_keywords_with_metrics(candidates, hit_counts=hit_counts, metrics=metrics_map, features=features)
     else:
-        scores = score_keywords(candidates, hit_counts=hit_counts)
+        scores = score_keywords(candidates, hit_counts=hit_counts, features=features)
 
     platforms = [p.strip().lower() for p in (args.platforms or "").split(",") if p.strip()]
     if not platforms:
@@ -106,10 +195,12 @@ def cmd_analyze(args: argparse.Namespace) -> int:
         per_platform: Dict[str, List[KeywordScore]] = {}
         for pf in platforms:
             if args.enrich and metrics_map is not None:
-                per_platform[pf] = score_keywords_by_platform(candidates, hit_counts=hit_counts, metrics=metrics_map, platform=pf)
+                per_platform[pf] = score_keywords_by_platform(
+                    candidates, hit_counts=hit_counts, metrics=metrics_map, platform=pf, features=features
+                )
             else:
-                # Without metrics, use baseline then reuse as same for both
-                per_platform[pf] = score_keywords(candidates, hit_counts=hit_counts)
+                # Without metrics every platform gets the baseline, already computed above
+                per_platform[pf] = scores
 
         for pf in platforms:
             pf_scores = per_platform[pf]
@@ -140,6 +231,15 @@ def cmd_analyze(args: argparse.Namespace) -> int:
             _write_csv(args.output, scores, metrics_map)
             print(f"[i] CSV 저장 완료: {args.output}")
 
+    if journal is not None:
+        journal.close()
+    if args.http_stats:
+        print("[i] HTTP 통계:")
+        print(http.metrics.summary())
+    if args.http_stats_json:
+        http.metrics.write_json(args.http_stats_json)
+        print(f"[i] HTTP 통계 JSON 저장 완료: {args.http_stats_json}")
+
     return 0
 
 
@@ -191,16 +291,81 @@ def build_parser() -> argparse.ArgumentParser:
     a.add_argument("--seeds", nargs="*", default=[], help="시드 키워드 리스트")
     a.add_argument("--seed-file", default=None, help="줄 단위 시드 키워드 파일")
     a.add_argument("--providers", default="naver,google", help="사용할 provider (naver,google)")
-    a.add_argument("--depth", type=int, default=2, help="확장 깊이(1~2)")
+    a.add_argument("--depth", type=int, default=2, help="확장 깊이(1~2, --crawl 사용 시 크롤 레벨 수 N)")
+    a.add_argument("--crawl", action="store_true", help="제안어를 다시 질의하는 너비 우선 크롤(깊이 N)")
+    a.add_argument("--budget", type=int, default=1000, help="크롤 전체 요청 상한(provider별 요청 합계)")
+    a.add_argument("--fanout", type=int, default=200, help="크롤 레벨당 최대 질의 수")
+    a.add_argument(
+        "--prioritize",
+        action="store_true",
+        help="--crawl을 기회 점수·부모 질의 수확률 순(우선순위 큐)으로 진행해 예산을 유망한 가지에 먼저 사용",
+    )
+    a.add_argument(
+        "--saturation",
+        type=int,
+        default=8,
+        help="이미 이 개수 이상의 제안어가 이어지는 질의는 건너뜀(0이면 끔)",
+    )
+    a.add_argument("--soup", action="store_true", help="시드+ㄱ/가/a 형태의 자모·알파벳 프로브로 롱테일 추가(비생산 가지는 자동 가지치기)")
+    a.add_argument("--soup-budget", type=int, default=1000, help="자모/알파벳 프로브 요청 상한")
     a.add_argument("--include-suffix", action="store_true", help="롱테일 접미사 확장 포함")
     a.add_argument("--profile", choices=["travel", "food"], help="도메인 프로필 기반 확장(여행/맛집)")
     a.add_argument("--limit", type=int, default=500, help="최대 후보 수")
     a.add_argument("--top", type=int, default=50, help="터미널 상위 출력 개수")
     a.add_argument("--output", default=None, help="CSV 저장 경로")
+    a.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help="자동완성·API 조회 동시 요청 수(1이면 순차)")
     a.add_argument("--hl", default="ko", help="Google suggest 언어 코드")
     a.add_argument("--enrich", action="store_true", help="API 연동으로 볼륨/경쟁 보정(Naver Ads/OpenAPI, Google CSE)")
     a.add_argument("--enrich-limit", type=int, default=200, help="API 조회 상한(키워드 상위 N개)")
+    a.add_argument(
+        "--no-collapse",
+        dest="collapse",
+        action="store_false",
+        help="띄어쓰기/조사만 다른 유사 키워드를 묶지 않고 각각 보강(enrich)",
+    )
+    a.add_argument(
+        "--collapse-threshold",
+        type=float,
+        default=DEFAULT_SIMILARITY,
+        help="유사 키워드로 묶을 문자 2-gram 자카드 유사도 기준(1 초과면 띄어쓰기/조사 차이만 묶음)",
+    )
     a.add_argument("--platforms", default="naver,tistory", help="플랫폼 별 결과(nav er,tistory). 여러 개 쉼표로 구분. 결과 파일은 각각 .naver/.tistory로 저장")
+    a.add_argument(
+        "--rate-limit",
+        action="append",
+        default=[],
+        metavar="HOST=RATE[:BURST]",
+        help="호스트별 초당 요청 수/버스트 조정 (반복 지정 가능, 예: ac.search.naver.com=20:40). --base-url 사용 시에도 API 경로별로 적용",
+    )
+    a.add_argument(
+        "--cache",
+        nargs="?",
+        const=DEFAULT_CACHE_PATH,
+        default=None,
+        metavar="PATH",
+        help=f"응답 디스크 캐시 사용(SQLite, 기본 {DEFAULT_CACHE_PATH}). 환경변수 BKA_HTTP_CACHE로도 지정 가능",
+    )
+    a.add_argument("--cache-max-mb", type=int, default=256, help="캐시 최대 용량(MB), 초과 시 오래된 항목부터 삭제")
+    rec = a.add_mutually_exclusive_group()
+    rec.add_argument("--record", default=None, metavar="CASSETTE", help="모든 HTTP 응답을 JSONL 카세트로 녹화")
+    rec.add_argument("--replay", default=None, metavar="CASSETTE", help="녹화된 카세트로 네트워크 없이 재생")
+    a.add_argument("--replay-latency", type=float, default=0.0, help="재생 시 요청당 지연(초)")
+    a.add_argument(
+        "--checkpoint",
+        nargs="?",
+        const=DEFAULT_JOURNAL_PATH,
+        default=None,
+        metavar="PATH",
+        help=f"완료된 제안어 질의·보강 결과를 체크포인트 파일에 즉시 기록(기본 {DEFAULT_JOURNAL_PATH})",
+    )
+    a.add_argument("--resume", action="store_true", help="체크포인트에 기록된 작업은 건너뛰고 이어서 실행")
+    a.add_argument(
+        "--base-url",
+        default=None,
+        help=f"모든 제안어/보강 API 요청을 보낼 서버(예: 로컬 스탠드인 http://127.0.0.1:8765, ENV {BASE_URL_ENV})",
+    )
+    a.add_argument("--http-stats", action="store_true", help="엔드포인트별 요청 수/지연/재시도/상태코드 요약 출력")
+    a.add_argument("--http-stats-json", default=None, metavar="PATH", help="HTTP 통계를 JSON으로 저장")
     a.set_defaults(func=cmd_analyze)
 
     o = sub.add_parser("outline", help="키워드 아웃라인 생성")
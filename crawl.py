@@ -0,0 +1,271 @@
+from __future__ import annotations
+
+import heapq
+from dataclasses import dataclass, field
+from typing import Iterable, List, Optional, Sequence, Set, Tuple
+
+from .http import HttpClient
+from .journal import Journal
+from .parallel import DEFAULT_WORKERS
+from .providers import SuggestProvider, build_providers
+from .expansion import soup_children, soup_probe, soup_tokens
+from .scheduler import Failures, fan_out, query_all
+from .scoring import estimate_competition_score, estimate_demand_score
+from .table import HitCounts, KeywordTable
+from .trie import PrefixTrie
+from .text_utils import normalize_many, unique_ordered
+
+
+@dataclass
+class CrawlStats:
+    requests: int = 0
+    levels: int = 0
+    queries_per_level: List[int] = field(default_factory=list)
+    new_per_level: List[int] = field(default_factory=list)
+    pruned: int = 0
+    skipped: List[str] = field(default_factory=list)  # saturated queries never sent
+    failed: Failures = field(default_factory=list)  # (provider, query) pairs that raised; answered as empty
+    stop_reason: str = ""
+
+
+@dataclass
+class CrawlResult:
+    candidates: List[str]
+    hit_counts: HitCounts
+    stats: CrawlStats
+
+
+def crawl_suggestions(
+    seeds: Iterable[str],
+    providers: Sequence[SuggestProvider],
+    max_depth: int = 3,
+    budget: int = 1000,
+    fanout: int = 200,
+    workers: int = DEFAULT_WORKERS,
+    saturation: int = 0,
+) -> CrawlResult:
+    """Breadth-first autocomplete crawl: suggestions become the next level's queries.
+
+    - `max_depth`: number of query levels (1 = seeds only)
+    - `budget`: hard cap on requests across all levels (one query costs one request per provider)
+    - `fanout`: at most this many queries per level, taken in discovery order
+    - `saturation`: if > 0, a query whose prefix already has that many known
+      completions in the suggestion trie is skipped (see `stats.skipped`)
+    Queries are never repeated (visited set) and the crawl stops early once a
+    level surfaces no new keywords.
+    """
+    stats = CrawlStats()
+    table = KeywordTable()
+    visited: Set[str] = set()
+    trie = PrefixTrie()
+    frontier = unique_ordered(normalize_many(seeds))
+    per_query = max(1, len(providers))
+
+    for _ in range(max(0, max_depth)):
+        affordable = (budget - stats.requests) // per_query
+        if affordable <= 0:
+            stats.stop_reason = "budget"
+            break
+        pending = [q for q in frontier if q not in visited]
+        if saturation > 0:
+            fresh: List[str] = []
+            skipped: List[str] = []
+            for q in pending:
+                (skipped if trie.is_saturated(q, saturation) else fresh).append(q)
+            stats.skipped.extend(skipped)
+            visited.update(skipped)
+            pending = fresh
+        level = pending[: min(fanout, affordable)]
+        if not level:
+            stats.stop_reason = "exhausted"
+            break
+        visited.update(level)
+        stats.requests += len(level) * per_query
+        stats.levels += 1
+        stats.queries_per_level.append(len(level))
+
+        discovered: List[str] = []
+        for cands in fan_out(providers, [level], workers=workers, failed=stats.failed)[0]:
+            for kw in cands:
+                if kw not in table:
+                    discovered.append(kw)
+                    trie.add(kw)
+                table.add(kw)
+        stats.new_per_level.append(len(discovered))
+        if not discovered:
+            stats.stop_reason = "no new keywords"
+            break
+        frontier = discovered
+    else:
+        stats.stop_reason = "max depth"
+
+    return CrawlResult(candidates=table.keywords, hit_counts=table.hit_counts, stats=stats)
+
+
+PARENT_WEIGHT = 1.0  # how much a productive parent lifts its children's priority
+
+
+def query_priority(q: str, provider_hits: int, parent_yield: float) -> float:
+    """Frontier priority: the query's own heuristic opportunity plus its parent's yield.
+
+    `parent_yield` is the share of the parent's suggestions that were new (0..1);
+    seeds use 1.0.
+    """
+    opp = max(estimate_demand_score(q, provider_hits=provider_hits) * 1.4 - estimate_competition_score(q), 0.0)
+    return opp + PARENT_WEIGHT * parent_yield
+
+
+def crawl_prioritized(
+    seeds: Iterable[str],
+    providers: Sequence[SuggestProvider],
+    max_depth: int = 3,
+    budget: int = 1000,
+    batch: int = DEFAULT_WORKERS,
+    workers: int = DEFAULT_WORKERS,
+    saturation: int = 0,
+) -> CrawlResult:
+    """Best-first autocomplete crawl: always spend the next requests on the most promising query.
+
+    Pending queries sit in a max-heap keyed by `query_priority`. Each round pops
+    up to `batch` of them (so requests still go out in parallel), sends them and
+    pushes their new suggestions with the round's observed yield. Ties keep
+    discovery order. `max_depth`, `budget` and `saturation` mean the same as in
+    `crawl_suggestions`; `stats.levels` counts rounds.
+    """
+    stats = CrawlStats()
+    table = KeywordTable()
+    queued: Set[str] = set()
+    trie = PrefixTrie()
+    per_query = max(1, len(providers))
+    heap: List[Tuple[float, int, str, int]] = []
+
+    def push(q: str, depth: int, parent_yield: float) -> None:
+        queued.add(q)
+        prio = query_priority(q, table.hit_counts.get(q, 1), parent_yield)
+        heapq.heappush(heap, (-prio, len(queued), q, depth))
+
+    for seed in unique_ordered(normalize_many(seeds)):
+        push(seed, 1, 1.0)
+
+    while True:
+        affordable = (budget - stats.requests) // per_query
+        if affordable <= 0:
+            stats.stop_reason = "budget"
+            break
+        picked: List[Tuple[str, int]] = []
+        while heap and len(picked) < min(max(1, batch), affordable):
+            _, _, q, depth = heapq.heappop(heap)
+            if saturation > 0 and trie.is_saturated(q, saturation):
+                stats.skipped.append(q)
+                continue
+            picked.append((q, depth))
+        if not picked:
+            stats.stop_reason = "exhausted"
+            break
+        queries = [q for q, _ in picked]
+        stats.requests += len(queries) * per_query
+        stats.levels += 1
+        stats.queries_per_level.append(len(queries))
+
+        new_total = 0
+        for (q, depth), per_provider in zip(picked, query_all(providers, queries, workers=workers, failed=stats.failed)):
+            returned: List[str] = []
+            discovered: List[str] = []
+            for cands in per_provider:
+                for kw in cands:
+                    if kw not in table:
+                        discovered.append(kw)
+                        trie.add(kw)
+                    returned.append(kw)
+                    table.add(kw)
+            new_total += len(discovered)
+            if depth >= max_depth:
+                continue
+            parent_yield = len(discovered) / len(returned) if returned else 0.0
+            for kw in discovered:
+                if kw not in queued:
+                    push(kw, depth + 1, parent_yield)
+        stats.new_per_level.append(new_total)
+
+    return CrawlResult(candidates=table.keywords, hit_counts=table.hit_counts, stats=stats)
+
+
+def crawl(
+    seeds: Iterable[str],
+    provider_names: Iterable[str],
+    max_depth: int = 3,
+    budget: int = 1000,
+    fanout: int = 200,
+    hl: str = "ko",
+    http: Optional[HttpClient] = None,
+    workers: int = DEFAULT_WORKERS,
+    saturation: int = 0,
+    prioritized: bool = False,
+    journal: Optional[Journal] = None,
+) -> CrawlResult:
+    """`crawl_suggestions` (or `crawl_prioritized`) over registered providers selected by name."""
+    providers = build_providers(provider_names, http=http, hl=hl, journal=journal)
+    if prioritized:
+        return crawl_prioritized(
+            seeds, providers, max_depth=max_depth, budget=budget, batch=workers, workers=workers, saturation=saturation
+        )
+    return crawl_suggestions(
+        seeds, providers, max_depth=max_depth, budget=budget, fanout=fanout, workers=workers, saturation=saturation
+    )
+
+
+def alphabet_soup(
+    seeds: Iterable[str],
+    providers: Sequence[SuggestProvider],
+    budget: int = 2000,
+    min_new: int = 1,
+    workers: int = DEFAULT_WORKERS,
+    known: Iterable[str] = (),
+) -> CrawlResult:
+    """Probe `seed + ㄱ..ㅎ / a..z`, drilling only into branches that keep paying off.
+
+    A probe whose answers contain fewer than `min_new` keywords not seen before
+    (including `known`, e.g. the regular collection's candidates) is pruned: its
+    children (`ㄱ -> 가, 강, ...`, `a -> aa..az`) are never sent. `budget` caps
+    requests across all levels; `stats.pruned` counts the probes skipped.
+    """
+    stats = CrawlStats()
+    table = KeywordTable()
+    seen: Set[str] = set(known)
+    per_query = max(1, len(providers))
+    seeds = unique_ordered(normalize_many(seeds))
+    level: List[Tuple[str, str]] = [(seed, tok) for seed in seeds for tok in soup_tokens()]
+
+    while level:
+        affordable = (budget - stats.requests) // per_query
+        if affordable <= 0:
+            stats.stop_reason = "budget"
+            break
+        level = level[:affordable]
+        queries = [soup_probe(seed, tok) for seed, tok in level]
+        stats.requests += len(queries) * per_query
+        stats.levels += 1
+        stats.queries_per_level.append(len(queries))
+
+        next_level: List[Tuple[str, str]] = []
+        new_total = 0
+        for (seed, tok), per_provider in zip(level, query_all(providers, queries, workers=workers, failed=stats.failed)):
+            fresh = 0
+            for cands in per_provider:
+                for kw in cands:
+                    if kw not in seen:
+                        seen.add(kw)
+                        fresh += 1
+                    table.add(kw)
+            new_total += fresh
+            children = soup_children(tok)
+            if fresh >= min_new:
+                next_level.extend((seed, child) for child in children)
+            else:
+                stats.pruned += len(children)
+        stats.new_per_level.append(new_total)
+        level = next_level
+    else:
+        stats.stop_reason = "exhausted"
+
+    return CrawlResult(candidates=table.keywords, hit_counts=table.hit_counts, stats=stats)
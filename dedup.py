@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field, replace
+import re
+from typing import Dict, FrozenSet, Iterable, List, Mapping, Optional, Tuple
+
+from .enrichers import EnrichedMetrics, enrich_keywords
+from .parallel import DEFAULT_WORKERS
+from .scoring import modifier_terms
+from .text_utils import normalize_query, unique_ordered
+
+
+# Trailing particles stripped from a token before keying. Kept short on purpose: only
+# ones that never change what the keyword asks for ("제주에서 맛집" ~ "제주 맛집").
+PARTICLES = ("에서", "으로", "에", "의", "을", "를")
+
+# Bigram Jaccard at or above this merges two keys. On long keywords a changed model
+# number or modifier ("아이폰 15" vs "16", "후기" vs "추천") moves too few bigrams, so
+# cluster_keywords also requires equal digit runs and modifier sets before a fuzzy merge.
+DEFAULT_SIMILARITY = 0.85
+
+
+def _strip_particle(token: str) -> str:
+    for p in PARTICLES:
+        # Leave at least two syllables so "가을", "마을" stay intact
+        if token.endswith(p) and len(token) - len(p) >= 2:
+            return token[: -len(p)]
+    return token
+
+
+def canonical_key(q: str) -> str:
+    """Whitespace-insensitive key: `제주 2박3일`, `제주 2박 3일`, `제주2박3일` -> `제주2박3일`.
+
+    Independent of token boundaries, so no particles are stripped here: whether
+    "온라인강의" loses its "의" would depend on where the spaces were.
+    """
+    return normalize_query(q).replace(" ", "")
+
+
+def particle_key(q: str) -> str:
+    """`canonical_key` with a trailing particle stripped from each token (`제주에서 맛집` -> `제주맛집`).
+
+    Token-dependent, so it only ever adds merges on top of `canonical_key`.
+    """
+    return "".join(_strip_particle(t) for t in normalize_query(q).split(" "))
+
+
+_DIGITS_RE = re.compile(r"\d+")
+
+
+def digit_runs(key: str) -> Tuple[str, ...]:
+    """Numbers in `key`; years and model numbers (2024/2025, S23/S24) must match to merge."""
+    return tuple(_DIGITS_RE.findall(key))
+
+
+def char_ngrams(key: str, n: int = 2) -> FrozenSet[str]:
+    if len(key) < n:
+        return frozenset([key])
+    return frozenset(key[i : i + n] for i in range(len(key) - n + 1))
+
+
+def jaccard(a: FrozenSet[str], b: FrozenSet[str]) -> float:
+    if not a and not b:
+        return 1.0
+    return len(a & b) / len(a | b)
+
+
+@dataclass
+class KeywordClusters:
+    """Near-duplicate groups; `members[rep]` lists every keyword `rep` stands for."""
+
+    representatives: List[str] = field(default_factory=list)
+    members: Dict[str, List[str]] = field(default_factory=dict)
+    rep_of: Dict[str, str] = field(default_factory=dict)
+
+    @property
+    def collapsed(self) -> int:
+        return len(self.rep_of) - len(self.representatives)
+
+
+def cluster_keywords(
+    keywords: Iterable[str], hit_counts: Optional[Mapping[str, int]] = None, threshold: float = DEFAULT_SIMILARITY
+) -> KeywordClusters:
+    """Group spacing/particle variants and near-identical spellings.
+
+    Keywords with the same `canonical_key` or `particle_key` always merge;
+    otherwise a keyword joins the first cluster (same leading two characters, same
+    `digit_runs`, same `modifier_terms`) whose key's bigram Jaccard is >= `threshold`. The representative
+    is the member with the most provider hits, the earliest on ties; clusters keep
+    the order of their first member.
+    A `threshold` above 1 turns the n-gram merge off (exact keys only).
+    """
+    hit_counts = hit_counts or {}
+    by_key: Dict[str, int] = {}
+    blocks: Dict[Tuple[str, Tuple[str, ...], Tuple[str, ...]], List[Tuple[int, FrozenSet[str]]]] = {}
+    groups: List[List[str]] = []
+
+    for kw in unique_ordered(keywords):
+        key, pkey = canonical_key(kw), particle_key(kw)
+        idx = by_key.get(key)
+        if idx is None:
+            idx = by_key.get(pkey)
+        if idx is None and threshold <= 1.0:
+            grams = char_ngrams(key)
+            # A different number or intent modifier is a different keyword, however similar the rest
+            block = blocks.setdefault((key[:2], digit_runs(key), tuple(modifier_terms(key))), [])
+            for cand_idx, cand_grams in block:
+                # |A & B| / |A | B| can't reach the threshold if the sizes are too far apart
+                small, big = sorted((len(grams), len(cand_grams)))
+                if small >= threshold * big and jaccard(grams, cand_grams) >= threshold:
+                    idx = cand_idx
+                    break
+            if idx is None:
+                block.append((len(groups), grams))
+        if idx is None:
+            idx = len(groups)
+            groups.append([])
+        by_key.setdefault(key, idx)
+        by_key.setdefault(pkey, idx)
+        groups[idx].append(kw)
+
+    clusters = KeywordClusters()
+    for group in groups:
+        rep = max(group, key=lambda k: hit_counts.get(k, 0))  # max() keeps the first on ties
+        clusters.representatives.append(rep)
+        clusters.members[rep] = group
+        for kw in group:
+            clusters.rep_of[kw] = rep
+    return clusters
+
+
+def fan_out_metrics(metrics: Dict[str, EnrichedMetrics], clusters: KeywordClusters) -> Dict[str, EnrichedMetrics]:
+    """Copy each representative's metrics to every member of its cluster."""
+    out: Dict[str, EnrichedMetrics] = {}
+    for rep, m in metrics.items():
+        for kw in clusters.members.get(rep, [rep]):
+            out[kw] = m if kw == rep else replace(m, keyword=kw)
+    return out
+
+
+def enrich_collapsed(
+    keywords: List[str],
+    enrichers: Dict[str, object],
+    limit: Optional[int] = None,
+    hit_counts: Optional[Mapping[str, int]] = None,
+    threshold: float = DEFAULT_SIMILARITY,
+    journal=None,
+    workers: int = DEFAULT_WORKERS,
+) -> Tuple[Dict[str, EnrichedMetrics], KeywordClusters]:
+    """`enrich_keywords` on one representative per cluster, fanned back out to all members.
+
+    `limit` caps representatives, i.e. API lookups, so the same quota covers more keywords.
+    """
+    clusters = cluster_keywords(keywords, hit_counts=hit_counts, threshold=threshold)
+    reps = clusters.representatives[:limit] if limit else clusters.representatives
+    metrics = enrich_keywords(reps, enrichers, journal=journal, workers=workers)
+    return fan_out_metrics(metrics, clusters), clusters
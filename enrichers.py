@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import base64
 import hashlib
 import hmac
@@ -7,8 +8,10 @@ import os
 import time
 from dataclasses import dataclass
 from typing import Dict, Optional
+from urllib.parse import urlsplit
 
-from .http import HttpClient
+from .http import AsyncHttpClient, HttpClient, rebase_url
+from .parallel import DEFAULT_WORKERS
 
 
 @dataclass
@@ -31,16 +34,20 @@ class NaverOpenApiEnricher:
 
     BASE_URL = "https://openapi.naver.com/v1/search/blog.json"
 
-    def __init__(self, client_id: str, client_secret: str, http: HttpClient | None = None) -> None:
-        headers = {
+    def __init__(
+        self, client_id: str, client_secret: str, http: HttpClient | None = None, base_url: str | None = None
+    ) -> None:
+        # Sent per request so a shared HttpClient (cache, rate limits) can be passed in
+        self.headers = {
             "X-Naver-Client-Id": client_id,
             "X-Naver-Client-Secret": client_secret,
         }
-        self.http = http or HttpClient(headers=headers)
+        self.http = http or HttpClient()
+        self.BASE_URL = rebase_url(self.BASE_URL, base_url)
 
     def blog_total(self, keyword: str) -> Optional[int]:
         try:
-            data = self.http.get_json(self.BASE_URL, params={"query": keyword, "display": 1})
+            data = self.http.get_json(self.BASE_URL, params={"query": keyword, "display": 1}, headers=self.headers)
             total = data.get("total") if isinstance(data, dict) else None
             if isinstance(total, int):
                 return total
@@ -59,10 +66,11 @@ class GoogleCSEnricher:
 
     BASE_URL = "https://www.googleapis.com/customsearch/v1"
 
-    def __init__(self, api_key: str, cx: str, http: HttpClient | None = None) -> None:
+    def __init__(self, api_key: str, cx: str, http: HttpClient | None = None, base_url: str | None = None) -> None:
         self.api_key = api_key
         self.cx = cx
         self.http = http or HttpClient()
+        self.BASE_URL = rebase_url(self.BASE_URL, base_url)
 
     def total_results(self, keyword: str) -> Optional[int]:
         try:
@@ -88,12 +96,22 @@ class NaverAdsEnricher:
     """
 
     BASE_URL = "https://api.searchad.naver.com"
+    # Keep-alive connections to the SearchAd host; matches the worst-case concurrent lookups
+    POOL_SIZE = 8
 
-    def __init__(self, customer_id: str, api_key: str, secret_key: str, http: HttpClient | None = None) -> None:
+    def __init__(
+        self,
+        customer_id: str,
+        api_key: str,
+        secret_key: str,
+        http: HttpClient | None = None,
+        base_url: str | None = None,
+    ) -> None:
         self.customer_id = customer_id
         self.api_key = api_key
         self.secret_key = secret_key
-        self.http = http or HttpClient()
+        self.http = http or HttpClient(pool_maxsize=self.POOL_SIZE)
+        self.BASE_URL = rebase_url(self.BASE_URL, base_url)
 
     def _signature(self, timestamp: str, method: str, path: str) -> str:
         msg = f"{timestamp}.{method}.{path}"
@@ -109,14 +127,14 @@ class NaverAdsEnricher:
             "X-Signature": self._signature(ts, method, path),
         }
 
+    def _sign(self, method: str, url: str) -> Dict[str, str]:
+        return self._headers(method, urlsplit(url).path)
+
     def keyword_stats(self, keyword: str) -> tuple[Optional[int], Optional[int], Optional[float]]:
-        path = "/keywordstool"
-        url = f"{self.BASE_URL}{path}"
-        headers = self._headers("GET", path)
+        url = f"{self.BASE_URL}/keywordstool"
         try:
-            # Use our HttpClient but override headers per request
-            client = HttpClient(headers=headers)
-            data = client.get_json(url, params={"hintKeywords": keyword, "showDetail": 1})
+            # One pooled session for every lookup; each attempt gets a fresh signature
+            data = self.http.get_json(url, params={"hintKeywords": keyword, "showDetail": 1}, sign=self._sign)
             # data: { keywordList: [ { monthlyPcQcCnt, monthlyMobileQcCnt, relKeyword, ... , plAvgCpc? } ] }
             lst = data.get("keywordList") if isinstance(data, dict) else None
             if isinstance(lst, list) and lst:
@@ -138,30 +156,63 @@ class NaverAdsEnricher:
         return None, None, None
 
 
-def build_enrichers_from_env() -> Dict[str, object]:
+def build_enrichers_from_env(http: HttpClient | None = None) -> Dict[str, object]:
+    """Build enrichers for every API whose credentials are set; `http` is shared by all of them."""
     enrichers: Dict[str, object] = {}
     naver_cid = os.getenv("NAVER_AD_CUSTOMER_ID")
     naver_key = os.getenv("NAVER_AD_API_KEY")
     naver_secret = os.getenv("NAVER_AD_SECRET_KEY")
     if naver_cid and naver_key and naver_secret:
-        enrichers["naver_ads"] = NaverAdsEnricher(naver_cid, naver_key, naver_secret)
+        enrichers["naver_ads"] = NaverAdsEnricher(naver_cid, naver_key, naver_secret, http=http)
 
     open_id = os.getenv("NAVER_OPENAPI_CLIENT_ID")
     open_secret = os.getenv("NAVER_OPENAPI_CLIENT_SECRET")
     if open_id and open_secret:
-        enrichers["naver_openapi"] = NaverOpenApiEnricher(open_id, open_secret)
+        enrichers["naver_openapi"] = NaverOpenApiEnricher(open_id, open_secret, http=http)
 
     g_key = os.getenv("GOOGLE_API_KEY")
     g_cx = os.getenv("GOOGLE_CSE_CX")
     if g_key and g_cx:
-        enrichers["google_cse"] = GoogleCSEnricher(g_key, g_cx)
+        enrichers["google_cse"] = GoogleCSEnricher(g_key, g_cx, http=http)
     return enrichers
 
 
-def enrich_keywords(keywords: list[str], enrichers: Dict[str, object], limit: int | None = None) -> Dict[str, EnrichedMetrics]:
+def _has_data(m: EnrichedMetrics) -> bool:
+    return any(v is not None for k, v in vars(m).items() if k != "keyword")
+
+
+def enrich_keywords(
+    keywords: list[str],
+    enrichers: Dict[str, object],
+    limit: int | None = None,
+    journal=None,
+    workers: int = DEFAULT_WORKERS,
+) -> Dict[str, EnrichedMetrics]:
+    """Look up each keyword with every enricher.
+
+    Lookups run concurrently on an `AsyncHttpClient` (at most `workers` at once,
+    a few per API host); results keep keyword order. `workers=1`, or a caller
+    already inside an event loop, looks keywords up one by one.
+
+    With a `journal` (see `journal.Journal`) keywords already enriched are taken
+    from it, and each new result is journaled as soon as it completes. Results
+    with no data at all (usually failed lookups) are not journaled, so a resumed
+    run retries them.
+    """
+    if workers > 1 and enrichers and not _loop_running():
+        shared = getattr(next(iter(enrichers.values())), "http", None)
+        client = AsyncHttpClient(shared, max_concurrency=workers, per_host_concurrency=max(1, workers // 2))
+        try:
+            return asyncio.run(enrich_keywords_async(keywords, enrichers, client, limit=limit, journal=journal))
+        finally:
+            client.close()
+
     out: Dict[str, EnrichedMetrics] = {}
     limit = limit or len(keywords)
     for kw in keywords[:limit]:
+        if journal is not None and kw in journal.metrics:
+            out[kw] = journal.metrics[kw]
+            continue
         m = EnrichedMetrics(keyword=kw)
         if "naver_openapi" in enrichers:
             m.naver_blog_total = enrichers["naver_openapi"].blog_total(kw)  # type: ignore[attr-defined]
@@ -171,5 +222,59 @@ def enrich_keywords(keywords: list[str], enrichers: Dict[str, object], limit: in
             pc, mob, cpc = enrichers["naver_ads"].keyword_stats(kw)  # type: ignore[attr-defined]
             m.naver_monthly_pc, m.naver_monthly_mobile, m.naver_cpc = pc, mob, cpc
         out[kw] = m
+        if journal is not None and _has_data(m):
+            journal.record_enrichment(m)
     return out
 
+
+def _loop_running() -> bool:
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+async def enrich_keywords_async(
+    keywords: list[str],
+    enrichers: Dict[str, object],
+    client: AsyncHttpClient,
+    limit: int | None = None,
+    journal=None,
+) -> Dict[str, EnrichedMetrics]:
+    """Concurrent `enrich_keywords`: every (keyword, enricher) lookup is scheduled at once.
+
+    `client` bounds global and per-host concurrency; each enricher keeps using its own
+    `HttpClient`, so credentials and retry behaviour are unchanged. A keyword is
+    journaled once all of its lookups are done.
+    """
+    limit = limit or len(keywords)
+    out: Dict[str, EnrichedMetrics] = {}
+    pending: list[str] = []
+    for kw in keywords[:limit]:
+        if journal is not None and kw in journal.metrics:
+            out[kw] = journal.metrics[kw]
+        else:
+            out[kw] = EnrichedMetrics(keyword=kw)
+            pending.append(kw)
+
+    async def _one(kw: str, name: str) -> None:
+        m = out[kw]
+        enr = enrichers[name]
+        url = getattr(enr, "BASE_URL", name)  # concurrency key: the API host
+        if name == "naver_openapi":
+            m.naver_blog_total = await client.run(url, enr.blog_total, kw)  # type: ignore[attr-defined]
+        elif name == "google_cse":
+            m.google_total = await client.run(url, enr.total_results, kw)  # type: ignore[attr-defined]
+        elif name == "naver_ads":
+            pc, mob, cpc = await client.run(url, enr.keyword_stats, kw)  # type: ignore[attr-defined]
+            m.naver_monthly_pc, m.naver_monthly_mobile, m.naver_cpc = pc, mob, cpc
+
+    async def _keyword(kw: str) -> None:
+        await asyncio.gather(*(_one(kw, name) for name in names))
+        if journal is not None and _has_data(out[kw]):
+            journal.record_enrichment(out[kw])
+
+    names = [n for n in ("naver_openapi", "google_cse", "naver_ads") if n in enrichers]
+    await asyncio.gather(*(_keyword(kw) for kw in pending))
+    return out
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
-from typing import Iterable, List
+from typing import Iterable, Iterator, List
 
-from .text_utils import normalize_query, unique_ordered
+from .gazetteer import has_placeholder, iter_fill
+from .text_utils import iter_unique, normalize_query, unique_ordered
 
 
 KOREAN_LONGTAIL_SUFFIXES = [
@@ -29,15 +30,31 @@ KOREAN_LONGTAIL_SUFFIXES = [
 
 def append_suffixes(seed: str, suffixes: Iterable[str] | None = None) -> List[str]:
     suffixes = list(suffixes) if suffixes is not None else KOREAN_LONGTAIL_SUFFIXES
-    out = [normalize_query(f"{seed} {suf}") for suf in suffixes]
-    return unique_ordered(out)
+    return unique_ordered(normalize_query(f"{seed} {suf}") for suf in suffixes)
+
+
+def iter_expand_with_suffixes(seeds: Iterable[str], suffixes: Iterable[str] | None = None) -> Iterator[str]:
+    """Lazily yield unique `seed + suffix` expansions, seed by seed.
+
+    `seeds` may be a stream (e.g. lines of a seed file); memory is bounded by the
+    number of unique expansions seen, not by the full seed x suffix product.
+    Placeholder suffixes (`OO동 맛집`) are filled from the gazetteer
+    (`gazetteer.iter_fill`) instead of being appended literally.
+    """
+    suffixes = list(suffixes) if suffixes is not None else KOREAN_LONGTAIL_SUFFIXES
+
+    def _one(seed: str) -> Iterator[str]:
+        for suf in suffixes:
+            if has_placeholder(suf):
+                yield from iter_fill(seed, [suf])
+            else:
+                yield normalize_query(f"{seed} {suf}")
+
+    return iter_unique(q for s in seeds for q in _one(s))
 
 
 def expand_with_suffixes(seeds: Iterable[str], suffixes: Iterable[str] | None = None) -> List[str]:
-    out: List[str] = []
-    for s in seeds:
-        out.extend(append_suffixes(s, suffixes=suffixes))
-    return unique_ordered(out)
+    return list(iter_expand_with_suffixes(seeds, suffixes=suffixes))
 
 
 # Domain-specific profiles for travel and food/restaurant blogs
@@ -60,9 +77,56 @@ PROFILE_SUFFIXES = {
 }
 
 
-def expand_with_profile(seeds: Iterable[str], profile: str) -> List[str]:
-    profile = profile.lower()
-    suffixes = PROFILE_SUFFIXES.get(profile, [])
+def iter_expand_with_profile(seeds: Iterable[str], profile: str) -> Iterator[str]:
+    """Lazy `expand_with_profile`; an unknown profile yields the unique seeds."""
+    suffixes = PROFILE_SUFFIXES.get(profile.lower(), [])
     if not suffixes:
-        return unique_ordered(list(seeds))
-    return unique_ordered(expand_with_suffixes(seeds, suffixes=suffixes))
+        return iter_unique(seeds)
+    return iter_expand_with_suffixes(seeds, suffixes=suffixes)
+
+
+def expand_with_profile(seeds: Iterable[str], profile: str) -> List[str]:
+    return list(iter_expand_with_profile(seeds, profile))
+
+
+# "Alphabet soup" probes: autocomplete surfaces far more long-tail for `seed + ㄱ`,
+# `seed + 가`, `seed + a` than for the bare seed.
+HANGUL_INITIALS = ["ㄱ", "ㄴ", "ㄷ", "ㄹ", "ㅁ", "ㅂ", "ㅅ", "ㅇ", "ㅈ", "ㅊ", "ㅋ", "ㅌ", "ㅍ", "ㅎ"]
+
+# Frequent leading syllables per initial consonant; probed only under productive initials.
+COMMON_SYLLABLES = {
+    "ㄱ": ["가", "강", "개", "거", "고", "공", "구", "김"],
+    "ㄴ": ["나", "남", "내", "노", "농", "누", "느", "니"],
+    "ㄷ": ["다", "대", "더", "도", "동", "두", "드", "디"],
+    "ㄹ": ["라", "래", "러", "레", "로", "루", "리", "립"],
+    "ㅁ": ["마", "맛", "매", "메", "모", "무", "문", "미"],
+    "ㅂ": ["바", "박", "반", "배", "버", "베", "보", "부"],
+    "ㅅ": ["사", "산", "새", "서", "세", "소", "수", "시"],
+    "ㅇ": ["아", "야", "어", "여", "오", "와", "우", "이"],
+    "ㅈ": ["자", "장", "재", "저", "전", "제", "조", "주"],
+    "ㅊ": ["차", "참", "채", "처", "초", "추", "출", "치"],
+    "ㅋ": ["카", "캠", "커", "케", "코", "쿠", "크", "키"],
+    "ㅌ": ["타", "태", "터", "테", "토", "투", "트", "티"],
+    "ㅍ": ["파", "패", "펜", "포", "표", "푸", "프", "피"],
+    "ㅎ": ["하", "한", "해", "허", "호", "화", "후", "히"],
+}
+
+LATIN_LETTERS = list("abcdefghijklmnopqrstuvwxyz")
+
+
+def soup_tokens() -> List[str]:
+    """First-level probe tokens: every initial consonant, then every Latin letter."""
+    return HANGUL_INITIALS + LATIN_LETTERS
+
+
+def soup_children(token: str) -> List[str]:
+    """Tokens to drill into once `token` proved productive (initial -> syllables, a -> aa..az)."""
+    if token in COMMON_SYLLABLES:
+        return list(COMMON_SYLLABLES[token])
+    if len(token) == 1 and token in LATIN_LETTERS:
+        return [token + c for c in LATIN_LETTERS]
+    return []
+
+
+def soup_probe(seed: str, token: str) -> str:
+    return normalize_query(f"{seed} {token}")
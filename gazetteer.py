@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import re
+from itertools import islice, product
+from typing import Dict, Iterable, Iterator, List, Optional, Set
+
+from .text_utils import normalize_query
+
+
+# Bundled place names per region, without the 동/역 suffix (the template supplies it).
+# Only administrative 동 belong under "동"; 읍/면/군 (애월읍, 기장군) would become fake "애월동".
+GAZETTEER: Dict[str, Dict[str, List[str]]] = {
+    "서울": {
+        "동": [
+            "성수", "연남", "망원", "합정", "서교", "익선", "삼청", "이태원", "한남", "청담",
+            "압구정", "신사", "논현", "역삼", "대치", "잠실", "방이", "문래", "여의도", "목",
+        ],
+        "역": [
+            "강남", "홍대입구", "합정", "신촌", "을지로3가", "종로3가", "성수", "건대입구", "잠실", "선릉",
+            "삼성", "여의도", "광화문", "서울", "용산", "신림", "사당", "노원", "왕십리", "뚝섬",
+        ],
+    },
+    "부산": {
+        "동": ["전포", "광안", "남천", "해운대 우", "중", "부평", "남포", "재송", "송정", "영도 봉래"],
+        "역": ["서면", "해운대", "부산", "남포", "광안", "센텀시티", "동래", "연산", "부산대", "수영"],
+    },
+    "제주": {
+        "동": ["연동", "노형", "이도", "아라", "삼도", "용담", "일도", "건입", "화북", "외도"],
+        "역": [],
+    },
+    "대구": {
+        "동": ["동인", "삼덕", "봉산", "수성 범어", "대봉", "칠성", "신천", "복현"],
+        "역": ["반월당", "동대구", "중앙로", "범어", "대구", "수성못", "경대병원", "칠성시장"],
+    },
+    "인천": {
+        "동": ["송도", "구월", "부평", "신포", "중앙", "청라", "논현", "연수"],
+        "역": ["부평", "인천", "주안", "송도달빛축제공원", "인천터미널", "계양", "동인천", "검암"],
+    },
+    "대전": {
+        "동": ["둔산", "봉명", "은행", "대흥", "관평", "도룡", "탄방", "유성 궁"],
+        "역": ["대전", "서대전", "정부청사", "유성온천", "탄방", "중앙로", "월평", "갑천"],
+    },
+}
+
+# `OO동` / `OO역` mark where a neighbourhood / station name goes.
+PLACEHOLDER_RE = re.compile(r"OO(동|역)")
+
+# Per (seed, template) output cap; the cartesian product of multi-placeholder templates grows fast
+DEFAULT_TEMPLATE_CAP = 200
+
+
+def has_placeholder(template: str) -> bool:
+    return PLACEHOLDER_RE.search(template) is not None
+
+
+def regions_for(seed: str, gazetteer: Dict[str, Dict[str, List[str]]] = GAZETTEER) -> List[str]:
+    """Regions named in `seed` (e.g. "부산 맛집" -> ["부산"]); all regions if none is."""
+    named = [r for r in gazetteer if r in seed]
+    return named or list(gazetteer)
+
+
+def place_names(kind: str, regions: Iterable[str], gazetteer: Dict[str, Dict[str, List[str]]] = GAZETTEER) -> List[str]:
+    """`kind`-suffixed names (`성수동`, `강남역`) for the regions, deduplicated in order."""
+    seen: Set[str] = set()
+    out: List[str] = []
+    for region in regions:
+        for name in gazetteer.get(region, {}).get(kind, []):
+            full = name if name.endswith(kind) else f"{name}{kind}"
+            if full not in seen:
+                seen.add(full)
+                out.append(full)
+    return out
+
+
+def fill_template(
+    template: str, regions: Iterable[str], gazetteer: Dict[str, Dict[str, List[str]]] = GAZETTEER
+) -> Iterator[str]:
+    """Lazily yield `template` with every combination of place names substituted.
+
+    A template without placeholders yields itself once.
+    """
+    pieces = PLACEHOLDER_RE.split(template)
+    # split() alternates literal text and captured kinds: [lit, kind, lit, kind, lit]
+    literals, kinds = pieces[0::2], pieces[1::2]
+    regions = list(regions)
+    choices = [place_names(kind, regions, gazetteer) for kind in kinds]
+    for combo in product(*choices):
+        parts = [literals[0]]
+        for name, lit in zip(combo, literals[1:]):
+            parts.append(name)
+            parts.append(lit)
+        yield "".join(parts)
+
+
+def iter_fill(
+    seed: str,
+    templates: Iterable[str],
+    cap: Optional[int] = DEFAULT_TEMPLATE_CAP,
+    gazetteer: Dict[str, Dict[str, List[str]]] = GAZETTEER,
+) -> Iterator[str]:
+    """`seed + filled template` for each template, at most `cap` per template.
+
+    Place names come from the regions named in the seed (all regions otherwise).
+    """
+    regions = regions_for(seed, gazetteer)
+    for template in templates:
+        filled = (normalize_query(f"{seed} {t}") for t in fill_template(template, regions, gazetteer))
+        yield from islice(filled, cap)
@@ -1,64 +1,36 @@
 from __future__ import annotations
 
 import threading
+from itertools import chain
 import tkinter as tk
 from tkinter import filedialog, messagebox
-from typing import Dict, List, Tuple
+from typing import Dict, List
 
-from .expansion import expand_with_profile, expand_with_suffixes
-from .providers import GoogleSuggestProvider, NaverSuggestProvider
+from .expansion import iter_expand_with_profile, iter_expand_with_suffixes
+from .cache import cache_from_env
+from .http import HttpClient
+from .scheduler import collect_suggestions
 from .scoring import (
     KeywordScore,
+    extract_features,
     score_keywords,
     score_keywords_with_metrics,
     score_keywords_by_platform,
 )
-from .enrichers import build_enrichers_from_env, enrich_keywords, EnrichedMetrics
-from .text_utils import normalize_query, unique_ordered
+from .enrichers import build_enrichers_from_env, EnrichedMetrics
+from .dedup import enrich_collapsed
+from .text_utils import normalize_many, unique_ordered
 from .env import load_env
 
 
-def _collect_suggestions_gui(
-    seeds: List[str], provider_names: List[str], depth: int, hl: str
-) -> Tuple[List[str], Dict[str, int]]:
-    provider_names = [p.strip().lower() for p in provider_names]
-    providers = []
-    if "naver" in provider_names:
-        providers.append(NaverSuggestProvider())
-    if "google" in provider_names:
-        providers.append(GoogleSuggestProvider())
-
-    all_candidates: List[str] = []
-    hit_counts: Dict[str, int] = {}
-
-    def _accumulate(cands: List[str]) -> None:
-        for kw in cands:
-            all_candidates.append(kw)
-            hit_counts[kw] = hit_counts.get(kw, 0) + 1
-
-    # round 1
-    for p in providers:
-        if isinstance(p, GoogleSuggestProvider):
-            _accumulate(p.bulk_suggest(seeds, hl=hl))
-        else:
-            _accumulate(p.bulk_suggest(seeds))
-
-    if depth >= 2:
-        suffix_expanded = expand_with_suffixes(seeds)
-        for p in providers:
-            if isinstance(p, GoogleSuggestProvider):
-                _accumulate(p.bulk_suggest(suffix_expanded, hl=hl))
-            else:
-                _accumulate(p.bulk_suggest(suffix_expanded))
-
-    return unique_ordered(all_candidates), hit_counts
-
-
 class App(tk.Tk):
     def __init__(self) -> None:
         super().__init__()
         # Load .env for API keys
         load_env()
+        # One client for the whole session: every run and the enrichers share its pool,
+        # response cache and request coalescing.
+        self.http = HttpClient(cache=cache_from_env())
         self.title("블로그 키워드 분석기 (Naver/Tistory)")
         self.geometry("760x640")
         self._build_widgets()
@@ -138,7 +110,7 @@ class App(tk.Tk):
     def _run_impl(self) -> None:
         try:
             seeds_text = self.txt_seeds.get("1.0", tk.END).strip()
-            seeds = [normalize_query(s) for s in seeds_text.splitlines() if normalize_query(s)]
+            seeds = normalize_many(seeds_text.splitlines())
             if not seeds:
                 messagebox.showwarning("입력 필요", "시드 키워드를 1개 이상 입력하세요.")
                 return
@@ -168,31 +140,36 @@ class App(tk.Tk):
                 platforms = ["naver", "tistory"]
 
             self._append_log("[i] 제안 수집 중...")
-            candidates, hit_counts = _collect_suggestions_gui(seeds, providers, depth=depth, hl="ko")
+            http = self.http
+            candidates, hit_counts = collect_suggestions(seeds, providers, depth=depth, hl="ko", http=http)
             if profile:
-                candidates = unique_ordered(candidates + expand_with_profile(seeds, profile))
+                candidates = unique_ordered(chain(candidates, iter_expand_with_profile(seeds, profile)))
             elif include_suffix:
-                candidates = unique_ordered(candidates + expand_with_suffixes(seeds))
+                candidates = unique_ordered(chain(candidates, iter_expand_with_suffixes(seeds)))
             if limit:
                 candidates = candidates[:limit]
 
             self._append_log(f"[i] 후보 {len(candidates)}개 점수화...")
             metrics_map: Dict[str, EnrichedMetrics] | None = None
             if enrich:
-                enr = build_enrichers_from_env()
+                enr = build_enrichers_from_env(http=http)
                 if not enr:
                     self._append_log("[!] ENV에 API 키가 설정되지 않아 휴리스틱으로 진행합니다.")
-                metrics_map = enrich_keywords(candidates, enr, limit=enrich_limit)
+                metrics_map, _ = enrich_collapsed(candidates, enr, limit=enrich_limit, hit_counts=hit_counts)
 
-            # Per-platform scoring
+            # Per-platform scoring over one shared feature extraction
+            features = extract_features(candidates, hit_counts)
+            baseline: List[KeywordScore] | None = None
             per_platform: Dict[str, List[KeywordScore]] = {}
             for pf in platforms:
                 if metrics_map is not None:
                     per_platform[pf] = score_keywords_by_platform(
-                        candidates, hit_counts=hit_counts, metrics=metrics_map, platform=pf
+                        candidates, hit_counts=hit_counts, metrics=metrics_map, platform=pf, features=features
                     )
                 else:
-                    per_platform[pf] = score_keywords(candidates, hit_counts=hit_counts)
+                    if baseline is None:
+                        baseline = score_keywords(candidates, hit_counts=hit_counts, features=features)
+                    per_platform[pf] = baseline
 
             # Preview per platform
             for pf in platforms:
@@ -1,10 +1,33 @@
 from __future__ import annotations
 
+import asyncio
+import json
+import os
 import random
+import threading
 import time
-from typing import Any, Dict, Optional
+from collections import OrderedDict
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Dict, Iterable, Optional, Set, Tuple, TypeVar
+from urllib.parse import urlsplit
+from weakref import WeakKeyDictionary
 
 import requests
+from requests.adapters import HTTPAdapter
+from requests.utils import guess_json_utf
+from urllib3.util.request import ACCEPT_ENCODING
+
+try:  # Optional fast JSON backend
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - depends on environment
+    orjson = None  # type: ignore[assignment]
+
+from .cache import ResponseCache, request_key
+from .cassette import Cassette, CassetteMiss
+from .metrics import HttpMetrics
 
 DEFAULT_HEADERS = {
     "User-Agent": (
@@ -13,11 +36,360 @@ DEFAULT_HEADERS = {
         "Chrome/124.0 Safari/537.36"
     ),
     "Accept-Language": "ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7",
+    # Same "gzip,deflate" requests sends by default, plus br/zstd when brotli/zstandard
+    # are installed; urllib3 decodes whichever the server picks
+    "Accept-Encoding": ACCEPT_ENCODING,
+}
+
+
+def json_loads(text: str) -> Any:
+    """Decode JSON with orjson when installed, else the stdlib.
+
+    orjson rejects a few inputs the stdlib accepts (NaN/Infinity literals), so
+    those fall back to `json.loads` instead of failing.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(text)
+
+T = TypeVar("T")
+
+# Request-signing hook: called with (method, url) before every attempt, returns extra headers.
+Signer = Callable[[str, str], Dict[str, str]]
+
+# (requests per second, burst) per host. A rule also covers subdomains, so
+# "googleapis.com" applies to www.googleapis.com.
+DEFAULT_RATE_LIMITS: Dict[str, Tuple[float, int]] = {
+    "ac.search.naver.com": (10.0, 20),
+    "suggestqueries.google.com": (5.0, 10),
+    "openapi.naver.com": (8.0, 10),
+    "api.searchad.naver.com": (5.0, 5),
+    "googleapis.com": (5.0, 5),
 }
 
 
+class TokenBucket:
+    """Thread-safe token bucket.
+
+    `reserve` takes a token immediately and returns how long the caller must
+    wait for it, so concurrent callers queue up fairly instead of spinning.
+    """
+
+    def __init__(self, rate: float, burst: int) -> None:
+        self.rate = float(rate)
+        self.burst = max(1, int(burst))
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1.0
+            if self._tokens >= 0 or self.rate <= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def acquire(self) -> None:
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    def pause(self, seconds: float) -> None:
+        """Hold back every caller for at least `seconds` (e.g. after a 429)."""
+        with self._lock:
+            self._tokens = min(self._tokens, 0.0) - seconds * self.rate
+
+
+# API path under each rate-limited host. While `$BKA_BASE_URL` points every client at
+# one server (e.g. the stand-in), a request to `<base><path>...` still gets that
+# host's bucket and breaker, so each API keeps its own budget there.
+RULE_PATHS: Dict[str, str] = {
+    "ac.search.naver.com": "/nx/ac",
+    "suggestqueries.google.com": "/complete/search",
+    "openapi.naver.com": "/v1/search",
+    "api.searchad.naver.com": "/keywordstool",
+    "googleapis.com": "/customsearch",
+}
+
+
+class RateLimiter:
+    """Per-host token buckets. Hosts without a matching rule are not paced.
+
+    Rules for hosts in `paths` (default `RULE_PATHS`) also cover their API path
+    on the `$BKA_BASE_URL` server.
+    """
+
+    def __init__(
+        self, limits: Optional[Dict[str, Tuple[float, int]]] = None, paths: Optional[Dict[str, str]] = None
+    ) -> None:
+        self._buckets: Dict[str, TokenBucket] = {}
+        self.paths = RULE_PATHS if paths is None else paths
+        self._lock = threading.Lock()
+        for host, (rate, burst) in (limits or {}).items():
+            self.configure(host, rate, burst)
+
+    def configure(self, host: str, rate: float, burst: int = 1) -> None:
+        with self._lock:
+            self._buckets[host.lower()] = TokenBucket(rate, burst)
+
+    def rule_for(self, host: str, path: str = "") -> Optional[str]:
+        """The rule a request to `host` + `path` falls under, if any."""
+        host = host.lower()
+        with self._lock:
+            match = ""
+            for rule in self._buckets:
+                if (host == rule or host.endswith("." + rule)) and len(rule) > len(match):
+                    match = rule
+            if match or not path:
+                return match or None
+            base = os.getenv(BASE_URL_ENV)
+            if not base:
+                return None
+            parts = urlsplit(base)
+            if host != (parts.hostname or "").lower():
+                return None
+            prefix = parts.path.rstrip("/")
+            for rule in self._buckets:
+                api_path = self.paths.get(rule)
+                if api_path and path.startswith(prefix + api_path):
+                    return rule
+            return None
+
+    def bucket_for(self, host: str, path: str = "") -> Optional[TokenBucket]:
+        rule = self.rule_for(host, path)
+        return self._buckets.get(rule) if rule else None
+
+    def scope_of(self, url: str) -> str:
+        """Key for state shared by requests under one rule (e.g. the circuit breaker); the host if unmatched."""
+        parts = urlsplit(url)
+        host = (parts.hostname or "").lower()
+        return self.rule_for(host, parts.path) or host
+
+    def acquire(self, url: str) -> bool:
+        """Block until a request to `url` may go out. Returns False if the host is unpaced."""
+        bucket = self._bucket_for_url(url)
+        if bucket is None:
+            return False
+        bucket.acquire()
+        return True
+
+    def penalize(self, url: str, seconds: float) -> bool:
+        """Pause the host's bucket for `seconds`. Returns False if the host is unpaced."""
+        bucket = self._bucket_for_url(url)
+        if bucket is None:
+            return False
+        bucket.pause(seconds)
+        return True
+
+    def _bucket_for_url(self, url: str) -> Optional[TokenBucket]:
+        parts = urlsplit(url)
+        return self.bucket_for(parts.hostname or "", parts.path)
+
+
+def parse_rate_limits(specs: Iterable[str]) -> Dict[str, Tuple[float, int]]:
+    """Parse `host=rate[:burst]` entries, e.g. `ac.search.naver.com=20:40`."""
+    limits: Dict[str, Tuple[float, int]] = {}
+    for spec in specs:
+        host, _, value = spec.partition("=")
+        rate, _, burst = value.partition(":")
+        if not host.strip() or not rate.strip():
+            raise ValueError(f"invalid rate limit: {spec!r} (expected host=rate[:burst])")
+        r = float(rate)
+        limits[host.strip().lower()] = (r, int(burst) if burst.strip() else max(1, int(r)))
+    return limits
+
+
+# Shared by every HttpClient that isn't given its own limiter, so separate
+# provider/enricher clients still respect one budget per host.
+DEFAULT_RATE_LIMITER = RateLimiter(DEFAULT_RATE_LIMITS)
+
+
+def _host_of(url: str) -> str:
+    return (urlsplit(url).hostname or "").lower()
+
+
+# Points every provider/enricher at another server, e.g. the local stand-in (`standin.py`)
+BASE_URL_ENV = "BKA_BASE_URL"
+
+
+def rebase_url(url: str, base: Optional[str] = None) -> str:
+    """Swap the scheme/host of `url` for `base` (`scheme://host[:port][/prefix]`), keeping its path.
+
+    `base` defaults to `$BKA_BASE_URL`; with neither, `url` is returned unchanged.
+    """
+    base = base or os.getenv(BASE_URL_ENV)
+    if not base:
+        return url
+    return base.rstrip("/") + urlsplit(url).path
+
+
+# Statuses worth retrying after a delay; they also count against the host's breaker.
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+# Non-retryable statuses that still mean the host is unusable (bad key, quota exhausted).
+BREAKER_STATUSES = frozenset({401, 403})
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of sending a request while a host's circuit is open."""
+
+
+class CircuitBreaker:
+    """Per-host circuit breaker.
+
+    Opens after `failure_threshold` consecutive failures and fails fast for
+    `cooldown` seconds. After that a single probe request is let through: success
+    closes the circuit, failure re-opens it for another cool-down.
+    """
+
+    def __init__(self, failure_threshold: int = 5, cooldown: float = 30.0) -> None:
+        self.failure_threshold = max(1, failure_threshold)
+        self.cooldown = cooldown
+        self._failures: Dict[str, int] = {}
+        self._opened_at: Dict[str, float] = {}
+        self._probing: Set[str] = set()
+        self._lock = threading.Lock()
+
+    def before_request(self, host: str) -> bool:
+        """Raise `CircuitOpenError` if `host` is blocked; True if this call is the half-open probe."""
+        with self._lock:
+            opened = self._opened_at.get(host)
+            if opened is None:
+                return False
+            remaining = self.cooldown - (time.monotonic() - opened)
+            if remaining > 0 or host in self._probing:
+                raise CircuitOpenError(f"circuit open for {host} ({max(remaining, 0):.1f}s left)")
+            self._probing.add(host)
+            return True
+
+    def release_probe(self, host: str) -> None:
+        """Free the probe slot of a probe that ended without an HTTP outcome (e.g. an interrupt)."""
+        with self._lock:
+            self._probing.discard(host)
+
+    def record_success(self, host: str) -> None:
+        with self._lock:
+            self._failures.pop(host, None)
+            self._opened_at.pop(host, None)
+            self._probing.discard(host)
+
+    def record_failure(self, host: str) -> None:
+        with self._lock:
+            n = self._failures.get(host, 0) + 1
+            self._failures[host] = n
+            if host in self._probing or n >= self.failure_threshold:
+                self._opened_at[host] = time.monotonic()
+                self._probing.discard(host)
+
+    def is_open(self, host: str) -> bool:
+        with self._lock:
+            return host in self._opened_at
+
+
+DEFAULT_CIRCUIT_BREAKER = CircuitBreaker()
+
+
+class _Call:
+    __slots__ = ("done", "value", "error")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.value: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """Coalesce identical requests.
+
+    Concurrent callers with the same key share one in-flight call; its result is
+    then kept for `ttl` seconds (at most `max_entries` keys) so back-to-back
+    duplicates are absorbed too. Shared results must be treated as read-only.
+    """
+
+    def __init__(self, ttl: float = 5.0, max_entries: int = 1024) -> None:
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._inflight: Dict[Any, _Call] = {}
+        self._recent: "OrderedDict[Any, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def do(self, key: Any, func: Callable[[], T]) -> T:
+        with self._lock:
+            hit = self._recent.get(key)
+            if hit is not None:
+                if hit[0] > time.monotonic():
+                    return hit[1]
+                del self._recent[key]
+            call = self._inflight.get(key)
+            leader = call is None
+            if call is None:
+                call = self._inflight[key] = _Call()
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.value
+
+        try:
+            call.value = func()
+        except BaseException as exc:
+            call.error = exc
+            raise
+        finally:
+            with self._lock:
+                del self._inflight[key]
+                if call.error is None and self.ttl > 0:
+                    self._recent[key] = (time.monotonic() + self.ttl, call.value)
+                    self._recent.move_to_end(key)
+                    while len(self._recent) > self.max_entries:
+                        self._recent.popitem(last=False)
+            call.done.set()
+        return call.value
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Seconds to wait from a Retry-After header (delta-seconds or HTTP-date)."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
 class HttpClient:
-    """Lightweight HTTP client with retries and jitter."""
+    """Lightweight HTTP client with backoff, rate limiting and a circuit breaker.
+
+    - Requests are paced by `rate_limiter` (shared `DEFAULT_RATE_LIMITER` by default)
+    - Connection errors and `RETRY_STATUSES` are retried with exponential backoff
+      starting at `min_delay` plus up to `max_delay - min_delay` of jitter, capped at
+      `max_backoff`; a `Retry-After` header takes precedence
+    - Consecutive failures open the host's circuit in `circuit_breaker`
+      (shared `DEFAULT_CIRCUIT_BREAKER`), after which calls raise `CircuitOpenError`;
+      hosts are grouped by their rate-limit rule (`RateLimiter.scope_of`)
+    - An optional `ResponseCache` serves repeated requests from disk
+    - Identical concurrent/back-to-back requests are coalesced by `single_flight`
+      (one per client by default, so clients with different caches, cassettes or
+      auth headers never share responses; per-call headers are part of the key)
+    - With a `Cassette`, responses are recorded to / replayed from a JSONL file
+      in place of the network call, so pacing, retries and caching still apply
+    - `metrics` (an `HttpMetrics`, one per client by default) records per-endpoint
+      counts, latencies, retries, statuses, bytes and cache hits
+    - One keep-alive `requests.Session` is reused for every call; `pool_maxsize`
+      sizes its per-host connection pool (raise it for concurrent callers)
+    """
 
     def __init__(
         self,
@@ -26,42 +398,257 @@ class HttpClient:
         min_delay: float = 0.2,
         max_delay: float = 0.7,
         headers: Optional[Dict[str, str]] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        cache: Optional[ResponseCache] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        max_backoff: float = 30.0,
+        pool_maxsize: int = 10,
+        single_flight: Optional[SingleFlight] = None,
+        cassette: Optional[Cassette] = None,
+        metrics: Optional[HttpMetrics] = None,
     ) -> None:
         self.timeout = timeout
         self.max_retries = max_retries
         self.min_delay = min_delay
         self.max_delay = max_delay
+        self.max_backoff = max_backoff
+        self.rate_limiter = rate_limiter or DEFAULT_RATE_LIMITER
+        self.circuit_breaker = circuit_breaker or DEFAULT_CIRCUIT_BREAKER
+        self.cache = cache
+        self.single_flight = single_flight or SingleFlight()
+        self.cassette = cassette
+        self.metrics = metrics or HttpMetrics()
         self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=max(1, pool_maxsize))
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
         self.session.headers.update(DEFAULT_HEADERS)
         if headers:
             self.session.headers.update(headers)
 
-    def _sleep_jitter(self) -> None:
-        time.sleep(random.uniform(self.min_delay, self.max_delay))
+    def _backoff_delay(self, attempt: int) -> float:
+        base = self.min_delay * (2 ** attempt)
+        return min(self.max_backoff, base + random.uniform(0.0, max(self.max_delay - self.min_delay, 0.0)))
 
-    def get_json(self, url: str, params: Optional[Dict[str, Any]] = None) -> Any:
-        last_exc: Optional[Exception] = None
-        for _ in range(self.max_retries + 1):
-            try:
-                resp = self.session.get(url, params=params, timeout=self.timeout)
-                resp.raise_for_status()
-                return resp.json()
-            except Exception as exc:  # noqa: BLE001
-                last_exc = exc
-                self._sleep_jitter()
-        if last_exc:
-            raise last_exc
-
-    def get_text(self, url: str, params: Optional[Dict[str, Any]] = None) -> str:
+    def get_json(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        sign: Optional[Signer] = None,
+    ) -> Any:
+        return self._request(url, params, headers, sign, json_loads)
+
+    def get_text(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        sign: Optional[Signer] = None,
+    ) -> str:
+        return self._request(url, params, headers, sign, str)
+
+    def _request(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]],
+        headers: Optional[Dict[str, str]],
+        sign: Optional[Signer],
+        decode: Callable[[str], Any],
+    ) -> Any:
+        key = (request_key(url, params), tuple(sorted((headers or {}).items())), decode)
+        ran = False
+
+        def work() -> Any:
+            nonlocal ran
+            ran = True
+            return self._cached_fetch(url, params, headers, sign, decode)
+
+        value = self.single_flight.do(key, work)
+        if not ran:
+            self.metrics.record_coalesced(url)
+        return value
+
+    def _cached_fetch(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]],
+        headers: Optional[Dict[str, str]],
+        sign: Optional[Signer],
+        decode: Callable[[str], Any],
+    ) -> Any:
+        if self.cache is not None:
+            cached = self.cache.get(url, params)
+            if cached is not None:
+                self.metrics.record_cache_hit(url)
+                return decode(cached)
+        text, value = self._fetch(url, params, headers, sign, decode)
+        if self.cache is not None:
+            self.cache.set(url, params, text)
+        return value
+
+    def _send(self, url: str, params: Optional[Dict[str, Any]], headers: Optional[Dict[str, str]]) -> Any:
+        start = time.perf_counter()
+        try:
+            if self.cassette is not None and self.cassette.replaying:
+                resp = self.cassette.play(url, params)
+            else:
+                resp = self.session.get(url, params=params, headers=headers, timeout=self.timeout)
+                if self.cassette is not None:
+                    self.cassette.record(url, params, resp)
+        except CassetteMiss:
+            raise
+        except Exception:
+            self.metrics.record_error(url, time.perf_counter() - start)
+            raise
+        self.metrics.record_response(url, resp.status_code, time.perf_counter() - start, _body_size(resp))
+        return resp
+
+    def _fetch(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]],
+        headers: Optional[Dict[str, str]],
+        sign: Optional[Signer],
+        decode: Callable[[str], Any],
+    ) -> Tuple[str, Any]:
+        # Decoding happens inside the retry loop so a truncated/garbled body is retried
+        # and never reaches the cache.
+        scope = self.rate_limiter.scope_of(url)  # circuit-breaker key: the host's (or API's) rule
         last_exc: Optional[Exception] = None
-        for _ in range(self.max_retries + 1):
-            try:
-                resp = self.session.get(url, params=params, timeout=self.timeout)
-                resp.raise_for_status()
-                return resp.text
-            except Exception as exc:  # noqa: BLE001
-                last_exc = exc
-                self._sleep_jitter()
-        if last_exc:
-            raise last_exc
+        probing = False
+        try:
+            for attempt in range(self.max_retries + 1):
+                probing = self.circuit_breaker.before_request(scope) or probing
+                self.rate_limiter.acquire(url)
+                retry_after: Optional[float] = None
+                req_headers = headers
+                if sign is not None:
+                    # Signed per attempt so retries don't reuse a stale timestamp
+                    req_headers = {**(headers or {}), **sign("GET", url)}
+                try:
+                    resp = self._send(url, params, req_headers)
+                    status = resp.status_code
+                    if status in RETRY_STATUSES:
+                        retry_after = parse_retry_after(resp.headers.get("Retry-After"))
+                        resp.raise_for_status()
+                    if status >= 400:
+                        if status in BREAKER_STATUSES:
+                            self.circuit_breaker.record_failure(scope)
+                        else:
+                            self.circuit_breaker.record_success(scope)
+                        resp.raise_for_status()
+                    if decode is json_loads and not resp.encoding and resp.content:
+                        # Same detection resp.json() uses; skips resp.text's slow charset sniffing
+                        resp.encoding = guess_json_utf(resp.content)
+                    text = resp.text
+                    value = decode(text)
+                except requests.HTTPError as exc:
+                    if exc.response is None or exc.response.status_code not in RETRY_STATUSES:
+                        raise
+                    last_exc = exc
+                except CassetteMiss:
+                    raise
+                except Exception as exc:  # noqa: BLE001
+                    last_exc = exc
+                else:
+                    self.circuit_breaker.record_success(scope)
+                    return text, value
+
+                self.circuit_breaker.record_failure(scope)
+                if attempt >= self.max_retries or self.circuit_breaker.is_open(scope):
+                    break
+                self.metrics.record_retry(url)
+                if retry_after is not None:
+                    if retry_after > self.max_backoff:
+                        break  # the server asked for longer than we are willing to wait
+                    # Paced hosts wait in the bucket, which also holds back concurrent callers
+                    if not self.rate_limiter.penalize(url, retry_after):
+                        time.sleep(retry_after)
+                else:
+                    time.sleep(self._backoff_delay(attempt))
+        finally:
+            if probing:
+                # Recorded outcomes free the slot; a probe that raised anything else
+                # (CassetteMiss, Ctrl-C) must not leave the host blocked for good
+                self.circuit_breaker.release_probe(scope)
+        raise last_exc or RuntimeError(f"no request attempted for {url}")
+
+
+def _body_size(resp: Any) -> int:
+    # Content-Length is the on-the-wire (possibly compressed) size when the server sends it
+    length = resp.headers.get("Content-Length")
+    if length and str(length).isdigit():
+        return int(length)
+    return len(resp.content or b"")
+
+
+# (global semaphore, per-host semaphores) for one event loop
+_LoopSemaphores = Tuple[asyncio.Semaphore, Dict[str, asyncio.Semaphore]]
+
+
+class AsyncHttpClient:
+    """Asyncio front-end for `HttpClient` with bounded concurrency.
+
+    Blocking calls run on a worker pool sized to `max_concurrency`, so the
+    wrapped client's retry semantics are preserved exactly. A global semaphore
+    caps total in-flight requests and a per-host semaphore keeps any single
+    endpoint from taking the whole budget.
+    """
+
+    def __init__(
+        self,
+        http: Optional[HttpClient] = None,
+        max_concurrency: int = 16,
+        per_host_concurrency: int = 4,
+    ) -> None:
+        self.max_concurrency = max(1, max_concurrency)
+        self._http = http
+        self.per_host_concurrency = max(1, per_host_concurrency)
+        self._executor = ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix="bka-http")
+        # Semaphores bind to the loop they first wait on, so each loop gets its own set
+        self._loop_sems: "WeakKeyDictionary[asyncio.AbstractEventLoop, _LoopSemaphores]" = WeakKeyDictionary()
+
+    @property
+    def http(self) -> HttpClient:
+        """The wrapped client; built on first use so `run`-only callers never open a session."""
+        if self._http is None:
+            self._http = HttpClient(pool_maxsize=self.max_concurrency)
+        return self._http
+
+    def _semaphores(self, host: str) -> Tuple[asyncio.Semaphore, asyncio.Semaphore]:
+        loop = asyncio.get_running_loop()
+        sems = self._loop_sems.get(loop)
+        if sems is None:
+            sems = self._loop_sems[loop] = (asyncio.Semaphore(self.max_concurrency), {})
+        global_sem, host_sems = sems
+        sem = host_sems.get(host)
+        if sem is None:
+            sem = host_sems[host] = asyncio.Semaphore(self.per_host_concurrency)
+        return global_sem, sem
+
+    async def run(self, url: str, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run a blocking call against `url`'s host under the concurrency limits.
+
+        Lets providers and enrichers reuse their own sync methods (and their
+        own `HttpClient`) while the event loop schedules them.
+        """
+        global_sem, host_sem = self._semaphores(_host_of(url))
+        loop = asyncio.get_running_loop()
+        async with global_sem, host_sem:
+            return await loop.run_in_executor(self._executor, partial(func, *args, **kwargs))
+
+    async def get_json(self, url: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        return await self.run(url, self.http.get_json, url, params=params)
+
+    async def get_text(self, url: str, params: Optional[Dict[str, Any]] = None) -> str:
+        return await self.run(url, self.http.get_text, url, params=params)
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=False)
+
+    async def __aenter__(self) -> "AsyncHttpClient":
+        return self
 
+    async def __aexit__(self, *exc: Any) -> None:
+        self.close()
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import json
+import os
+import threading
+from dataclasses import asdict
+from typing import Dict, List, Optional, Tuple
+
+from .enrichers import EnrichedMetrics
+
+
+DEFAULT_JOURNAL_PATH = ".bka_checkpoint.jsonl"
+
+
+class Journal:
+    """Append-only JSONL checkpoint of finished network work.
+
+    Two record kinds, one per line, flushed as soon as they complete:
+      - {"t": "suggest", "p": provider, "q": query, "r": [suggestions]}
+      - {"t": "enrich", "k": keyword, "m": {EnrichedMetrics fields}}
+    With `resume=True` existing lines are loaded (a torn last line from a crash
+    is ignored) and replayed instead of re-fetched; since the pipeline itself is
+    deterministic, replaying the same answers rebuilds the same `hit_counts`.
+    Without it the file is started over. A journal belongs to one run
+    configuration (seeds, providers, hl).
+    """
+
+    def __init__(self, path: str = DEFAULT_JOURNAL_PATH, resume: bool = False) -> None:
+        self.path = path
+        self.suggestions: Dict[Tuple[str, str], List[str]] = {}
+        self.metrics: Dict[str, EnrichedMetrics] = {}
+        self._lock = threading.Lock()
+        if resume and os.path.exists(path):
+            self._load()
+        self._fh = open(path, "a" if resume else "w", encoding="utf-8")
+
+    def _load(self) -> None:
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    rec = json.loads(line)
+                except ValueError:
+                    continue
+                if rec.get("t") == "suggest":
+                    self.suggestions[(rec["p"], rec["q"])] = list(rec["r"])
+                elif rec.get("t") == "enrich":
+                    self.metrics[rec["k"]] = EnrichedMetrics(**rec["m"])
+
+    def __len__(self) -> int:
+        return len(self.suggestions) + len(self.metrics)
+
+    def _append(self, rec: Dict[str, object]) -> None:
+        line = json.dumps(rec, ensure_ascii=False)
+        with self._lock:
+            self._fh.write(line + "\n")
+            self._fh.flush()
+
+    def suggest(self, provider: str, query: str) -> Optional[List[str]]:
+        return self.suggestions.get((provider, query))
+
+    def record_suggest(self, provider: str, query: str, result: List[str]) -> None:
+        with self._lock:
+            self.suggestions[(provider, query)] = list(result)
+        self._append({"t": "suggest", "p": provider, "q": query, "r": list(result)})
+
+    def record_enrichment(self, m: EnrichedMetrics) -> None:
+        with self._lock:
+            self.metrics[m.keyword] = m
+        self._append({"t": "enrich", "k": m.keyword, "m": asdict(m)})
+
+    def close(self) -> None:
+        with self._lock:
+            self._fh.close()
+
+
+class JournaledProvider:
+    """Wrap a `SuggestProvider` so finished queries are journaled and never re-sent."""
+
+    def __init__(self, provider, journal: Journal) -> None:
+        self.provider = provider
+        self.journal = journal
+        self.name = provider.name
+        self.BASE_URL = provider.BASE_URL
+
+    def suggest(self, seed: str) -> List[str]:
+        done = self.journal.suggest(self.name, seed)
+        if done is not None:
+            return list(done)
+        # Failures raise out of the provider, so only real answers are journaled
+        result = self.provider.suggest(seed)
+        self.journal.record_suggest(self.name, seed, result)
+        return result
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+from collections import deque
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, List, Set, Tuple
+
+
+class TermMatcher:
+    """Aho–Corasick automaton: finds every occurrence of many terms in one pass per string.
+
+    Build once per term list (see `compiled_matcher`) and reuse; scanning costs
+    O(len(text) + matches) no matter how many terms there are. Duplicate and
+    empty terms are dropped; `terms` keeps first-seen order.
+    """
+
+    def __init__(self, terms: Iterable[str]) -> None:
+        self.terms: List[str] = []
+        ids: Dict[str, int] = {}
+        for t in terms:
+            if t and t not in ids:
+                ids[t] = len(self.terms)
+                self.terms.append(t)
+
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[Tuple[int, ...]] = [()]
+        for tid, term in enumerate(self.terms):
+            node = 0
+            for ch in term:
+                nxt = self._goto[node].get(ch)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[node][ch] = nxt
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append(())
+                node = nxt
+            self._out[node] += (tid,)
+
+        # Breadth-first so a node's failure target is finished before the node itself
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, child in self._goto[node].items():
+                queue.append(child)
+                f = self._fail[node]
+                while f and ch not in self._goto[f]:
+                    f = self._fail[f]
+                target = self._goto[f].get(ch, 0)
+                self._fail[child] = target if target != child else 0
+                self._out[child] += self._out[self._fail[child]]
+
+    def __len__(self) -> int:
+        return len(self.terms)
+
+    def iter_matches(self, text: str) -> Iterator[Tuple[int, int]]:
+        """Yield `(end_index, term_id)` for every occurrence, overlaps included."""
+        goto, fail, out = self._goto, self._fail, self._out
+        node = 0
+        for i, ch in enumerate(text):
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            for tid in out[node]:
+                yield i, tid
+
+    def matched_ids(self, text: str) -> Set[int]:
+        """Ids of the terms occurring in `text` at least once."""
+        return {tid for _, tid in self.iter_matches(text)}
+
+    def matched_terms(self, text: str) -> List[str]:
+        return [self.terms[tid] for tid in sorted(self.matched_ids(text))]
+
+    def contains_any(self, text: str) -> bool:
+        return next(self.iter_matches(text), None) is not None
+
+    def document_counts(self, texts: Iterable[str]) -> List[int]:
+        """For each term, how many of `texts` contain it (`counts[term_id]`)."""
+        counts = [0] * len(self.terms)
+        for text in texts:
+            for tid in self.matched_ids(text):
+                counts[tid] += 1
+        return counts
+
+
+@lru_cache(maxsize=32)
+def _compiled(terms: Tuple[str, ...]) -> TermMatcher:
+    return TermMatcher(terms)
+
+
+def compiled_matcher(terms: Iterable[str]) -> TermMatcher:
+    """Shared `TermMatcher` for a term list; rebuilt only when the list changes."""
+    return _compiled(tuple(terms))
@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import json
+import random
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+from urllib.parse import urlsplit
+
+
+def endpoint_of(url: str) -> str:
+    """Metrics key for a URL: host + path, e.g. `ac.search.naver.com/nx/ac`."""
+    parts = urlsplit(url)
+    return f"{(parts.hostname or '').lower()}{parts.path}"
+
+
+def _percentile(sorted_values: List[float], pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    idx = min(len(sorted_values) - 1, max(0, int(round(pct / 100.0 * len(sorted_values) + 0.5)) - 1))
+    return sorted_values[idx]
+
+
+@dataclass
+class EndpointStats:
+    requests: int = 0
+    errors: int = 0
+    retries: int = 0
+    cache_hits: int = 0
+    coalesced: int = 0
+    bytes_received: int = 0
+    status_counts: Dict[str, int] = field(default_factory=dict)
+    latency_samples: List[float] = field(default_factory=list)
+    latency_seen: int = 0
+    latency_max: float = 0.0
+
+
+class HttpMetrics:
+    """Thread-safe per-endpoint HTTP counters.
+
+    Tracks requests sent, network errors, retries, status codes, bytes received,
+    disk-cache hits and single-flight coalesced calls. Latency percentiles come
+    from a bounded reservoir sample (`max_samples` per endpoint).
+    """
+
+    def __init__(self, max_samples: int = 2048) -> None:
+        self.max_samples = max_samples
+        self._stats: Dict[str, EndpointStats] = {}
+        self._lock = threading.Lock()
+
+    def _get(self, url: str) -> EndpointStats:
+        key = endpoint_of(url)
+        st = self._stats.get(key)
+        if st is None:
+            st = self._stats[key] = EndpointStats()
+        return st
+
+    def record_response(self, url: str, status: int, latency: float, nbytes: int) -> None:
+        with self._lock:
+            st = self._get(url)
+            st.requests += 1
+            st.bytes_received += nbytes
+            code = str(status)
+            st.status_counts[code] = st.status_counts.get(code, 0) + 1
+            self._sample(st, latency)
+
+    def record_error(self, url: str, latency: float) -> None:
+        """A request that produced no HTTP response (timeout, connection reset...)."""
+        with self._lock:
+            st = self._get(url)
+            st.requests += 1
+            st.errors += 1
+            self._sample(st, latency)
+
+    def record_retry(self, url: str) -> None:
+        with self._lock:
+            self._get(url).retries += 1
+
+    def record_cache_hit(self, url: str) -> None:
+        with self._lock:
+            self._get(url).cache_hits += 1
+
+    def record_coalesced(self, url: str) -> None:
+        with self._lock:
+            self._get(url).coalesced += 1
+
+    def _sample(self, st: EndpointStats, latency: float) -> None:
+        st.latency_seen += 1
+        st.latency_max = max(st.latency_max, latency)
+        if len(st.latency_samples) < self.max_samples:
+            st.latency_samples.append(latency)
+        else:
+            j = random.randrange(st.latency_seen)
+            if j < self.max_samples:
+                st.latency_samples[j] = latency
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        out: Dict[str, Dict[str, Any]] = {}
+        with self._lock:
+            for key, st in sorted(self._stats.items()):
+                lat = sorted(st.latency_samples)
+                out[key] = {
+                    "requests": st.requests,
+                    "errors": st.errors,
+                    "retries": st.retries,
+                    "cache_hits": st.cache_hits,
+                    "coalesced": st.coalesced,
+                    "bytes_received": st.bytes_received,
+                    "status": dict(sorted(st.status_counts.items())),
+                    "latency_ms": {
+                        "p50": round(_percentile(lat, 50) * 1000, 1),
+                        "p90": round(_percentile(lat, 90) * 1000, 1),
+                        "p99": round(_percentile(lat, 99) * 1000, 1),
+                        "max": round(st.latency_max * 1000, 1),
+                    },
+                }
+        return out
+
+    def summary(self) -> str:
+        snap = self.snapshot()
+        if not snap:
+            return "(HTTP 요청 없음)"
+        lines = [
+            f"{'endpoint':<45} {'req':>6} {'err':>5} {'retry':>5} {'cache':>6} {'coal':>5} "
+            f"{'p50ms':>7} {'p90ms':>7} {'p99ms':>7} {'KB':>8}  status"
+        ]
+        for key, s in snap.items():
+            lat = s["latency_ms"]
+            status = " ".join(f"{k}×{v}" for k, v in s["status"].items())
+            lines.append(
+                f"{key:<45} {s['requests']:>6} {s['errors']:>5} {s['retries']:>5} {s['cache_hits']:>6} "
+                f"{s['coalesced']:>5} {lat['p50']:>7} {lat['p90']:>7} {lat['p99']:>7} "
+                f"{s['bytes_received'] / 1024:>8.1f}  {status}"
+            )
+        return "\n".join(lines)
+
+    def to_json(self, indent: Optional[int] = 2) -> str:
+        return json.dumps(self.snapshot(), ensure_ascii=False, indent=indent)
+
+    def write_json(self, path: str) -> None:
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(self.to_json())
@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable, List, TypeVar
+
+A = TypeVar("A")
+R = TypeVar("R")
+
+# Network-bound fan-out; per-host pacing is left to HttpClient's rate limiter.
+DEFAULT_WORKERS = 8
+
+
+def map_ordered(func: Callable[[A], R], items: Iterable[A], workers: int = DEFAULT_WORKERS) -> List[R]:
+    """`list(map(func, items))` on a thread pool; results keep input order.
+
+    The first exception raised by `func` propagates, as with plain `map`.
+    """
+    items = list(items)
+    if workers <= 1 or len(items) <= 1:
+        return [func(it) for it in items]
+    with ThreadPoolExecutor(max_workers=min(workers, len(items)), thread_name_prefix="bka-map") as pool:
+        return list(pool.map(func, items))
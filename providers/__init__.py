@@ -2,9 +2,14 @@ from __future__ import annotations
 
 from .google_suggest import GoogleSuggestProvider
 from .naver_suggest import NaverSuggestProvider
+from .base import PROVIDER_REGISTRY, SuggestProvider, build_providers, bulk_suggest_async, register_provider
 
 __all__ = [
     "GoogleSuggestProvider",
     "NaverSuggestProvider",
+    "PROVIDER_REGISTRY",
+    "SuggestProvider",
+    "build_providers",
+    "bulk_suggest_async",
+    "register_provider",
 ]
-
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Callable, Dict, Iterable, List, Optional, Protocol, runtime_checkable
+
+from ..http import AsyncHttpClient, HttpClient
+from ..journal import Journal, JournaledProvider
+from ..text_utils import unique_ordered
+from .google_suggest import GoogleSuggestProvider
+from .naver_suggest import NaverSuggestProvider
+
+
+@runtime_checkable
+class SuggestProvider(Protocol):
+    """What the scheduler needs from a suggestion source.
+
+    Provider-specific options (e.g. Google's `hl`) are fixed at construction so
+    every provider can be called the same way.
+    """
+
+    name: str
+    BASE_URL: str
+
+    def suggest(self, seed: str) -> List[str]: ...
+
+
+ProviderFactory = Callable[[Optional[HttpClient], str], SuggestProvider]
+
+PROVIDER_REGISTRY: Dict[str, ProviderFactory] = {
+    "naver": lambda http, hl: NaverSuggestProvider(http=http),
+    "google": lambda http, hl: GoogleSuggestProvider(http=http, hl=hl),
+}
+
+
+def register_provider(name: str, factory: ProviderFactory) -> None:
+    """Make a provider selectable by name (`factory(http, hl)` builds it)."""
+    PROVIDER_REGISTRY[name.strip().lower()] = factory
+
+
+def build_providers(
+    names: Iterable[str], http: Optional[HttpClient] = None, hl: str = "ko", journal: Optional[Journal] = None
+) -> List[SuggestProvider]:
+    """Instantiate the selected providers in registry order; unknown names are ignored.
+
+    With a `journal`, each provider answers finished queries from it and
+    journals new ones.
+    """
+    wanted = {n.strip().lower() for n in names}
+    providers = [factory(http, hl) for name, factory in PROVIDER_REGISTRY.items() if name in wanted]
+    if journal is not None:
+        providers = [JournaledProvider(p, journal) for p in providers]
+    return providers
+
+
+async def bulk_suggest_async(provider: SuggestProvider, seeds: Iterable[str], client: AsyncHttpClient) -> List[str]:
+    """Concurrent `bulk_suggest` for any provider; result order matches the sequential version.
+
+    `client` bounds global and per-host concurrency; the provider keeps its own `HttpClient`.
+    """
+    batches = await asyncio.gather(*(client.run(provider.BASE_URL, provider.suggest, seed) for seed in seeds))
+    out: List[str] = []
+    for batch in batches:
+        out.extend(batch)
+    return unique_ordered(out)
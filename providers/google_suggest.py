@@ -2,8 +2,9 @@ from __future__ import annotations
 
 from typing import Iterable, List
 
-from ..http import HttpClient
-from ..text_utils import normalize_query, unique_ordered
+from ..http import HttpClient, rebase_url
+from ..parallel import DEFAULT_WORKERS, map_ordered
+from ..text_utils import normalize_many, unique_ordered
 
 
 class GoogleSuggestProvider:
@@ -12,24 +13,27 @@ class GoogleSuggestProvider:
     Uses the `client=firefox` JSON-compatible API.
     """
 
+    name = "google"
     BASE_URL = "https://suggestqueries.google.com/complete/search"
 
-    def __init__(self, http: HttpClient | None = None) -> None:
+    def __init__(self, http: HttpClient | None = None, hl: str = "ko", base_url: str | None = None) -> None:
         self.http = http or HttpClient()
+        self.hl = hl
+        self.BASE_URL = rebase_url(self.BASE_URL, base_url)
 
-    def suggest(self, seed: str, hl: str = "ko") -> List[str]:
-        params = {"client": "firefox", "q": seed, "hl": hl}
+    def suggest(self, seed: str, hl: str | None = None) -> List[str]:
+        params = {"client": "firefox", "q": seed, "hl": hl or self.hl}
         data = self.http.get_json(self.BASE_URL, params=params)
         # Response shape: [query, [suggest1, suggest2, ...], ...]
         if not isinstance(data, list) or len(data) < 2:
             return []
         suggestions = data[1] or []
-        cleaned = [normalize_query(s) for s in suggestions if isinstance(s, str)]
-        return unique_ordered([s for s in cleaned if s and s != seed])
+        cleaned = normalize_many(s for s in suggestions if isinstance(s, str))
+        return unique_ordered(s for s in cleaned if s != seed)
 
-    def bulk_suggest(self, seeds: Iterable[str], hl: str = "ko") -> List[str]:
+    def bulk_suggest(self, seeds: Iterable[str], hl: str | None = None, workers: int = DEFAULT_WORKERS) -> List[str]:
+        """Suggest for every seed using `workers` threads; output order is the sequential one."""
         out: List[str] = []
-        for seed in seeds:
-            out.extend(self.suggest(seed, hl=hl))
+        for batch in map_ordered(lambda seed: self.suggest(seed, hl=hl), seeds, workers=workers):
+            out.extend(batch)
         return unique_ordered(out)
-
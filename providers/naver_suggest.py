@@ -2,8 +2,9 @@ from __future__ import annotations
 
 from typing import Iterable, List
 
-from ..http import HttpClient
-from ..text_utils import normalize_query, unique_ordered
+from ..http import HttpClient, rebase_url
+from ..parallel import DEFAULT_WORKERS, map_ordered
+from ..text_utils import normalize_many, unique_ordered
 
 
 class NaverSuggestProvider:
@@ -21,10 +22,12 @@ class NaverSuggestProvider:
     Response shape can vary; we parse defensively.
     """
 
+    name = "naver"
     BASE_URL = "https://ac.search.naver.com/nx/ac"
 
-    def __init__(self, http: HttpClient | None = None) -> None:
+    def __init__(self, http: HttpClient | None = None, base_url: str | None = None) -> None:
         self.http = http or HttpClient()
+        self.BASE_URL = rebase_url(self.BASE_URL, base_url)
 
     def suggest(self, seed: str) -> List[str]:
         params = {
@@ -51,12 +54,11 @@ class NaverSuggestProvider:
         except Exception:
             suggestions = []
 
-        cleaned = [normalize_query(s) for s in suggestions]
-        return unique_ordered([s for s in cleaned if s and s != seed])
+        return unique_ordered(s for s in normalize_many(suggestions) if s != seed)
 
-    def bulk_suggest(self, seeds: Iterable[str]) -> List[str]:
+    def bulk_suggest(self, seeds: Iterable[str], workers: int = DEFAULT_WORKERS) -> List[str]:
+        """Suggest for every seed using `workers` threads; output order is the sequential one."""
         out: List[str] = []
-        for seed in seeds:
-            out.extend(self.suggest(seed))
+        for batch in map_ordered(self.suggest, seeds, workers=workers):
+            out.extend(batch)
         return unique_ordered(out)
-
@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+from .expansion import expand_with_suffixes
+from .http import HttpClient
+from .journal import Journal
+from .parallel import DEFAULT_WORKERS, map_ordered
+from .providers import SuggestProvider, build_providers
+from .table import HitCounts, KeywordTable
+from .text_utils import unique_ordered
+from .trie import PrefixTrie
+
+
+# (provider name, query) pairs whose suggest() raised
+Failures = List[Tuple[str, str]]
+
+
+def suggest_or_empty(provider: SuggestProvider, q: str, failed: Optional[Failures] = None) -> List[str]:
+    """`provider.suggest(q)`, or `[]` if it raises (recorded in `failed`).
+
+    One query that still fails after retries, or hits an open circuit, must not
+    abort a whole collection and discard everything gathered so far.
+    """
+    try:
+        return provider.suggest(q)
+    except Exception:
+        if failed is not None:
+            failed.append((provider.name, q))  # list.append is thread-safe
+        return []
+
+
+def query_all(
+    providers: Sequence[SuggestProvider],
+    queries: Sequence[str],
+    workers: int = DEFAULT_WORKERS,
+    failed: Optional[Failures] = None,
+) -> List[List[List[str]]]:
+    """Ask every provider every query on one thread pool; returns `result[query][provider]`.
+
+    A failed (provider, query) answers `[]` and is appended to `failed`.
+    """
+    tasks = [(q, p) for q in range(len(queries)) for p in range(len(providers))]
+    answers = map_ordered(lambda t: suggest_or_empty(providers[t[1]], queries[t[0]], failed), tasks, workers=workers)
+    out: List[List[List[str]]] = [[[] for _ in providers] for _ in queries]
+    for (q, p), suggestions in zip(tasks, answers):
+        out[q][p] = suggestions
+    return out
+
+
+def fan_out(
+    providers: Sequence[SuggestProvider],
+    batches: Sequence[Sequence[str]],
+    workers: int = DEFAULT_WORKERS,
+    failed: Optional[Failures] = None,
+) -> List[List[List[str]]]:
+    """Query every provider for every batch of seeds on one shared thread pool.
+
+    Returns `result[batch][provider]`, each equal to that provider's sequential
+    `bulk_suggest(batch)`, so Naver and Google requests overlap instead of running
+    back to back while the output stays deterministic. A failed (provider, query)
+    contributes nothing and is appended to `failed`.
+    """
+    tasks = [(b, p, q) for b, batch in enumerate(batches) for p in range(len(providers)) for q in batch]
+    answers = map_ordered(lambda t: suggest_or_empty(providers[t[1]], t[2], failed), tasks, workers=workers)
+
+    merged: List[List[List[str]]] = [[[] for _ in providers] for _ in batches]
+    for (b, p, _), suggestions in zip(tasks, answers):
+        merged[b][p].extend(suggestions)
+    return [[unique_ordered(per_provider) for per_provider in per_batch] for per_batch in merged]
+
+
+@dataclass
+class CollectStats:
+    requests: int = 0
+    skipped: List[str] = field(default_factory=list)  # queries not sent because their prefix was saturated
+    failed: Failures = field(default_factory=list)  # (provider, query) pairs that raised; answered as empty
+
+
+def collect_suggestions(
+    seeds: Iterable[str],
+    provider_names: Iterable[str],
+    depth: int = 1,
+    hl: str = "ko",
+    http: Optional[HttpClient] = None,
+    workers: int = DEFAULT_WORKERS,
+    saturation: int = 0,
+    stats: Optional[CollectStats] = None,
+    journal: Optional[Journal] = None,
+) -> Tuple[List[str], HitCounts]:
+    """Collect autocomplete candidates from the selected providers.
+
+    Depth 1 queries the seeds; depth 2 also queries the seeds with long-tail
+    suffixes. All providers are fanned out together, and so are both rounds
+    unless `saturation` > 0: then the seed round runs first and suffix queries
+    that already have `saturation` known completions in the suggestion trie are
+    skipped (listed in `stats.skipped`). Failed requests count as empty answers
+    (listed in `stats.failed`).
+    `hit_counts[kw]` is how many (round, provider) result lists contained `kw`.
+    With a `journal`, finished queries are answered from it (see `Journal`).
+    """
+    seeds = list(seeds)
+    providers = build_providers(provider_names, http=http, hl=hl, journal=journal)
+    stats = stats if stats is not None else CollectStats()
+    table = KeywordTable()
+
+    def _run(batches: List[List[str]]) -> None:
+        stats.requests += sum(len(b) for b in batches) * len(providers)
+        for per_batch in fan_out(providers, batches, workers=workers, failed=stats.failed):
+            for cands in per_batch:
+                for kw in cands:
+                    table.add(kw)
+
+    suffixed = expand_with_suffixes(seeds) if depth >= 2 else []
+    if saturation > 0 and suffixed:
+        _run([seeds])
+        trie = PrefixTrie(table)
+        keep: List[str] = []
+        for q in suffixed:
+            (stats.skipped if trie.is_saturated(q, saturation) else keep).append(q)
+        _run([keep])
+    else:
+        _run([seeds, suffixed] if suffixed else [seeds])
+    return table.keywords, table.hit_counts
@@ -2,9 +2,15 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 import math
-from typing import Dict, Iterable, List
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple
 
-from .text_utils import tokenize
+from .matcher import compiled_matcher
+from .text_utils import split_tokens, tokenize
+
+try:  # Optional: vectorized batch scoring
+    import numpy as np  # type: ignore
+except Exception:  # pragma: no cover - pure-Python fallback
+    np = None  # type: ignore[assignment]
 
 
 COMMERCIAL_MODIFIERS = {
@@ -27,9 +33,25 @@ INFORMATIONAL_MODIFIERS = {
 }
 
 
+# Every modifier as a substring pattern, for text that isn't split into tokens
+MODIFIER_MATCHER = compiled_matcher(list(COMMERCIAL_MODIFIERS) + list(INFORMATIONAL_MODIFIERS))
+
+
+def modifier_terms(text: str) -> List[str]:
+    """Modifiers occurring anywhere in `text`, spacing ignored (`제주여행후기` -> `후기`).
+
+    Scoring itself keeps exact token lookups: for 2~5 token queries two dict hits
+    per token are cheaper than any scan.
+    """
+    return MODIFIER_MATCHER.matched_terms(text)
+
+
 def _length_score(tokens: List[str]) -> float:
+    return _length_score_n(len(tokens))
+
+
+def _length_score_n(n: int) -> float:
     # Favor 2~5 tokens as practical long-tail range
-    n = len(tokens)
     if n <= 1:
         return 0.3
     if 2 <= n <= 5:
@@ -65,7 +87,10 @@ def estimate_competition_score(q: str) -> float:
 
     Lower is better (easier). Returns 0.5~2.5 range approximately.
     """
-    tokens = tokenize(q)
+    return _competition(tokenize(q))
+
+
+def _competition(tokens: List[str]) -> float:
     if len(tokens) <= 1:
         return 2.2  # likely a head term
     score = 1.4
@@ -89,18 +114,162 @@ class KeywordScore:
     provider_hits: int
 
 
-def score_keywords(keywords: Iterable[str], hit_counts: Dict[str, int] | None = None) -> List[KeywordScore]:
-    results: List[KeywordScore] = []
-    hit_counts = hit_counts or {}
-    for kw in keywords:
-        hits = hit_counts.get(kw, 1)
-        d = estimate_demand_score(kw, provider_hits=hits)
-        c = estimate_competition_score(kw)
-        opp = max(d * 1.4 - c, 0.0)
-        results.append(KeywordScore(keyword=kw, demand=round(d, 3), competition=round(c, 3), opportunity=round(opp, 3), provider_hits=hits))
-    # Sort by opportunity desc, then demand desc
-    results.sort(key=lambda x: (x.opportunity, x.demand), reverse=True)
-    return results
+_MODIFIER_TOKENS = frozenset(COMMERCIAL_MODIFIERS) | frozenset(INFORMATIONAL_MODIFIERS)
+
+
+@dataclass
+class KeywordFeatures:
+    """Per-keyword scoring inputs for a candidate list, extracted once per run.
+
+    Every `score_keywords*` variant accepts it as `features=` and then only
+    applies its metric adjustments, rounding and sort; nothing is re-tokenized.
+    The scoring call must get the same keywords (else `ValueError`); its
+    `hit_counts` are not consulted, the record's `hits` are used.
+    Index `i` of each list/array describes `keywords[i]`.
+    """
+
+    keywords: List[str]
+    hits: List[int]
+    n_tokens: List[int]
+    boost: List[float]  # _modifier_boost(tokens)
+    # Keywords with modifier tokens: their exact estimate_competition_score (order-sensitive sums)
+    modified: Dict[int, float]
+    # Heuristic estimate_demand_score / estimate_competition_score (float64 arrays with NumPy, else lists)
+    demand: Any = None
+    competition: Any = None
+
+    def __len__(self) -> int:
+        return len(self.keywords)
+
+
+def extract_features(keywords: Iterable[str], hit_counts: Mapping[str, int] | None = None) -> KeywordFeatures:
+    """Tokenize `keywords` once and precompute the heuristic scores for all of them."""
+    f = _extract_features(keywords, hit_counts or {})
+    f.demand, f.competition = _heuristic_scores(f)
+    return f
+
+
+def _extract_features(keywords: Iterable[str], hit_counts: Mapping[str, int]) -> KeywordFeatures:
+    kws = list(keywords)
+    hits = [hit_counts.get(kw, 1) for kw in kws]
+    n_tokens: List[int] = []
+    boost: List[float] = []
+    modified: Dict[int, float] = {}
+    disjoint = _MODIFIER_TOKENS.isdisjoint
+    for i, kw in enumerate(kws):
+        # Most keywords are seen once per batch, so skip tokenize()'s memo cache
+        tokens = split_tokens(kw)
+        n_tokens.append(len(tokens))
+        if disjoint(tokens):
+            boost.append(1.0)
+        else:
+            boost.append(_modifier_boost(tokens))
+            modified[i] = _competition(tokens)
+    return KeywordFeatures(kws, hits, n_tokens, boost, modified)
+
+
+def _heuristic_scores(f: KeywordFeatures):
+    """`estimate_demand_score`/`estimate_competition_score` for a whole batch.
+
+    Both paths repeat the scalar functions' operations in the same order, so the
+    floats are bit-identical to them. With NumPy the results are float64 arrays,
+    otherwise lists.
+    """
+    if np is None:
+        demand = [
+            min(_length_score_n(n) * b * (1.0 + min(h, 5) * 0.1), 3.0) for n, b, h in zip(f.n_tokens, f.boost, f.hits)
+        ]
+        comp = [
+            f.modified[i] if i in f.modified else 2.2 if n <= 1 else max(0.5, min(1.4 - min(max(n - 2, 0) * 0.12, 0.6), 2.5))
+            for i, n in enumerate(f.n_tokens)
+        ]
+        return demand, comp
+
+    n = np.asarray(f.n_tokens, dtype=np.int64)
+    hits = np.asarray(f.hits, dtype=np.int64)
+    length = np.select([n <= 1, n <= 5, n <= 8], [0.3, 1.0, 0.8], 0.6)
+    base = length * np.asarray(f.boost, dtype=np.float64)
+    base = base * (1.0 + np.minimum(hits, 5) * 0.1)
+    demand = np.minimum(base, 3.0)
+
+    comp = 1.4 - np.minimum(np.maximum(n - 2, 0) * 0.12, 0.6)
+    comp = np.maximum(0.5, np.minimum(comp, 2.5))
+    comp = np.where(n <= 1, 2.2, comp)
+    if f.modified:
+        comp[list(f.modified)] = list(f.modified.values())
+    return demand, comp
+
+
+def _round3(values) -> List[float]:
+    """`[round(v, 3) for v in values]` for a float64 array, without a Python call per value.
+
+    `np.round` only disagrees with the correctly rounded builtin when `v * 1000`
+    lands next to a .5 tie, so exactly those entries are redone with `round`.
+    """
+    out = np.round(values, 3)
+    scaled = values * 1000.0
+    for i in np.flatnonzero(np.abs(scaled - np.floor(scaled) - 0.5) < 1e-6).tolist():
+        out[i] = round(float(values[i]), 3)
+    return out
+
+
+# Per-keyword override of (demand, competition) from real metrics: (d, c, metrics, hits) -> (d, c)
+_Adjust = Callable[[float, float, object, int], Tuple[float, float]]
+
+
+def _score_batch(
+    keywords: Iterable[str],
+    hit_counts: Mapping[str, int] | None,
+    metrics: Mapping[str, object] | None = None,
+    adjust: Optional[_Adjust] = None,
+    features: Optional[KeywordFeatures] = None,
+) -> List[KeywordScore]:
+    if features is None:
+        f = extract_features(keywords, hit_counts)
+    else:
+        f = features
+        # Equal lists of the same string objects compare by identity, so this stays cheap
+        if keywords is not f.keywords and list(keywords) != f.keywords:
+            raise ValueError(
+                f"features were extracted from a different keyword list ({len(f)} keywords); "
+                "pass the same candidates to extract_features and the scoring call"
+            )
+    demand, comp = f.demand, f.competition
+    if metrics and adjust is not None:
+        # Adjust a copy: the same features serve every platform view
+        demand, comp = (list(demand), list(comp)) if isinstance(demand, list) else (demand.copy(), comp.copy())
+        for i, kw in enumerate(f.keywords):
+            m = metrics.get(kw)
+            if m is not None:
+                demand[i], comp[i] = adjust(float(demand[i]), float(comp[i]), m, f.hits[i])
+
+    if not isinstance(demand, list):
+        rd_a, rc_a = _round3(demand), _round3(comp)
+        ro_a = _round3(np.maximum(demand * 1.4 - comp, 0.0))
+        # Stable ascending sort on negated keys == sort(reverse=True) keeping input order on ties
+        order = np.lexsort((-rd_a, -ro_a)).tolist()
+        rd, rc, ro = rd_a.tolist(), rc_a.tolist(), ro_a.tolist()
+    else:
+        rd = [round(d, 3) for d in demand]
+        rc = [round(c, 3) for c in comp]
+        ro = [round(max(d * 1.4 - c, 0.0), 3) for d, c in zip(demand, comp)]
+        order = sorted(range(len(rd)), key=lambda i: (ro[i], rd[i]), reverse=True)
+
+    kws, hits = f.keywords, f.hits
+    return [
+        KeywordScore(keyword=kws[i], demand=rd[i], competition=rc[i], opportunity=ro[i], provider_hits=hits[i])
+        for i in order
+    ]
+
+
+def score_keywords(
+    keywords: Iterable[str],
+    hit_counts: Mapping[str, int] | None = None,
+    features: Optional[KeywordFeatures] = None,
+) -> List[KeywordScore]:
+    # Sorted by opportunity desc, then demand desc.
+    # With `features` (from extract_features(keywords, hit_counts)) nothing is re-extracted.
+    return _score_batch(keywords, hit_counts, features=features)
 
 
 def _comp_from_results(total: int) -> float:
@@ -110,125 +279,106 @@ def _comp_from_results(total: int) -> float:
     return max(0.6, min(2.3, 0.7 + (math.log10(total + 1) * 0.25)))
 
 
+def _adjust_with_metrics(d: float, c: float, m: object, hits: int) -> Tuple[float, float]:
+    # Demand by monthly volumes
+    try:
+        monthly_pc = getattr(m, "naver_monthly_pc", None)
+        monthly_mob = getattr(m, "naver_monthly_mobile", None)
+        cpc = getattr(m, "naver_cpc", None)
+        monthly_sum = (monthly_pc or 0) + (monthly_mob or 0)
+        if monthly_sum > 0:
+            # Log scale volume to 0.6~3.0
+            d = min(3.0, 0.6 + math.log10(1 + monthly_sum) * 0.6 + min(hits, 5) * 0.05)
+            if isinstance(cpc, (int, float)) and cpc > 0:
+                # Small boost for higher CPC
+                d = min(3.0, d + min(cpc / 5000.0, 0.3))
+    except Exception:
+        pass
+
+    # Competition by results count
+    try:
+        nav_tot = getattr(m, "naver_blog_total", None)
+        g_tot = getattr(m, "google_total", None)
+        comps = []
+        if isinstance(nav_tot, int):
+            comps.append(_comp_from_results(nav_tot))
+        if isinstance(g_tot, int):
+            comps.append(_comp_from_results(g_tot))
+        if comps:
+            # average, keep within 0.5~2.5
+            c = max(0.5, min(sum(comps) / len(comps), 2.5))
+    except Exception:
+        pass
+    return d, c
+
+
 def score_keywords_with_metrics(
     keywords: Iterable[str],
-    hit_counts: Dict[str, int] | None,
+    hit_counts: Mapping[str, int] | None,
     metrics: Dict[str, object],
+    features: Optional[KeywordFeatures] = None,
 ) -> List[KeywordScore]:
     """Score with optional real metrics.
 
     metrics is a mapping from keyword to an object that may expose attributes:
       - naver_monthly_pc, naver_monthly_mobile, naver_cpc
       - naver_blog_total, google_total
-    Falls back to heuristic where data is missing.
+    Falls back to heuristic where data is missing. Pass `features` to reuse an
+    `extract_features` result for the same keywords.
     """
-    hit_counts = hit_counts or {}
-    results: List[KeywordScore] = []
-    for kw in keywords:
-        hits = hit_counts.get(kw, 1)
-        base_demand = estimate_demand_score(kw, provider_hits=hits)
-        base_comp = estimate_competition_score(kw)
-
-        m = metrics.get(kw)
-        d = base_demand
-        c = base_comp
-        if m is not None:
-            # Demand by monthly volumes
-            try:
-                monthly_pc = getattr(m, "naver_monthly_pc", None)
-                monthly_mob = getattr(m, "naver_monthly_mobile", None)
-                cpc = getattr(m, "naver_cpc", None)
-                monthly_sum = (monthly_pc or 0) + (monthly_mob or 0)
-                if monthly_sum > 0:
-                    # Log scale volume to 0.6~3.0
-                    d = min(3.0, 0.6 + math.log10(1 + monthly_sum) * 0.6 + min(hits, 5) * 0.05)
-                    if isinstance(cpc, (int, float)) and cpc > 0:
-                        # Small boost for higher CPC
-                        d = min(3.0, d + min(cpc / 5000.0, 0.3))
-            except Exception:
-                pass
-
-            # Competition by results count
-            try:
-                nav_tot = getattr(m, "naver_blog_total", None)
-                g_tot = getattr(m, "google_total", None)
-                comps = []
-                if isinstance(nav_tot, int):
-                    comps.append(_comp_from_results(nav_tot))
-                if isinstance(g_tot, int):
-                    comps.append(_comp_from_results(g_tot))
-                if comps:
-                    # average, keep within 0.5~2.5
-                    c = max(0.5, min(sum(comps) / len(comps), 2.5))
-            except Exception:
-                pass
-
-        opp = max(d * 1.4 - c, 0.0)
-        results.append(KeywordScore(keyword=kw, demand=round(d, 3), competition=round(c, 3), opportunity=round(opp, 3), provider_hits=hits))
-
-    results.sort(key=lambda x: (x.opportunity, x.demand), reverse=True)
-    return results
+    return _score_batch(keywords, hit_counts, metrics, _adjust_with_metrics, features)
+
+
+def _adjust_naver(d: float, c: float, m: object, hits: int) -> Tuple[float, float]:
+    # Demand: strong effect of monthly volume + CPC
+    try:
+        monthly_sum = (getattr(m, "naver_monthly_pc", 0) or 0) + (getattr(m, "naver_monthly_mobile", 0) or 0)
+        cpc = getattr(m, "naver_cpc", None)
+        if monthly_sum > 0:
+            d = min(3.0, 0.7 + math.log10(1 + monthly_sum) * 0.7 + min(hits, 5) * 0.05)
+            if isinstance(cpc, (int, float)) and cpc > 0:
+                d = min(3.0, d + min(cpc / 4000.0, 0.35))
+    except Exception:
+        pass
+    # Competition: prioritize Naver blog total
+    try:
+        nav_tot = getattr(m, "naver_blog_total", None)
+        if isinstance(nav_tot, int):
+            c = max(0.5, min(_comp_from_results(nav_tot), 2.5))
+    except Exception:
+        pass
+    return d, c
+
+
+def _adjust_tistory(d: float, c: float, m: object, hits: int) -> Tuple[float, float]:
+    # Demand: emphasize long-tail and slight vol influence
+    try:
+        monthly_sum = (getattr(m, "naver_monthly_pc", 0) or 0) + (getattr(m, "naver_monthly_mobile", 0) or 0)
+        if monthly_sum > 0:
+            d = min(3.0, d + min(math.log10(1 + monthly_sum) * 0.25, 0.5))
+    except Exception:
+        pass
+    # Competition: prioritize Google results (SERP breadth)
+    try:
+        g_tot = getattr(m, "google_total", None)
+        if isinstance(g_tot, int):
+            c = max(0.5, min(_comp_from_results(g_tot), 2.5))
+    except Exception:
+        pass
+    return d, c
 
 
 def score_keywords_by_platform(
     keywords: Iterable[str],
-    hit_counts: Dict[str, int] | None,
+    hit_counts: Mapping[str, int] | None,
     metrics: Dict[str, object] | None,
     platform: str = "naver",
+    features: Optional[KeywordFeatures] = None,
 ) -> List[KeywordScore]:
     """Platform-aware scoring.
 
     - naver: competition 우선 Naver 블로그 문서 수, 수요는 네이버 월간 볼륨 비중↑
     - tistory: 경쟁도는 Google 결과 수 비중↑, 수요는 롱테일/정보성 비중 및 볼륨 소폭 반영
     """
-    platform = platform.lower()
-    hit_counts = hit_counts or {}
-    metrics = metrics or {}
-    results: List[KeywordScore] = []
-
-    for kw in keywords:
-        hits = hit_counts.get(kw, 1)
-        # base heuristic
-        d = estimate_demand_score(kw, provider_hits=hits)
-        c = estimate_competition_score(kw)
-
-        m = metrics.get(kw)
-        if platform == "naver":
-            # Demand: strong effect of monthly volume + CPC
-            try:
-                monthly_sum = ((getattr(m, "naver_monthly_pc", 0) or 0) + (getattr(m, "naver_monthly_mobile", 0) or 0)) if m else 0
-                cpc = getattr(m, "naver_cpc", None) if m else None
-                if monthly_sum > 0:
-                    d = min(3.0, 0.7 + math.log10(1 + monthly_sum) * 0.7 + min(hits, 5) * 0.05)
-                    if isinstance(cpc, (int, float)) and cpc > 0:
-                        d = min(3.0, d + min(cpc / 4000.0, 0.35))
-            except Exception:
-                pass
-            # Competition: prioritize Naver blog total
-            try:
-                nav_tot = getattr(m, "naver_blog_total", None) if m else None
-                if isinstance(nav_tot, int):
-                    c = max(0.5, min(_comp_from_results(nav_tot), 2.5))
-            except Exception:
-                pass
-        else:  # tistory
-            # Demand: emphasize long-tail and slight vol influence
-            try:
-                monthly_sum = ((getattr(m, "naver_monthly_pc", 0) or 0) + (getattr(m, "naver_monthly_mobile", 0) or 0)) if m else 0
-                if monthly_sum > 0:
-                    d = min(3.0, d + min(math.log10(1 + monthly_sum) * 0.25, 0.5))
-            except Exception:
-                pass
-            # Competition: prioritize Google results (SERP breadth)
-            try:
-                g_tot = getattr(m, "google_total", None) if m else None
-                if isinstance(g_tot, int):
-                    c = max(0.5, min(_comp_from_results(g_tot), 2.5))
-            except Exception:
-                pass
-
-        opp = max(d * 1.4 - c, 0.0)
-        results.append(KeywordScore(keyword=kw, demand=round(d, 3), competition=round(c, 3), opportunity=round(opp, 3), provider_hits=hits))
-
-    results.sort(key=lambda x: (x.opportunity, x.demand), reverse=True)
-    return results
+    adjust = _adjust_naver if platform.lower() == "naver" else _adjust_tistory
+    return _score_batch(keywords, hit_counts, metrics, adjust, features)
@@ -0,0 +1,245 @@
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import random
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+
+# Tails mixed into synthetic suggestions; includes the scoring modifiers so results rank like real ones
+SYNTHETIC_TAILS = [
+    "후기", "가격", "추천", "방법", "코스", "맛집", "예약", "비교",
+    "가이드", "리뷰", "할인", "일정", "주차", "시간", "근처", "사진",
+]
+
+
+@dataclass
+class StandInConfig:
+    """Behaviour of the stand-in server.
+
+    - `latency`/`jitter`: seconds added to every response (uniform `latency ± jitter`)
+    - `error_rate`: share of requests answered with one of `error_statuses`
+    - `retry_after`: `Retry-After` seconds sent with injected 429/503 (None = omit)
+    - `suggestions`: suggestions per autocomplete query
+    - `seed`: seeds latency and error injection; suggestions and metrics depend only on the query
+    """
+
+    latency: float = 0.0
+    jitter: float = 0.0
+    error_rate: float = 0.0
+    error_statuses: Tuple[int, ...] = (429, 500, 503)
+    retry_after: Optional[float] = None
+    suggestions: int = 8
+    seed: int = 0
+
+
+def _digest(text: str) -> int:
+    return int.from_bytes(hashlib.sha256(text.encode("utf-8")).digest()[:8], "big")
+
+
+def synthetic_suggestions(query: str, n: int = 8) -> List[str]:
+    """Deterministic autocomplete answers for `query` (same input, same output)."""
+    q = " ".join(query.split())
+    if not q:
+        return []
+    start = _digest(q) % len(SYNTHETIC_TAILS)
+    tails = [SYNTHETIC_TAILS[(start + i * 3) % len(SYNTHETIC_TAILS)] for i in range(min(n, len(SYNTHETIC_TAILS)))]
+    return [f"{q} {t}" for t in tails]
+
+
+def synthetic_volume(keyword: str) -> int:
+    """Deterministic pseudo search volume; shorter keywords get more."""
+    return (_digest(keyword) % 5000 + 10) * 60 // max(len(keyword.split()), 1)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server: "StandInServer"
+    protocol_version = "HTTP/1.1"  # keep-alive, like the real endpoints
+    # Small responses on a kept-alive socket would otherwise wait on Nagle + delayed ACK (~40ms)
+    disable_nagle_algorithm = True
+
+    def log_message(self, format: str, *args: Any) -> None:  # noqa: A002 - stdlib signature
+        pass
+
+    def do_GET(self) -> None:  # noqa: N802 - stdlib naming
+        parts = urlsplit(self.path)
+        params = {k: v[0] for k, v in parse_qs(parts.query).items()}
+        route = ROUTES.get(parts.path)
+        self.server.count(parts.path)
+        self.server.delay()
+        if route is None:
+            return self._send(404, {"error": "not found"})
+        injected = self.server.injected_status()
+        if injected is not None:
+            headers = {}
+            if injected in (429, 503) and self.server.config.retry_after is not None:
+                headers["Retry-After"] = f"{self.server.config.retry_after:g}"
+            return self._send(injected, {"error": "injected"}, headers)
+        status, body = route(self, params)
+        self._send(status, body)
+
+    def _send(self, status: int, body: Any, headers: Optional[Dict[str, str]] = None) -> None:
+        raw = json.dumps(body, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(raw)))
+        for k, v in (headers or {}).items():
+            self.send_header(k, v)
+        self.end_headers()
+        self.wfile.write(raw)
+
+
+def _naver_ac(h: _Handler, params: Dict[str, str]) -> Tuple[int, Any]:
+    q = params.get("q", "")
+    return 200, {"query": [q], "items": [[q, synthetic_suggestions(q, h.server.config.suggestions)]]}
+
+
+def _google_suggest(h: _Handler, params: Dict[str, str]) -> Tuple[int, Any]:
+    q = params.get("q", "")
+    return 200, [q, synthetic_suggestions(q, h.server.config.suggestions), [], {}]
+
+
+def _naver_blog(h: _Handler, params: Dict[str, str]) -> Tuple[int, Any]:
+    if not h.headers.get("X-Naver-Client-Id") or not h.headers.get("X-Naver-Client-Secret"):
+        return 401, {"errorMessage": "Not Exist Client ID", "errorCode": "024"}
+    q = params.get("query", "")
+    return 200, {"total": synthetic_volume(q) * 7, "start": 1, "display": int(params.get("display", 10)), "items": []}
+
+
+def _customsearch(h: _Handler, params: Dict[str, str]) -> Tuple[int, Any]:
+    if not params.get("key") or not params.get("cx"):
+        return 400, {"error": {"code": 400, "message": "Missing key or cx"}}
+    q = params.get("q", "")
+    return 200, {"searchInformation": {"totalResults": str(synthetic_volume(q) * 31)}, "items": []}
+
+
+def _keywordstool(h: _Handler, params: Dict[str, str]) -> Tuple[int, Any]:
+    if not all(h.headers.get(k) for k in ("X-API-KEY", "X-Customer", "X-Signature", "X-Timestamp")):
+        return 403, {"title": "Forbidden", "detail": "Invalid signature"}
+    kws = [k for k in params.get("hintKeywords", "").split(",") if k]
+    rows = []
+    for kw in kws:
+        vol = synthetic_volume(kw)
+        rows.append(
+            {
+                "relKeyword": kw,
+                "monthlyPcQcCnt": vol // 3,
+                "monthlyMobileQcCnt": vol - vol // 3,
+                "plAvgCpc": float(_digest(kw) % 2000 + 50),
+            }
+        )
+    return 200, {"keywordList": rows}
+
+
+ROUTES = {
+    "/nx/ac": _naver_ac,
+    "/complete/search": _google_suggest,
+    "/v1/search/blog.json": _naver_blog,
+    "/customsearch/v1": _customsearch,
+    "/keywordstool": _keywordstool,
+}
+
+
+class StandInServer(ThreadingHTTPServer):
+    """Local stand-in for the suggest and enrichment endpoints, served on one port.
+
+    Point the clients at it with `base_url=server.base_url` (or `BKA_BASE_URL`);
+    request paths are the real ones, so `rebase_url` keeps them. `hits` counts
+    requests per path. Use as a context manager to serve on a background thread.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, config: Optional[StandInConfig] = None) -> None:
+        super().__init__((host, port), _Handler)
+        self.config = config or StandInConfig()
+        self.hits: Counter = Counter()
+        self._rng = random.Random(self.config.seed)
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def count(self, path: str) -> None:
+        with self._lock:
+            self.hits[path] += 1
+
+    def delay(self) -> None:
+        cfg = self.config
+        if cfg.latency <= 0 and cfg.jitter <= 0:
+            return
+        with self._lock:
+            extra = self._rng.uniform(-cfg.jitter, cfg.jitter) if cfg.jitter > 0 else 0.0
+        time.sleep(max(0.0, cfg.latency + extra))
+
+    def injected_status(self) -> Optional[int]:
+        cfg = self.config
+        if cfg.error_rate <= 0 or not cfg.error_statuses:
+            return None
+        with self._lock:
+            if self._rng.random() >= cfg.error_rate:
+                return None
+            return self._rng.choice(cfg.error_statuses)
+
+    def start(self) -> "StandInServer":
+        self._thread = threading.Thread(target=self.serve_forever, name="bka-standin", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.shutdown()
+        self.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> "StandInServer":
+        return self.start()
+
+    def __exit__(self, *exc: object) -> None:
+        self.stop()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    p = argparse.ArgumentParser(description="Naver/Google 제안어·보강 API를 흉내 내는 로컬 서버(부하·동시성 테스트용)")
+    p.add_argument("--host", default="127.0.0.1")
+    p.add_argument("--port", type=int, default=8765)
+    p.add_argument("--latency", type=float, default=0.0, help="응답당 지연(초)")
+    p.add_argument("--jitter", type=float, default=0.0, help="지연 편차(초, ±)")
+    p.add_argument("--error-rate", type=float, default=0.0, help="오류 응답 비율(0~1)")
+    p.add_argument("--error-statuses", default="429,500,503", help="주입할 상태 코드 목록")
+    p.add_argument("--retry-after", type=float, default=None, help="429/503에 붙일 Retry-After(초)")
+    p.add_argument("--suggestions", type=int, default=8, help="질의당 제안어 수")
+    p.add_argument("--seed", type=int, default=0, help="지연/오류 주입 난수 시드")
+    args = p.parse_args(argv)
+    config = StandInConfig(
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        error_statuses=tuple(int(s) for s in args.error_statuses.split(",") if s.strip()),
+        retry_after=args.retry_after,
+        suggestions=args.suggestions,
+        seed=args.seed,
+    )
+    server = StandInServer(args.host, args.port, config)
+    print(f"[i] 스탠드인 서버 실행 중: {server.base_url} (BKA_BASE_URL={server.base_url} 로 지정)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
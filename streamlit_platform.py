@@ -2,9 +2,10 @@ from __future__ import annotations
 
 import csv
 import io
+from itertools import chain
 import os
 import sys
-from typing import Dict, List, Tuple
+from typing import Dict, List, Mapping, Tuple
 
 import streamlit as st
 
@@ -14,56 +15,37 @@ if _SRC_ROOT not in sys.path:
     sys.path.insert(0, _SRC_ROOT)
 
 from blog_keyword_analyzer.env import load_env  # type: ignore
-from blog_keyword_analyzer.expansion import expand_with_profile, expand_with_suffixes  # type: ignore
+from blog_keyword_analyzer.expansion import iter_expand_with_profile, iter_expand_with_suffixes  # type: ignore
 from blog_keyword_analyzer.outline import build_outline  # type: ignore
+from blog_keyword_analyzer.cache import cache_from_env  # type: ignore
+from blog_keyword_analyzer.http import HttpClient  # type: ignore
+from blog_keyword_analyzer.scheduler import collect_suggestions  # type: ignore
 from blog_keyword_analyzer.providers import GoogleSuggestProvider, NaverSuggestProvider  # type: ignore
 from blog_keyword_analyzer.scoring import (  # type: ignore
     KeywordScore,
+    extract_features,
     score_keywords,
     score_keywords_by_platform,
 )
-from blog_keyword_analyzer.text_utils import normalize_query, unique_ordered  # type: ignore
+from blog_keyword_analyzer.text_utils import normalize_many, unique_ordered  # type: ignore
+from blog_keyword_analyzer.dedup import enrich_collapsed  # type: ignore
 from blog_keyword_analyzer.enrichers import (  # type: ignore
     build_enrichers_from_env,
-    enrich_keywords,
     EnrichedMetrics,
 )
 
 
+@st.cache_resource(show_spinner=False)
+def shared_http() -> HttpClient:
+    """One HttpClient per server process, shared by collection, enrichment and trends."""
+    return HttpClient(cache=cache_from_env())
+
+
 @st.cache_data(show_spinner=False, ttl=30)
 def collect_suggestions_cached(
     seeds: List[str], provider_names: List[str], depth: int, hl: str, nonce: int = 0
-) -> Tuple[List[str], Dict[str, int]]:
-    provider_names = [p.strip().lower() for p in provider_names]
-    providers = []
-    if "naver" in provider_names:
-        providers.append(NaverSuggestProvider())
-    if "google" in provider_names:
-        providers.append(GoogleSuggestProvider())
-
-    all_candidates: List[str] = []
-    hit_counts: Dict[str, int] = {}
-
-    def _accumulate(cands: List[str]) -> None:
-        for kw in cands:
-            all_candidates.append(kw)
-            hit_counts[kw] = hit_counts.get(kw, 0) + 1
-
-    for p in providers:
-        if isinstance(p, GoogleSuggestProvider):
-            _accumulate(p.bulk_suggest(seeds, hl=hl))
-        else:
-            _accumulate(p.bulk_suggest(seeds))
-
-    if depth >= 2:
-        suffix_expanded = expand_with_suffixes(seeds)
-        for p in providers:
-            if isinstance(p, GoogleSuggestProvider):
-                _accumulate(p.bulk_suggest(suffix_expanded, hl=hl))
-            else:
-                _accumulate(p.bulk_suggest(suffix_expanded))
-
-    return unique_ordered(all_candidates), hit_counts
+) -> Tuple[List[str], Mapping[str, int]]:
+    return collect_suggestions(seeds, provider_names, depth=depth, hl=hl, http=shared_http())
 
 
 def to_rows(scores: List[KeywordScore], metrics: Dict[str, EnrichedMetrics] | None) -> List[dict]:
@@ -137,7 +119,7 @@ def main() -> None:
     run = st.button("실행")
 
     if run:
-        seeds = [normalize_query(s) for s in seeds_text.splitlines() if normalize_query(s)]
+        seeds = normalize_many(seeds_text.splitlines())
         if not seeds:
             st.warning("시드 키워드를 1개 이상 입력하세요.")
             return
@@ -159,28 +141,30 @@ def main() -> None:
                 return
 
         if profile:
-            candidates = unique_ordered(candidates + expand_with_profile(seeds, profile))
+            candidates = unique_ordered(chain(candidates, iter_expand_with_profile(seeds, profile)))
         elif include_suffix:
-            candidates = unique_ordered(candidates + expand_with_suffixes(seeds))
+            candidates = unique_ordered(chain(candidates, iter_expand_with_suffixes(seeds)))
         if limit:
             candidates = candidates[: int(limit)]
 
         st.info(f"후보 {len(candidates)}개 점수화 중...")
         metrics_map: Dict[str, EnrichedMetrics] | None = None
         if enrich:
-            enrichers = build_enrichers_from_env()
+            enrichers = build_enrichers_from_env(http=shared_http())
             if not enrichers:
                 st.warning("ENV에 API 키가 없어 휴리스틱으로 진행합니다(.env를 설정하세요).")
-            metrics_map = enrich_keywords(candidates, enrichers, limit=int(enrich_limit))
+            metrics_map, _ = enrich_collapsed(candidates, enrichers, limit=int(enrich_limit), hit_counts=hit_counts)
 
         if not platforms:
             platforms = ["naver", "tistory"]
+        # One tokenization pass shared by every platform tab
+        features = extract_features(candidates, hit_counts)
         scored: Dict[str, List[KeywordScore]] = {}
         for pf in platforms:
             if metrics_map is not None:
-                scored[pf] = score_keywords_by_platform(candidates, hit_counts=hit_counts, metrics=metrics_map, platform=pf)
+                scored[pf] = score_keywords_by_platform(candidates, hit_counts=hit_counts, metrics=metrics_map, platform=pf, features=features)
             else:
-                scored[pf] = score_keywords(candidates, hit_counts=hit_counts)
+                scored[pf] = score_keywords(candidates, hit_counts=hit_counts, features=features)
 
         tabs = st.tabs([pf.upper() for pf in platforms])
         for i, pf in enumerate(platforms):
@@ -215,10 +199,10 @@ def main() -> None:
         google_only = []
         try:
             if "naver" in providers_use:
-                nav = NaverSuggestProvider()
+                nav = NaverSuggestProvider(http=shared_http())
                 naver_only = nav.bulk_suggest(seeds)
             if "google" in providers_use:
-                ggl = GoogleSuggestProvider()
+                ggl = GoogleSuggestProvider(http=shared_http())
                 google_only = ggl.bulk_suggest(seeds, hl="ko")
         except Exception:
             pass
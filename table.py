@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+from array import array
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional
+
+
+class KeywordTable:
+    """Interned keywords with dense integer ids and an id-indexed hit-count array.
+
+    Each distinct keyword is stored once, the first time it is seen, and later
+    duplicates (e.g. the same suggestion parsed from another provider) are
+    dropped right away. Ids follow first-seen order, so `keywords` is also the
+    `unique_ordered` candidate list. Resolve ids to strings only at output time.
+    """
+
+    def __init__(self, keywords: Iterable[str] = ()) -> None:
+        self.keywords: List[str] = []
+        self._ids: Dict[str, int] = {}
+        self.hits = array("I")
+        for kw in keywords:
+            self.add(kw)
+
+    def __len__(self) -> int:
+        return len(self.keywords)
+
+    def __contains__(self, kw: object) -> bool:
+        return kw in self._ids
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.keywords)
+
+    def __getitem__(self, kid: int) -> str:
+        return self.keywords[kid]
+
+    def get_id(self, kw: str) -> Optional[int]:
+        return self._ids.get(kw)
+
+    def id_of(self, kw: str) -> int:
+        """Id of `kw`, assigning the next one (with 0 hits) if it is new."""
+        kid = self._ids.get(kw)
+        if kid is None:
+            kid = len(self.keywords)
+            self._ids[kw] = kid
+            self.keywords.append(kw)
+            self.hits.append(0)
+        return kid
+
+    def add(self, kw: str, hits: int = 1) -> int:
+        """Count `hits` more sightings of `kw`; returns its id."""
+        kid = self.id_of(kw)
+        self.hits[kid] += hits
+        return kid
+
+    @property
+    def hit_counts(self) -> "HitCounts":
+        return HitCounts(self)
+
+
+class HitCounts(Mapping[str, int]):
+    """`Dict[str, int]`-like view of a table's hit counts (what scoring expects).
+
+    Assigning a count to a new keyword adds it to the table.
+    """
+
+    def __init__(self, table: KeywordTable) -> None:
+        self.table = table
+
+    def __getitem__(self, kw: str) -> int:
+        kid = self.table.get_id(kw)
+        if kid is None:
+            raise KeyError(kw)
+        return self.table.hits[kid]
+
+    def get(self, kw: str, default: Optional[int] = None) -> Optional[int]:  # type: ignore[override]
+        kid = self.table.get_id(kw)
+        return default if kid is None else self.table.hits[kid]
+
+    def __setitem__(self, kw: str, n: int) -> None:
+        self.table.hits[self.table.id_of(kw)] = n
+
+    def __contains__(self, kw: object) -> bool:
+        return kw in self.table
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.table.keywords)
+
+    def __len__(self) -> int:
+        return len(self.table)
+
+    def __repr__(self) -> str:
+        return f"HitCounts({dict(self)!r})"
@@ -0,0 +1,55 @@
+import os
+
+from blog_keyword_analyzer.cache import ResponseCache, request_key
+from blog_keyword_analyzer.http import HttpClient, RateLimiter, SingleFlight
+
+
+class _FakeResponse:
+    status_code = 200
+    encoding = "utf-8"
+    content = b"{}"
+    headers: dict = {}
+
+    def __init__(self, text: str) -> None:
+        self.text = text
+
+    def raise_for_status(self) -> None:
+        pass
+
+
+def test_request_key_ignores_param_order():
+    assert request_key("https://a/x", {"q": "제주", "st": 100}) == request_key("https://a/x", {"st": "100", "q": "제주"})
+
+
+def test_cache_roundtrip_ttl_and_eviction(tmp_path):
+    cache = ResponseCache(str(tmp_path / "c.sqlite"), ttls={"a.example": 60, "b.example": 0}, max_bytes=10_000)
+    cache.set("https://a.example/x", {"q": "1"}, "본문" * 10)
+    assert cache.get("https://a.example/x", {"q": "1"}) == "본문" * 10
+    cache.set("https://b.example/x", None, "never stored")
+    assert cache.get("https://b.example/x") is None
+
+    # Incompressible bodies overflow the budget; least recently used entries are evicted
+    for i in range(20):
+        cache.set("https://a.example/big", {"i": i}, os.urandom(800).hex())
+    assert cache.get("https://a.example/x", {"q": "1"}) is None
+    assert cache.get("https://a.example/big", {"i": 19}) is not None
+    cache.close()
+
+
+def test_http_client_serves_repeat_requests_from_cache(tmp_path):
+    calls = []
+    client = HttpClient(
+        rate_limiter=RateLimiter(),
+        cache=ResponseCache(str(tmp_path / "c.sqlite")),
+        single_flight=SingleFlight(ttl=0),  # so the repeat reaches the cache instead of being coalesced
+    )
+
+    def fake_get(url, params=None, headers=None, timeout=None):
+        calls.append(url)
+        return _FakeResponse('{"items": [1, 2]}')
+
+    client.session.get = fake_get  # type: ignore[assignment]
+    assert client.get_json("https://ac.search.naver.com/nx/ac", {"q": "a"}) == {"items": [1, 2]}
+    assert client.get_json("https://ac.search.naver.com/nx/ac", {"q": "a"}) == {"items": [1, 2]}
+    assert len(calls) == 1
+    assert client.metrics.snapshot()["ac.search.naver.com/nx/ac"]["cache_hits"] == 1
@@ -0,0 +1,45 @@
+import pytest
+
+from blog_keyword_analyzer.cassette import Cassette, CassetteMiss
+from blog_keyword_analyzer.http import CircuitBreaker, HttpClient, RateLimiter, SingleFlight
+from blog_keyword_analyzer.providers import GoogleSuggestProvider
+
+
+class _Resp:
+    status_code = 200
+    encoding = "utf-8"
+    content = b"{}"
+    headers = {"Content-Type": "application/json"}
+    text = '["제주", ["제주 여행", "제주 맛집"]]'
+
+    def raise_for_status(self) -> None:
+        pass
+
+
+def _client(cassette):
+    return HttpClient(
+        rate_limiter=RateLimiter(),
+        circuit_breaker=CircuitBreaker(),
+        single_flight=SingleFlight(ttl=0),
+        cassette=cassette,
+    )
+
+
+def test_record_then_replay_without_network(tmp_path):
+    path = str(tmp_path / "run.jsonl")
+    live = _client(Cassette(path, mode="record"))
+    live.session.get = lambda url, params=None, headers=None, timeout=None: _Resp()  # type: ignore[assignment]
+    recorded = GoogleSuggestProvider(http=live).suggest("제주")
+    live.get_json("https://www.googleapis.com/customsearch/v1", {"key": "SECRET", "q": "제주"})
+    assert "SECRET" not in open(path, encoding="utf-8").read()
+
+    offline = _client(Cassette(path, mode="replay"))
+
+    def no_network(*args, **kwargs):
+        raise AssertionError("network used during replay")
+
+    offline.session.get = no_network  # type: ignore[assignment]
+    assert GoogleSuggestProvider(http=offline).suggest("제주") == recorded == ["제주 여행", "제주 맛집"]
+    assert offline.get_json("https://www.googleapis.com/customsearch/v1", {"key": "OTHER", "q": "제주"})
+    with pytest.raises(CassetteMiss):
+        GoogleSuggestProvider(http=offline).suggest("부산")
@@ -0,0 +1,105 @@
+from blog_keyword_analyzer.crawl import alphabet_soup, crawl_prioritized, crawl_suggestions
+from blog_keyword_analyzer.expansion import COMMON_SYLLABLES
+from blog_keyword_analyzer.scoring import score_keywords
+
+
+class _TreeProvider:
+    """Each query q suggests q+"a" and q+"b" until length 4, so levels grow 2x."""
+
+    name = "tree"
+    BASE_URL = "https://fake.example/ac"
+
+    def __init__(self):
+        self.calls = []
+
+    def suggest(self, seed):
+        self.calls.append(seed)
+        return [seed + c for c in "ab"] if len(seed) < 4 else []
+
+
+def test_crawl_expands_levels_until_no_new_keywords():
+    p = _TreeProvider()
+    res = crawl_suggestions(["x"], [p], max_depth=10, budget=1000, workers=1)
+    assert res.stats.new_per_level == [2, 4, 8, 0]
+    assert res.stats.stop_reason == "no new keywords"
+    assert len(res.candidates) == 14
+    assert len(p.calls) == len(set(p.calls)) == res.stats.requests
+
+
+def test_crawl_respects_budget_and_fanout():
+    p = _TreeProvider()
+    res = crawl_suggestions(["x"], [p], max_depth=10, budget=5, fanout=3, workers=1)
+    assert res.stats.queries_per_level == [1, 2, 2]
+    assert res.stats.requests == 5
+    assert res.stats.stop_reason == "budget"
+
+
+class _BrokenBranchProvider(_TreeProvider):
+    def suggest(self, seed):
+        if seed == "xa":
+            raise ConnectionError("circuit open")
+        return super().suggest(seed)
+
+
+def test_crawls_survive_a_failing_query():
+    for run in (crawl_suggestions, crawl_prioritized):
+        res = run(["x"], [_BrokenBranchProvider()], max_depth=10, budget=1000, workers=4)
+        assert res.stats.failed == [("tree", "xa")]
+        assert "xbb" in res.candidates and "xaa" not in res.candidates
+
+
+class _SoupProvider:
+    """Only the ㄱ branch (and its syllables) returns anything new."""
+
+    name = "soup"
+    BASE_URL = "https://fake.example/ac"
+
+    def suggest(self, seed):
+        tail = seed.split(" ")[-1]
+        if tail == "ㄱ":
+            return ["제주 가볼만한곳", "제주 고기국수"]
+        if tail in ("가", "고"):
+            return [f"제주 {tail} 신상"]
+        return ["제주 가볼만한곳"]
+
+
+def test_alphabet_soup_prunes_unproductive_branches():
+    res = alphabet_soup(["제주"], [_SoupProvider()], budget=10_000, workers=1)
+    # level 1 = 14 initials + 26 letters; only ㄱ surfaced anything new, so only it is drilled
+    assert res.stats.queries_per_level[0] == 40
+    assert res.stats.queries_per_level[1] == len(COMMON_SYLLABLES["ㄱ"])
+    assert "제주 가 신상" in res.candidates and "제주 고 신상" in res.candidates
+    assert res.stats.pruned == 13 * 8 + 26 * 26
+
+
+class _SkewedProvider:
+    """Head terms lead to more head terms; the one long-tail branch keeps producing long tails."""
+
+    name = "skewed"
+    BASE_URL = "https://fake.example/ac"
+
+    def suggest(self, seed):
+        if seed == "제주":
+            return [f"제주{i}" for i in range(6)] + ["제주 여행 방법"]
+        if seed.startswith("제주 여행"):
+            return [f"{seed} {i} 후기" for i in range(3)]
+        return [f"{seed}{i}" for i in range(3)]
+
+
+def test_prioritized_crawl_spends_budget_on_productive_branch():
+    def top_opportunity(res):
+        return sum(s.opportunity for s in score_keywords(res.candidates, res.hit_counts)[:5])
+
+    bfs = crawl_suggestions(["제주"], [_SkewedProvider()], max_depth=4, budget=4, workers=1)
+    best = crawl_prioritized(["제주"], [_SkewedProvider()], max_depth=4, budget=4, batch=1, workers=1)
+    assert best.stats.requests == bfs.stats.requests == 4
+    assert best.stats.stop_reason == "budget"
+    assert top_opportunity(best) > top_opportunity(bfs)
+    assert "제주 여행 방법 0 후기 0 후기" in best.candidates
+
+
+def test_prioritized_crawl_respects_depth():
+    p = _TreeProvider()
+    res = crawl_prioritized(["x"], [p], max_depth=2, budget=100, batch=4, workers=1)
+    assert sorted(p.calls) == ["x", "xa", "xb"]
+    assert res.stats.stop_reason == "exhausted"
@@ -0,0 +1,53 @@
+from blog_keyword_analyzer.dedup import canonical_key, cluster_keywords, enrich_collapsed, particle_key
+from blog_keyword_analyzer.enrichers import EnrichedMetrics
+
+
+class _BlogTotals:
+    TOTALS = {"제주 2박3일": 1, "부산 맛집": 2}
+
+    def __init__(self):
+        self.calls = []
+
+    def blog_total(self, kw):
+        self.calls.append(kw)
+        return self.TOTALS[kw]
+
+
+def test_spacing_and_particle_variants_share_a_key():
+    assert canonical_key("제주 2박3일") == canonical_key("제주 2박 3일") == canonical_key("제주2박3일")
+    assert canonical_key("온라인 강의 추천") == canonical_key("온라인강의 추천") == canonical_key("온라인강의추천")
+    assert particle_key("제주에서 맛집") == particle_key("제주 맛집")
+    assert particle_key("가을 여행") != particle_key("가 여행")  # two-syllable words keep their ending
+    clusters = cluster_keywords(["제주에서 맛집", "온라인 강의 추천", "제주 맛집", "온라인강의 추천"])
+    assert clusters.members == {"제주에서 맛집": ["제주에서 맛집", "제주 맛집"], "온라인 강의 추천": ["온라인 강의 추천", "온라인강의 추천"]}
+
+
+def test_clusters_keep_distinct_modifiers_apart():
+    kws = ["제주 2박3일", "아이폰 15 가격", "제주 2박 3일", "아이폰 16 가격", "제주2박3일", "제주 여행 후기", "제주 여행 추천"]
+    clusters = cluster_keywords(kws, hit_counts={"제주 2박 3일": 3})
+    assert clusters.representatives == ["제주 2박 3일", "아이폰 15 가격", "아이폰 16 가격", "제주 여행 후기", "제주 여행 추천"]
+    assert clusters.members["제주 2박 3일"] == ["제주 2박3일", "제주 2박 3일", "제주2박3일"]
+    assert clusters.collapsed == 2
+    long_tail = "서울 강남역 근처 분위기 좋은 이탈리안 레스토랑 데이트 코스"
+    assert cluster_keywords([f"{long_tail} 추천", f"{long_tail} 후기"]).collapsed == 0
+
+
+def test_numbers_must_match_before_a_fuzzy_merge():
+    kws = ["서울 강남역 맛집 추천 리스트 2024", "서울 강남역 맛집 추천 리스트 2025", "갤럭시 S23 울트라 케이스 추천", "갤럭시 S24 울트라 케이스 추천"]
+    assert cluster_keywords(kws).representatives == kws
+
+
+def test_near_identical_keys_merge_by_ngram_similarity():
+    # "...순위" vs "...순위표": 10 shared bigrams out of 11
+    clusters = cluster_keywords(["블루투스 이어폰 추천 순위", "블루투스이어폰 추천순위 ", "블루투스 이어폰추천 순위표"])
+    assert clusters.representatives == ["블루투스 이어폰 추천 순위"]
+    exact_only = cluster_keywords(["블루투스 이어폰 추천 순위", "블루투스 이어폰추천 순위표"], threshold=1.01)
+    assert len(exact_only.representatives) == 2
+
+
+def test_enrich_collapsed_calls_once_per_cluster_and_fans_out():
+    enr = _BlogTotals()
+    metrics, clusters = enrich_collapsed(["제주 2박3일", "제주 2박 3일", "부산 맛집"], {"naver_openapi": enr})
+    assert sorted(enr.calls) == sorted(["제주 2박3일", "부산 맛집"])  # lookups run concurrently
+    assert metrics["제주 2박 3일"] == EnrichedMetrics(keyword="제주 2박 3일", naver_blog_total=1)
+    assert metrics["부산 맛집"].naver_blog_total == 2
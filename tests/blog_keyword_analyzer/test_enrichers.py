@@ -0,0 +1,79 @@
+import threading
+import time
+
+from blog_keyword_analyzer.enrichers import EnrichedMetrics, NaverAdsEnricher, enrich_keywords
+from blog_keyword_analyzer.http import CircuitBreaker, HttpClient, RateLimiter
+
+
+class _Resp:
+    status_code = 200
+    encoding = "utf-8"
+    content = b"{}"
+    headers: dict = {}
+    text = '{"keywordList": [{"relKeyword": "제주", "monthlyPcQcCnt": "1200", "monthlyMobileQcCnt": 5300}]}'
+
+    def raise_for_status(self) -> None:
+        pass
+
+
+def test_ads_enricher_signs_each_request_on_one_session():
+    http = HttpClient(rate_limiter=RateLimiter(), circuit_breaker=CircuitBreaker())
+    seen = []
+
+    def fake_get(url, params=None, headers=None, timeout=None):
+        seen.append(headers)
+        return _Resp()
+
+    http.session.get = fake_get  # type: ignore[assignment]
+    enr = NaverAdsEnricher("cid", "key", "secret", http=http)
+    assert enr.keyword_stats("제주") == (1200, 5300, None)
+    assert enr.keyword_stats("부산") == (1200, 5300, None)
+    assert enr.http is http
+    assert all(h["X-Customer"] == "cid" and h["X-Signature"] for h in seen)
+    assert len(seen) == 2
+
+
+class _SlowTotals:
+    BASE_URL = "https://openapi.example/v1/search/blog.json"
+
+    def __init__(self):
+        self.active = self.peak = 0
+        self.lock = threading.Lock()
+
+    def blog_total(self, kw):
+        with self.lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(0.02)
+        with self.lock:
+            self.active -= 1
+        return len(kw)
+
+
+def test_enrichment_runs_lookups_concurrently_in_keyword_order():
+    kws = [f"키워드 {'x' * i}" for i in range(12)]
+    enr = _SlowTotals()
+    out = enrich_keywords(kws, {"naver_openapi": enr}, workers=8)
+    assert list(out) == kws
+    assert out[kws[3]] == EnrichedMetrics(keyword=kws[3], naver_blog_total=len(kws[3]))
+    assert 1 < enr.peak <= 4  # per-host cap is workers // 2
+    # A second run (new event loop) works the same; workers=1 stays sequential
+    assert enrich_keywords(kws, {"naver_openapi": enr}, workers=8) == out
+    seq = _SlowTotals()
+    assert enrich_keywords(kws, {"naver_openapi": seq}, workers=1) == out and seq.peak == 1
+
+
+def test_concurrent_enrichment_opens_no_extra_client(monkeypatch):
+    import blog_keyword_analyzer.http as http_mod
+
+    built = []
+
+    class _CountingClient(HttpClient):
+        def __init__(self, *args, **kwargs):
+            built.append(kwargs)
+            super().__init__(*args, **kwargs)
+
+    monkeypatch.setattr(http_mod, "HttpClient", _CountingClient)
+    kws = [f"키워드 {i}" for i in range(6)]
+    assert len(enrich_keywords(kws, {"naver_openapi": _SlowTotals()}, workers=4)) == 6
+    assert built == []
@@ -1,4 +1,11 @@
-from blog_keyword_analyzer.expansion import expand_with_profile, expand_with_suffixes
+from itertools import islice
+
+from blog_keyword_analyzer.expansion import (
+    expand_with_profile,
+    expand_with_suffixes,
+    iter_expand_with_profile,
+)
+from blog_keyword_analyzer.gazetteer import DEFAULT_TEMPLATE_CAP, GAZETTEER, iter_fill, place_names
 
 
 def test_profile_travel_adds_variants():
@@ -14,3 +21,52 @@ def test_profile_food_adds_variants():
     assert any("맛집" in kw for kw in out)
     assert any("예약" in kw for kw in out)
 
+
+def test_lazy_expansion_streams_and_matches_list_api():
+    consumed = []
+
+    def seeds():
+        for s in ["제주", "제주", "부산"]:
+            consumed.append(s)
+            yield s
+
+    first = list(islice(iter_expand_with_profile(seeds(), "travel"), 3))
+    assert first == ["제주 여행", "제주 여행 코스", "제주 여행 일정"]
+    assert consumed == ["제주"]  # nothing past the first seed was read
+    assert list(iter_expand_with_profile(["제주", "제주", "부산"], "travel")) == expand_with_profile(
+        ["제주", "부산"], "travel"
+    )
+    # "a" + "b c" and "a b" + "c" normalize to the same query and are yielded once
+    assert expand_with_suffixes(["a", "a b"], ["b c", "c"]) == ["a b c", "a c", "a b b c"]
+
+
+def test_food_profile_fills_place_placeholders():
+    out = expand_with_profile(["부산"], "food")
+    assert not any("OO" in kw for kw in out)
+    assert "부산 서면역 맛집" in out
+    assert "부산 전포동 맛집" in out
+    assert "부산 성수동 맛집" not in out  # region named in the seed scopes the gazetteer
+
+
+def test_template_expansion_caps_and_dedups():
+    out = list(iter_fill("맛집", ["OO동 OO역 카페"], cap=50))
+    assert len(out) == len(set(out)) == 50
+    assert out[0] == "맛집 성수동 강남역 카페"
+    assert expand_with_suffixes(["맛집", "맛집"], ["OO동 OO역 카페"]) == list(
+        iter_fill("맛집", ["OO동 OO역 카페"], cap=DEFAULT_TEMPLATE_CAP)
+    )
+    big = list(iter_fill("카페", ["OO동 OO역"], cap=None))
+    assert len(big) == len(place_names("동", GAZETTEER)) * len(place_names("역", GAZETTEER))
+
+
+def test_gazetteer_dong_entries_are_not_eup_or_gun():
+    dong = place_names("동", GAZETTEER)
+    for fake in ("애월동", "한림동", "조천동", "구좌동", "기장동"):
+        assert fake not in dong
+
+
+def test_gazetteer_stations_are_real_and_unambiguous():
+    stations = place_names("역", GAZETTEER)
+    assert "정부청사역" in stations
+    # 둔산 is a 동, not a station; a bare 시청역 would mix 대전 into Seoul's results
+    assert "둔산역" not in stations and "시청역" not in stations
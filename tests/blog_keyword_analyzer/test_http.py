@@ -0,0 +1,268 @@
+import asyncio
+import json
+import math
+import threading
+import time
+
+import pytest
+import requests
+
+from blog_keyword_analyzer.http import (
+    BASE_URL_ENV,
+    AsyncHttpClient,
+    CircuitBreaker,
+    CircuitOpenError,
+    HttpClient,
+    RateLimiter,
+    SingleFlight,
+    json_loads,
+    parse_rate_limits,
+    parse_retry_after,
+)
+
+
+def test_async_client_respects_per_host_limit():
+    client = AsyncHttpClient(HttpClient(), max_concurrency=8, per_host_concurrency=2)
+    lock = threading.Lock()
+    active = {"now": 0, "peak": 0}
+
+    def work(i: int) -> int:
+        with lock:
+            active["now"] += 1
+            active["peak"] = max(active["peak"], active["now"])
+        time.sleep(0.02)
+        with lock:
+            active["now"] -= 1
+        return i
+
+    async def main():
+        return await asyncio.gather(*(client.run("https://a.example/x", work, i) for i in range(6)))
+
+    try:
+        assert asyncio.run(main()) == list(range(6))
+        # Semaphores are per event loop, so the client keeps working under a new loop
+        assert asyncio.run(main()) == list(range(6))
+    finally:
+        client.close()
+    assert active["peak"] == 2
+
+
+def test_rate_limiter_matches_subdomains_and_paces_after_burst():
+    limiter = RateLimiter({"googleapis.com": (20.0, 2)})
+    assert limiter.bucket_for("www.googleapis.com") is not None
+    assert limiter.bucket_for("example.com") is None
+    assert limiter.acquire("https://example.com/") is False
+
+    start = time.monotonic()
+    for _ in range(4):
+        assert limiter.acquire("https://www.googleapis.com/customsearch/v1") is True
+    # 2 burst tokens are free; the next 2 wait ~50ms each at 20 req/s
+    assert time.monotonic() - start >= 0.09
+
+
+def test_rules_follow_their_api_to_the_base_url(monkeypatch):
+    limiter = RateLimiter({"ac.search.naver.com": (10.0, 20), "googleapis.com": (5.0, 5)})
+    assert limiter.bucket_for("127.0.0.1", "/nx/ac") is None
+    monkeypatch.setenv(BASE_URL_ENV, "http://127.0.0.1:8123/mock")
+    naver = limiter.bucket_for("127.0.0.1", "/mock/nx/ac")
+    assert naver is limiter.bucket_for("ac.search.naver.com")
+    assert limiter.bucket_for("127.0.0.1", "/mock/customsearch/v1") is limiter.bucket_for("www.googleapis.com")
+    assert limiter.bucket_for("127.0.0.1", "/mock/other") is None
+    assert limiter.scope_of("http://127.0.0.1:8123/mock/nx/ac?q=a") == "ac.search.naver.com"
+    assert limiter.scope_of("http://127.0.0.1:8123/mock/other") == "127.0.0.1"
+
+    # Each API keeps its own breaker on the shared stand-in host
+    breaker = CircuitBreaker(failure_threshold=1, cooldown=60.0)
+    client, calls = _client_with(
+        [_StatusResponse(503), _StatusResponse(200, text="[]")], circuit_breaker=breaker, max_retries=0
+    )
+    client.rate_limiter = limiter
+    with pytest.raises(requests.HTTPError):
+        client.get_json("http://127.0.0.1:8123/mock/nx/ac")
+    assert client.get_json("http://127.0.0.1:8123/mock/customsearch/v1") == []
+
+
+def test_parse_rate_limits():
+    assert parse_rate_limits(["a.com=2.5:4", "b.com=3"]) == {"a.com": (2.5, 4), "b.com": (3.0, 3)}
+
+
+class _StatusResponse:
+    def __init__(self, status: int, headers=None, text: str = "{}") -> None:
+        self.status_code = status
+        self.encoding = "utf-8"
+        self.headers = headers or {}
+        self.text = text
+        self.content = text.encode("utf-8")
+
+    def raise_for_status(self) -> None:
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code}", response=self)
+
+
+def _client_with(responses, **kwargs):
+    calls = []
+    client = HttpClient(
+        rate_limiter=RateLimiter(), single_flight=SingleFlight(ttl=0), min_delay=0.0, max_delay=0.0, **kwargs
+    )
+
+    def fake_get(url, params=None, headers=None, timeout=None):
+        calls.append(url)
+        return responses.pop(0)
+
+    client.session.get = fake_get  # type: ignore[assignment]
+    return client, calls
+
+
+def test_retry_after_is_honored_then_succeeds():
+    client, calls = _client_with(
+        [_StatusResponse(429, {"Retry-After": "0"}), _StatusResponse(200, text='{"ok": 1}')],
+        circuit_breaker=CircuitBreaker(),
+    )
+    assert client.get_json("https://a.example/x") == {"ok": 1}
+    assert len(calls) == 2
+
+
+def test_client_errors_are_not_retried():
+    client, calls = _client_with([_StatusResponse(404)] * 3, circuit_breaker=CircuitBreaker())
+    with pytest.raises(requests.HTTPError):
+        client.get_json("https://a.example/x")
+    assert len(calls) == 1
+
+
+def test_circuit_opens_and_fails_fast():
+    breaker = CircuitBreaker(failure_threshold=2, cooldown=60.0)
+    client, calls = _client_with([_StatusResponse(503)] * 10, circuit_breaker=breaker, max_retries=5)
+    with pytest.raises(requests.HTTPError):
+        client.get_json("https://a.example/x")
+    assert len(calls) == 2
+    with pytest.raises(CircuitOpenError):
+        client.get_json("https://a.example/y")
+    assert len(calls) == 2
+
+
+def test_probe_interrupted_by_non_http_error_frees_the_host():
+    breaker = CircuitBreaker(failure_threshold=1, cooldown=0.0)
+    client, _ = _client_with(
+        [_StatusResponse(503), _StatusResponse(200, text="[1]")], circuit_breaker=breaker, max_retries=0
+    )
+    with pytest.raises(requests.HTTPError):
+        client.get_json("https://a.example/x")
+    assert breaker.is_open("a.example")
+
+    real_get = client.session.get
+
+    def interrupted(*args, **kwargs):
+        raise KeyboardInterrupt
+
+    client.session.get = interrupted  # type: ignore[assignment]
+    with pytest.raises(KeyboardInterrupt):
+        client.get_json("https://a.example/probe")
+    client.session.get = real_get  # type: ignore[assignment]
+    # The next call becomes the probe instead of failing fast forever
+    assert client.get_json("https://a.example/y") == [1]
+    assert not breaker.is_open("a.example")
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("3") == 3.0
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert parse_retry_after("soon") is None
+
+
+def test_single_flight_coalesces_concurrent_and_recent_calls():
+    flight = SingleFlight(ttl=60.0)
+    calls = []
+    gate = threading.Event()
+
+    def slow():
+        calls.append(1)
+        gate.wait(1.0)
+        return "body"
+
+    results: list = []
+    threads = [threading.Thread(target=lambda: results.append(flight.do("k", slow))) for _ in range(5)]
+    for t in threads:
+        t.start()
+    time.sleep(0.05)
+    gate.set()
+    for t in threads:
+        t.join()
+    assert results == ["body"] * 5
+    assert flight.do("k", slow) == "body"
+    assert len(calls) == 1
+
+
+def test_coalescing_is_per_client_and_per_headers():
+    def client(body, calls):
+        c = HttpClient(rate_limiter=RateLimiter(), circuit_breaker=CircuitBreaker())  # default SingleFlight
+
+        def fake_get(url, params=None, headers=None, timeout=None):
+            calls.append(url)
+            return _StatusResponse(200, text=body)
+
+        c.session.get = fake_get  # type: ignore[assignment]
+        return c
+
+    calls_a: list = []
+    calls_b: list = []
+    a, b = client('"a"', calls_a), client('"b"', calls_b)
+    assert a.get_json("https://a.example/x") == "a"
+    assert a.get_json("https://a.example/x") == "a"  # coalesced
+    assert b.get_json("https://a.example/x") == "b"  # another client never gets a's response
+    assert a.get_json("https://a.example/x", headers={"Authorization": "other"}) == "a"
+    assert (len(calls_a), len(calls_b)) == (2, 1)
+
+
+def test_json_loads_falls_back_for_inputs_orjson_rejects():
+    assert json_loads('{"items": ["제주"]}') == {"items": ["제주"]}
+    assert math.isnan(json_loads('{"ratio": NaN}')["ratio"])
+
+
+def test_metrics_track_retries_statuses_and_latency():
+    client, _ = _client_with(
+        [_StatusResponse(503), _StatusResponse(200, {"Content-Length": "9"}, '{"ok": 1}')],
+        circuit_breaker=CircuitBreaker(),
+    )
+    client.get_json("https://a.example/x?ignored=1")
+    snap = client.metrics.snapshot()["a.example/x"]
+    assert snap["requests"] == 2
+    assert snap["retries"] == 1
+    assert snap["status"] == {"200": 1, "503": 1}
+    assert snap["bytes_received"] == 9 + len("{}")
+    assert snap["latency_ms"]["max"] >= snap["latency_ms"]["p50"] >= 0
+    assert "a.example/x" in client.metrics.summary()
+
+
+def test_compressed_responses_are_decoded():
+    import gzip
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    body = json.dumps({"items": ["제주 여행"] * 200}, ensure_ascii=False).encode("utf-8")
+    packed = gzip.compress(body)
+    seen = {}
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):  # noqa: N802
+            seen["accept"] = self.headers.get("Accept-Encoding", "")
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Encoding", "gzip")
+            self.send_header("Content-Length", str(len(packed)))
+            self.end_headers()
+            self.wfile.write(packed)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        client = HttpClient(rate_limiter=RateLimiter(), circuit_breaker=CircuitBreaker())
+        url = f"http://127.0.0.1:{server.server_address[1]}/ac"
+        assert client.get_json(url) == {"items": ["제주 여행"] * 200}
+    finally:
+        server.shutdown()
+        server.server_close()
+    assert "gzip" in seen["accept"]
+    stats = client.metrics.snapshot()
+    assert next(iter(stats.values()))["bytes_received"] == len(packed) < len(body)
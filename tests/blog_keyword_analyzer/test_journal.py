@@ -0,0 +1,62 @@
+from blog_keyword_analyzer.enrichers import EnrichedMetrics, enrich_keywords
+from blog_keyword_analyzer.journal import Journal
+from blog_keyword_analyzer.providers import PROVIDER_REGISTRY, register_provider
+from blog_keyword_analyzer.scheduler import CollectStats, collect_suggestions
+
+
+class _FlakyProvider:
+    name = "flaky"
+    BASE_URL = "https://fake.example/ac"
+
+    def __init__(self, fail_on=None):
+        self.fail_on = fail_on
+        self.calls = []
+
+    def suggest(self, seed):
+        self.calls.append(seed)
+        if seed == self.fail_on:
+            raise ConnectionError("network blip")
+        return [f"{seed} 후기", "공통"]
+
+
+class _BlogTotals:
+    def __init__(self):
+        self.calls = []
+
+    def blog_total(self, kw):
+        self.calls.append(kw)
+        return None if kw == "실패" else 100
+
+
+def test_resume_skips_finished_queries_and_rebuilds_hits(tmp_path):
+    path = str(tmp_path / "ck.jsonl")
+    first = _FlakyProvider(fail_on="부산")
+    register_provider("flaky", lambda http, hl: first)
+    try:
+        stats = CollectStats()
+        collect_suggestions(["제주", "부산", "서울"], ["flaky"], journal=Journal(path), workers=1, stats=stats)
+        assert stats.failed == [("flaky", "부산")]
+        second = _FlakyProvider()
+        PROVIDER_REGISTRY["flaky"] = lambda http, hl: second
+        resumed = collect_suggestions(["제주", "부산", "서울"], ["flaky"], journal=Journal(path, resume=True), workers=1)
+        resumed_calls = list(second.calls)
+        clean = collect_suggestions(["제주", "부산", "서울"], ["flaky"], workers=1)
+    finally:
+        PROVIDER_REGISTRY.pop("flaky")
+    assert resumed_calls == ["부산"]  # only the failed query is retried
+    assert resumed == clean
+
+
+def test_enrichment_is_journaled_except_empty_results(tmp_path):
+    path = str(tmp_path / "ck.jsonl")
+    enr = _BlogTotals()
+    j = Journal(path)
+    enrich_keywords(["제주", "실패"], {"naver_openapi": enr}, journal=j)
+    j.close()
+    # a torn trailing line (crash mid-write) is ignored on resume
+    with open(path, "a", encoding="utf-8") as f:
+        f.write('{"t": "enrich", "k": "부')
+    enr.calls.clear()
+    out = enrich_keywords(["제주", "실패"], {"naver_openapi": enr}, journal=Journal(path, resume=True))
+    assert enr.calls == ["실패"]
+    assert out["제주"] == EnrichedMetrics(keyword="제주", naver_blog_total=100)
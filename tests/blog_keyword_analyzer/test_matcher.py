@@ -0,0 +1,26 @@
+from blog_keyword_analyzer.matcher import TermMatcher, compiled_matcher
+from blog_keyword_analyzer.scoring import modifier_terms
+from blog_keyword_analyzer.trends import compute_trends, default_hot_terms
+
+
+def test_matcher_finds_overlapping_and_nested_terms():
+    m = TermMatcher(["he", "she", "his", "hers", "she", ""])
+    assert m.terms == ["he", "she", "his", "hers"]
+    assert sorted(m.iter_matches("ushers")) == [(3, 0), (3, 1), (5, 3)]
+    assert m.matched_terms("ahishers") == ["he", "she", "his", "hers"]
+    assert not m.contains_any("xyz")
+    assert compiled_matcher(["a", "b"]) is compiled_matcher(("a", "b"))
+
+
+def test_compute_trends_matches_substring_scan():
+    curr = ["성수 핫플 루프탑 카페", "오션뷰 루프탑", "강남 오마카세 예약", "신상 카페", "루프탑바"]
+    terms = default_hot_terms()
+    expected = {t: sum(t in s for s in set(curr)) for t in terms}
+    delta = compute_trends(["신상 카페"], curr, terms)
+    assert dict(delta.hot_terms) == {t: n for t, n in expected.items() if n}
+    assert delta.hot_terms[0] == ("루프탑", 3)
+    assert delta.new_suggestions == sorted(set(curr) - {"신상 카페"})
+
+
+def test_modifier_terms_ignore_spacing():
+    assert modifier_terms("제주여행후기 가격비교") == ["가격", "비교", "후기"]
@@ -0,0 +1,68 @@
+import asyncio
+import random
+import time
+
+from blog_keyword_analyzer.http import AsyncHttpClient
+from blog_keyword_analyzer.providers import GoogleSuggestProvider, NaverSuggestProvider, bulk_suggest_async
+
+
+class _FakeHttp:
+    def get_json(self, url, params=None, headers=None):
+        time.sleep(random.uniform(0, 0.01))
+        q = params["q"]
+        return {"items": [[q, [f"{q} 후기", "공통 키워드", f"{q} 가격"]]]}
+
+
+def test_parallel_bulk_suggest_matches_sequential_order():
+    provider = NaverSuggestProvider(http=_FakeHttp())  # type: ignore[arg-type]
+    seeds = [f"시드{i}" for i in range(20)]
+    assert provider.bulk_suggest(seeds, workers=8) == provider.bulk_suggest(seeds, workers=1)
+    assert provider.bulk_suggest(seeds, workers=8)[:3] == ["시드0 후기", "공통 키워드", "시드0 가격"]
+
+
+def test_async_bulk_suggest_matches_sequential_for_both_providers():
+    class _GoogleHttp:
+        def get_json(self, url, params=None, headers=None):
+            time.sleep(random.uniform(0, 0.01))
+            return [params["q"], [f"{params['q']} 추천", "공통 키워드"]]
+
+    seeds = [f"시드{i}" for i in range(12)]
+    client = AsyncHttpClient(max_concurrency=8)
+    try:
+        providers = [NaverSuggestProvider(http=_FakeHttp()), GoogleSuggestProvider(http=_GoogleHttp())]  # type: ignore
+        for provider in providers:
+            got = asyncio.run(bulk_suggest_async(provider, seeds, client))
+            assert got == provider.bulk_suggest(seeds, workers=1)
+    finally:
+        client.close()
+
+
+def test_providers_on_a_shared_client_coalesce_back_to_back_duplicates():
+    import json
+
+    from blog_keyword_analyzer.http import HttpClient, RateLimiter
+
+    calls = []
+
+    class _Response:
+        status_code = 200
+        encoding = "utf-8"
+        headers: dict = {}
+        text = json.dumps({"items": [["제주", ["제주 여행"]]]})
+        content = text.encode("utf-8")
+
+        def raise_for_status(self):
+            pass
+
+    def fake_get(url, params=None, headers=None, timeout=None):
+        calls.append(params["q"])
+        return _Response()
+
+    http = HttpClient(rate_limiter=RateLimiter(), min_delay=0.0, max_delay=0.0)  # default SingleFlight
+    http.session.get = fake_get  # type: ignore[assignment]
+    # Collection and the trend panel each build their own provider around the session client
+    collected = NaverSuggestProvider(http=http).suggest("제주")
+    trending = NaverSuggestProvider(http=http).suggest("제주")
+    assert collected == trending == ["제주 여행"]
+    assert calls == ["제주"]
+    assert sum(ep["coalesced"] for ep in http.metrics.snapshot().values()) == 1
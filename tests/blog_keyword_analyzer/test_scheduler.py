@@ -0,0 +1,73 @@
+import pytest
+
+from blog_keyword_analyzer.providers import PROVIDER_REGISTRY, register_provider
+from blog_keyword_analyzer.scheduler import CollectStats, collect_suggestions
+
+
+class _FakeProvider:
+    BASE_URL = "https://fake.example/ac"
+
+    def __init__(self, name: str, tails):
+        self.name = name
+        self.tails = tails
+
+    def suggest(self, seed):
+        return [f"{seed} {t}" for t in self.tails] + ["공통"]
+
+
+@pytest.fixture
+def fake_providers():
+    register_provider("fake_a", lambda http, hl: _FakeProvider("fake_a", ["후기", "가격"]))
+    register_provider("fake_b", lambda http, hl: _FakeProvider("fake_b", ["가격", "추천"]))
+    yield
+    PROVIDER_REGISTRY.pop("fake_a")
+    PROVIDER_REGISTRY.pop("fake_b")
+
+
+def test_collect_suggestions_merges_providers_and_hits(fake_providers):
+    cands, hits = collect_suggestions(["제주", "부산"], ["fake_a", "fake_b"], depth=1, workers=4)
+    assert cands == ["제주 후기", "제주 가격", "공통", "부산 후기", "부산 가격", "제주 추천", "부산 추천"]
+    # "공통" appears once per provider result list; "제주 가격" comes from both providers
+    assert hits["공통"] == 2
+    assert hits["제주 가격"] == 2
+    assert hits["제주 후기"] == 1
+
+
+def test_collect_suggestions_depth2_is_deterministic(fake_providers):
+    runs = [collect_suggestions(["제주"], ["fake_b", "fake_a"], depth=2, workers=w) for w in (1, 8)]
+    assert runs[0] == runs[1]
+    assert runs[0][0][:2] == ["제주 후기", "제주 가격"]  # registry order, not argument order
+
+
+def test_saturated_suffix_queries_are_skipped(fake_providers):
+    stats = CollectStats()
+    cands, _ = collect_suggestions(["제주"], ["fake_a"], depth=2, saturation=1, stats=stats, workers=1)
+    # seed round already returned "제주 후기" and "제주 가격", but nothing extends them
+    assert stats.skipped == []
+    register_provider("fake_c", lambda http, hl: _FakeProvider("fake_c", ["후기 사진", "후기 블로그"]))
+    try:
+        stats = CollectStats()
+        collect_suggestions(["제주"], ["fake_c"], depth=2, saturation=2, stats=stats, workers=1)
+    finally:
+        PROVIDER_REGISTRY.pop("fake_c")
+    assert stats.skipped == ["제주 후기"]
+    assert stats.requests == 1 + 17
+
+
+class _FlakyProvider(_FakeProvider):
+    def suggest(self, seed):
+        if seed == "부산":
+            raise RuntimeError("HTTP 503 after retries")
+        return super().suggest(seed)
+
+
+def test_failed_query_is_counted_not_fatal(fake_providers):
+    register_provider("flaky", lambda http, hl: _FlakyProvider("flaky", ["맛집"]))
+    try:
+        stats = CollectStats()
+        cands, hits = collect_suggestions(["제주", "부산"], ["fake_a", "flaky"], depth=1, workers=4, stats=stats)
+    finally:
+        PROVIDER_REGISTRY.pop("flaky")
+    assert stats.failed == [("flaky", "부산")]
+    assert "부산 후기" in cands and "제주 맛집" in cands
+    assert hits["공통"] == 2 and hits["제주 맛집"] == 1
@@ -1,7 +1,17 @@
+import itertools
+import unicodedata
+
+import pytest
+
+from blog_keyword_analyzer import scoring
+from blog_keyword_analyzer.enrichers import EnrichedMetrics
 from blog_keyword_analyzer.scoring import (
     estimate_competition_score,
     estimate_demand_score,
+    extract_features,
     score_keywords,
+    score_keywords_by_platform,
+    score_keywords_with_metrics,
 )
 
 
@@ -23,3 +33,79 @@ def test_score_keywords_sorted():
     assert len(res) == 3
     # sorted by opportunity desc
     assert res == sorted(res, key=lambda r: (r.opportunity, r.demand), reverse=True)
+
+
+WORDS = ["제주", "여행", "가격", "후기", "방법", "추천", "할인", "쿠폰", "리뷰", "2박3일"]
+KEYWORDS = [" ".join(c) for n in range(1, 5) for c in itertools.permutations(WORDS, n)][:4000]
+KEYWORDS += ["  제주  후기 ", unicodedata.normalize("NFD", "제주 여행 가격"), " ".join(WORDS * 2)]
+
+
+def _reference(keywords, hit_counts):
+    """The per-keyword heuristics, rounded and ordered the way score_keywords promises."""
+    rows = []
+    for kw in keywords:
+        h = hit_counts.get(kw, 1)
+        d, c = estimate_demand_score(kw, provider_hits=h), estimate_competition_score(kw)
+        rows.append((round(max(d * 1.4 - c, 0.0), 3), round(d, 3), kw, round(c, 3), h))
+    rows.sort(key=lambda r: (r[0], r[1]), reverse=True)
+    return [(kw, d, c, o, h) for o, d, kw, c, h in rows]
+
+
+@pytest.mark.parametrize("vectorized", [True, False])
+def test_batch_scoring_matches_scalar_heuristics(monkeypatch, vectorized):
+    if vectorized:
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(scoring, "np", None)
+    hits = {kw: i % 7 for i, kw in enumerate(KEYWORDS) if i % 3}
+    got = [(r.keyword, r.demand, r.competition, r.opportunity, r.provider_hits) for r in score_keywords(KEYWORDS, hits)]
+    assert got == _reference(KEYWORDS, hits)
+
+    metrics = {"제주 후기": EnrichedMetrics("제주 후기", naver_blog_total=1200, naver_monthly_pc=300, naver_cpc=800.0)}
+    top = score_keywords_by_platform(["제주 여행", "제주 후기"], hits, metrics, platform="naver")
+    assert [r.keyword for r in top] == ["제주 후기", "제주 여행"]
+
+
+def test_round3_matches_builtin_round_at_ties():
+    np = pytest.importorskip("numpy")
+    values = np.array([0.0005, 0.0015, 1.0005, 2.675, 1.2345, 0.1235, 2.9995, 1.4 * 1.15 - 0.8])
+    assert scoring._round3(values).tolist() == [round(v, 3) for v in values.tolist()]
+
+
+@pytest.mark.parametrize("vectorized", [True, False])
+def test_shared_features_reused_across_platform_views(monkeypatch, vectorized):
+    if vectorized:
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(scoring, "np", None)
+    kws = KEYWORDS[:300]
+    hits = {kw: i % 4 for i, kw in enumerate(kws)}
+    metrics = {
+        kw: EnrichedMetrics(kw, naver_blog_total=50 * i, google_total=900 * i, naver_monthly_pc=10 * i)
+        for i, kw in enumerate(kws[::7])
+    }
+    expected = {pf: score_keywords_by_platform(kws, hits, metrics, platform=pf) for pf in ("naver", "tistory")}
+    expected["combined"] = score_keywords_with_metrics(kws, hits, metrics)
+    expected["baseline"] = score_keywords(kws, hits)
+
+    features = extract_features(kws, hits)
+    heuristics = list(features.demand), list(features.competition)
+    monkeypatch.setattr(scoring, "split_tokens", lambda q: pytest.fail("re-tokenized"))
+    for pf in ("naver", "tistory"):
+        assert score_keywords_by_platform(kws, hits, metrics, platform=pf, features=features) == expected[pf]
+    assert score_keywords_with_metrics(kws, hits, metrics, features=features) == expected["combined"]
+    assert score_keywords(kws, hits, features=features) == expected["baseline"]
+    # Metric adjustments work on copies, so the shared heuristics stay intact
+    assert (list(features.demand), list(features.competition)) == heuristics
+
+
+def test_features_from_another_keyword_list_are_rejected():
+    features = extract_features(["제주 여행", "부산 맛집"])
+    for other in (["제주 여행"], ["부산 맛집", "제주 여행"]):
+        with pytest.raises(ValueError):
+            score_keywords(other, features=features)
+        with pytest.raises(ValueError):
+            score_keywords_by_platform(other, None, {}, platform="tistory", features=features)
+    assert [r.keyword for r in score_keywords(iter(["제주 여행", "부산 맛집"]), features=features)] == [
+        r.keyword for r in score_keywords(["제주 여행", "부산 맛집"])
+    ]
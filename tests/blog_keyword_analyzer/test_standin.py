@@ -0,0 +1,62 @@
+import time
+
+import pytest
+
+from blog_keyword_analyzer.enrichers import GoogleCSEnricher, NaverAdsEnricher, NaverOpenApiEnricher
+from blog_keyword_analyzer.http import BASE_URL_ENV, CircuitBreaker, HttpClient, RateLimiter, SingleFlight
+from blog_keyword_analyzer.providers import GoogleSuggestProvider, NaverSuggestProvider
+from blog_keyword_analyzer.standin import StandInConfig, StandInServer, synthetic_suggestions
+
+
+def _client(**kwargs):
+    return HttpClient(
+        rate_limiter=RateLimiter(),
+        circuit_breaker=CircuitBreaker(),
+        single_flight=SingleFlight(ttl=0),
+        min_delay=0.0,
+        max_delay=0.0,
+        **kwargs,
+    )
+
+
+def test_providers_and_enrichers_against_standin():
+    with StandInServer() as server:
+        http = _client()
+        naver = NaverSuggestProvider(http=http, base_url=server.base_url)
+        google = GoogleSuggestProvider(http=http, base_url=server.base_url)
+        assert naver.BASE_URL == server.base_url + "/nx/ac"
+        assert naver.suggest("제주 여행") == synthetic_suggestions("제주 여행") == google.suggest("제주 여행")
+
+        assert NaverOpenApiEnricher("id", "secret", http=http, base_url=server.base_url).blog_total("제주") > 0
+        assert GoogleCSEnricher("key", "cx", http=http, base_url=server.base_url).total_results("제주") > 0
+        pc, mob, cpc = NaverAdsEnricher("c", "k", "s", http=http, base_url=server.base_url).keyword_stats("제주")
+        assert pc > 0 and mob > 0 and cpc > 0
+        assert server.hits["/keywordstool"] == 1
+
+
+def test_injected_errors_are_retried(monkeypatch):
+    config = StandInConfig(error_rate=1.0, error_statuses=(503,), retry_after=0)
+    with StandInServer(config=config) as server:
+        monkeypatch.setenv(BASE_URL_ENV, server.base_url)
+        http = _client(max_retries=2)
+        with pytest.raises(Exception):
+            NaverSuggestProvider(http=http).suggest("제주")
+        assert server.hits["/nx/ac"] == 3
+        snap = http.metrics.snapshot()
+        assert sum(s["retries"] for s in snap.values()) == 2
+
+
+def test_keep_alive_requests_take_about_the_configured_latency():
+    requests = pytest.importorskip("requests")
+    latency = 0.01
+    with StandInServer(config=StandInConfig(latency=latency)) as server, requests.Session() as session:
+        elapsed = []
+        for i in range(20):
+            # Wall time: resp.elapsed stops at the headers, but the stall delays the body
+            start = time.perf_counter()
+            resp = session.get(server.base_url + "/nx/ac", params={"q": f"제주 {i}"})
+            assert resp.json()["items"]
+            elapsed.append(time.perf_counter() - start)
+    elapsed.sort()
+    # A Nagle/delayed-ACK stall on the reused connection adds ~40ms per request
+    assert elapsed[len(elapsed) // 2] < latency + 0.02
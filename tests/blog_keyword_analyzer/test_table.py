@@ -0,0 +1,28 @@
+import pickle
+
+from blog_keyword_analyzer.scoring import score_keywords
+from blog_keyword_analyzer.table import KeywordTable
+
+
+def test_table_interns_and_counts_by_id():
+    t = KeywordTable()
+    first = " ".join(["제주", "여행"])
+    dup = " ".join(["제주", "여행"])
+    assert first is not dup
+    kid = t.add(first)
+    assert t.add(dup) == kid
+    assert t[kid] is first  # only the first copy is kept
+    t.add("부산", hits=3)
+    assert t.keywords == ["제주 여행", "부산"]
+    assert list(t.hits) == [2, 3]
+
+
+def test_hit_counts_view_behaves_like_a_dict():
+    t = KeywordTable(["a", "b", "a"])
+    hits = t.hit_counts
+    assert hits == {"a": 2, "b": 1}
+    assert hits.get("c", 1) == 1 and "c" not in hits
+    hits["c"] = hits.get("c", 0) + 4
+    assert t.keywords == ["a", "b", "c"] and hits["c"] == 4
+    assert pickle.loads(pickle.dumps(hits)) == hits
+    assert score_keywords(t.keywords, hits) == score_keywords(t.keywords, dict(hits))
@@ -1,4 +1,7 @@
+import unicodedata
+
 from blog_keyword_analyzer.text_utils import (
+    normalize_many,
     normalize_query,
     tokenize,
     unique_ordered,
@@ -16,3 +19,17 @@ def test_normalize_and_tokenize():
 def test_unique_ordered():
     items = ["a", "b", "a", "c", "b"]
     assert unique_ordered(items) == ["a", "b", "c"]
+
+
+def test_nfc_makes_decomposed_hangul_dedup():
+    decomposed = unicodedata.normalize("NFD", "제주 여행")
+    assert decomposed != "제주 여행"
+    assert normalize_many([decomposed, " 제주  여행", "\u3000", "제주 여행"]) == ["제주 여행"] * 3
+    assert unique_ordered(normalize_many([decomposed, "제주 여행"])) == ["제주 여행"]
+
+
+def test_tokenize_returns_fresh_lists():
+    toks = tokenize("제주 여행")
+    toks.append("x")
+    assert tokenize("제주 여행") == ["제주", "여행"]
+    assert tokenize("   ") == []
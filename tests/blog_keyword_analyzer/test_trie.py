@@ -0,0 +1,13 @@
+from blog_keyword_analyzer.trie import PrefixTrie
+
+
+def test_prefix_counts_and_saturation():
+    trie = PrefixTrie(["제주 여행", "제주 여행 코스", "제주 여행 후기", "제주 맛집"])
+    assert trie.add("제주 맛집") is False
+    assert len(trie) == 4
+    assert trie.count_prefix("제주 ") == 4
+    assert trie.count_prefix("제주 여행") == 2  # the query itself doesn't count
+    assert trie.count_prefix("부산") == 0
+    assert trie.is_saturated("제주 여행", 2)
+    assert not trie.is_saturated("제주 여행", 3)
+    assert not trie.is_saturated("제주 여행", 0)
@@ -1,38 +1,65 @@
 from __future__ import annotations
 
-import re
-from typing import Iterable, List, Set
+import unicodedata
+from functools import lru_cache
+from typing import Iterable, Iterator, List, Set, Tuple
 
 
-_WS_RE = re.compile(r"\s+")
-_PUNCT_RE = re.compile(r"[\t\r\n\v\f]+")
+# Bound for the memoized normalizer/tokenizer; large runs see the same strings many times
+NORMALIZE_CACHE_SIZE = 1 << 16
 
 
+@lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
 def normalize_query(q: str) -> str:
     """Normalize a query for de-duplication and display.
 
-    - Trim and collapse whitespace
-    - Strip control characters
+    - Unicode NFC (decomposed Hangul jamo from some sources compose to syllables)
+    - Trim and collapse whitespace, control characters included
     - Keep Korean letters as-is; do not lowercase (not meaningful for ko)
+    Memoized (bounded LRU), so repeated calls on the same string are lookups.
     """
-    q = q.strip()
-    q = _PUNCT_RE.sub(" ", q)
-    q = _WS_RE.sub(" ", q)
-    return q
+    if not unicodedata.is_normalized("NFC", q):
+        q = unicodedata.normalize("NFC", q)
+    return " ".join(q.split())
+
+
+def normalize_many(items: Iterable[str]) -> List[str]:
+    """`normalize_query` over a batch, dropping items that normalize to empty."""
+    out: List[str] = []
+    for it in items:
+        n = normalize_query(it)
+        if n:
+            out.append(n)
+    return out
+
+
+@lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
+def _tokens(q: str) -> Tuple[str, ...]:
+    n = normalize_query(q)
+    return tuple(n.split(" ")) if n else ()
 
 
 def tokenize(q: str) -> List[str]:
     """Very simple whitespace tokenizer for Korean/English mixed text."""
-    q = normalize_query(q)
-    return [tok for tok in q.split(" ") if tok]
+    return list(_tokens(q))
 
 
-def unique_ordered(items: Iterable[str]) -> List[str]:
+def split_tokens(q: str) -> List[str]:
+    """`tokenize` without the memo cache, for one pass over many distinct strings."""
+    if not unicodedata.is_normalized("NFC", q):
+        q = unicodedata.normalize("NFC", q)
+    return q.split()
+
+
+def iter_unique(items: Iterable[str]) -> Iterator[str]:
+    """Yield first occurrences lazily; only the set of seen items is kept."""
     seen: Set[str] = set()
-    out: List[str] = []
     for it in items:
         if it not in seen:
             seen.add(it)
-            out.append(it)
-    return out
+            yield it
+
+
+def unique_ordered(items: Iterable[str]) -> List[str]:
+    return list(iter_unique(items))
 
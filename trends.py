@@ -3,6 +3,8 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Dict, Iterable, List, Set, Tuple
 
+from .matcher import compiled_matcher
+
 
 def default_hot_terms() -> List[str]:
     return [
@@ -42,12 +44,9 @@ def compute_trends(prev: Iterable[str], curr: Iterable[str], hot_terms: List[str
     curr_set: Set[str] = set(curr)
     new_items = sorted(curr_set - prev_set)
     dropped = sorted(prev_set - curr_set)
-    terms = hot_terms or default_hot_terms()
-    counts: Dict[str, int] = {t: 0 for t in terms}
-    for s in curr_set:
-        for t in terms:
-            if t in s:
-                counts[t] += 1
+    # One automaton pass per suggestion instead of a substring scan per term
+    matcher = compiled_matcher(hot_terms or default_hot_terms())
+    counts: Dict[str, int] = dict(zip(matcher.terms, matcher.document_counts(curr_set)))
     hot_sorted = sorted([(k, v) for k, v in counts.items() if v > 0], key=lambda x: x[1], reverse=True)
     return TrendDelta(new_suggestions=new_items, dropped_suggestions=dropped, hot_terms=hot_sorted)
 
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+from typing import Dict, Iterable
+
+
+class _Node:
+    __slots__ = ("children", "count", "terminal")
+
+    def __init__(self) -> None:
+        self.children: Dict[str, _Node] = {}
+        self.count = 0  # strings stored at or below this node
+        self.terminal = False
+
+
+class PrefixTrie:
+    """Character trie of observed suggestions with per-node subtree counts.
+
+    `count_prefix(q)` answers "how many distinct suggestions start with q" in
+    O(len(q)), which is what the crawler uses to judge saturation.
+    """
+
+    def __init__(self, items: Iterable[str] = ()) -> None:
+        self._root = _Node()
+        self._size = 0
+        for it in items:
+            self.add(it)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __contains__(self, item: str) -> bool:
+        node = self._find(item)
+        return node is not None and node.terminal
+
+    def add(self, item: str) -> bool:
+        """Insert `item`; returns False if it was already present."""
+        if item in self:
+            return False
+        node = self._root
+        node.count += 1
+        for ch in item:
+            nxt = node.children.get(ch)
+            if nxt is None:
+                nxt = node.children[ch] = _Node()
+            nxt.count += 1
+            node = nxt
+        node.terminal = True
+        self._size += 1
+        return True
+
+    def _find(self, prefix: str) -> "_Node | None":
+        node = self._root
+        for ch in prefix:
+            node = node.children.get(ch)
+            if node is None:
+                return None
+        return node
+
+    def count_prefix(self, prefix: str) -> int:
+        """Number of stored strings that start with `prefix` (excluding `prefix` itself)."""
+        node = self._find(prefix)
+        if node is None:
+            return 0
+        return node.count - (1 if node.terminal else 0)
+
+    def is_saturated(self, query: str, threshold: int) -> bool:
+        """True when at least `threshold` known suggestions already extend `query`.
+
+        Autocomplete returns about ten completions per query, so once that many
+        are known for a prefix, asking it again rarely adds anything.
+        """
+        return threshold > 0 and self.count_prefix(query) >= threshold